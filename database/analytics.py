@@ -0,0 +1,175 @@
+"""
+Columnar analytics for Restaurant Shift Management System
+
+AnalyticsFrames reads the employees and shift assignments tables into pandas
+DataFrames with read_sql in chunks, giving each chunk compact dtypes and
+categoricals for Position and EmploymentStatus before it is concatenated.
+Frames are shared through the report cache, so every report works on the same
+frame until the data it was read from changes. The report functions below are
+vectorized operations on these frames and return plain rows for the UI.
+Excel exports stream from the database cursor instead (see excel_export).
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from database.db_manager import DatabaseManager
+from models.employee import Position, EmploymentStatus
+
+POSITION_DTYPE = pd.CategoricalDtype([position.value for position in Position])
+STATUS_DTYPE = pd.CategoricalDtype([status.value for status in EmploymentStatus])
+
+EMPLOYEE_DTYPES = {
+    "id": "int64",
+    "status": STATUS_DTYPE,
+    "primary_position": POSITION_DTYPE,
+    "hourly_wage": "float64",
+    "min_hours_per_week": "float32",
+    "max_hours_per_week": "float32",
+    "attendance_rate": "float32",
+    "punctuality_score": "float32",
+    "customer_rating": "float32",
+}
+
+ASSIGNMENT_DTYPES = {
+    "shift_id": "int64",
+    "template_id": "Int64",
+    "location_id": "Int64",
+    "employee_id": "int64",
+    "position": POSITION_DTYPE,
+    "start_minute": "int16",
+    "end_minute": "int16",
+    "hourly_wage": "float64",
+}
+
+DEFAULT_CHUNKSIZE = 50_000
+
+class AnalyticsFrames:
+    """Shared employee and assignment DataFrames read straight from SQLite"""
+
+    def __init__(self, db_manager: DatabaseManager, chunksize: int = DEFAULT_CHUNKSIZE):
+        self.db_manager = db_manager
+        self.chunksize = chunksize
+
+    def _read_frame(self, query: str, params: List[Any], dtypes: Dict[str, Any],
+                    date_columns: List[str]) -> pd.DataFrame:
+        """Run a query with read_sql in chunks, typing each chunk as it arrives"""
+        chunks = []
+        with self.db_manager.get_connection() as conn:
+            for chunk in pd.read_sql(query, conn, params=params, chunksize=self.chunksize):
+                for column in date_columns:
+                    chunk[column] = pd.to_datetime(chunk[column])
+                chunks.append(chunk.astype(dtypes))
+        if not chunks:
+            empty = pd.DataFrame(columns=list(dtypes) + date_columns)
+            return empty.astype({**dtypes, **{column: "datetime64[ns]" for column in date_columns}})
+        # Matching categorical dtypes keep categoricals through the concat
+        return pd.concat(chunks, ignore_index=True)
+
+    def employees(self) -> pd.DataFrame:
+        """Every employee, one row each, plus full_name and weekly_labor_cost columns
+
+        The frame is shared; copy it before modifying.
+        """
+        return self.db_manager.report_cache.get_or_compute(
+            "employees_frame", None, ("employees",), self._load_employees)
+
+    def _load_employees(self) -> pd.DataFrame:
+        frame = self._read_frame("""
+            SELECT id, employee_number, first_name, last_name, hire_date, status, hourly_wage,
+                   primary_position, max_hours_per_week, min_hours_per_week,
+                   attendance_rate, punctuality_score, customer_rating
+            FROM employees ORDER BY id
+        """, [], EMPLOYEE_DTYPES, ["hire_date"])
+        frame["full_name"] = frame["first_name"] + " " + frame["last_name"]
+        # Same estimate as Employee.weekly_labor_cost
+        frame["weekly_labor_cost"] = (frame["min_hours_per_week"].fillna(0).astype("float64") +
+                                      frame["max_hours_per_week"].fillna(0).astype("float64")) / 2.0 * frame["hourly_wage"]
+        return frame
+
+    def assignments(self, start_date: date, end_date: date,
+                    location_id: Optional[int] = None) -> pd.DataFrame:
+        """Assignments between two dates with shift date, hours and the employee's wage
+
+        The frame is shared; copy it before modifying.
+        """
+        return self.db_manager.report_cache.get_or_compute(
+            "assignments_frame", (start_date, end_date, location_id), ("shifts", "employees"),
+            lambda: self._load_assignments(start_date, end_date, location_id))
+
+    def _load_assignments(self, start_date: date, end_date: date, location_id: Optional[int]) -> pd.DataFrame:
+        conditions = "s.date BETWEEN ? AND ?"
+        params: List[Any] = [start_date.isoformat(), end_date.isoformat()]
+        if location_id is not None:
+            conditions += " AND s.location_id = ?"
+            params.append(location_id)
+
+        frame = self._read_frame(f"""
+            SELECT a.shift_id, s.template_id, s.location_id, s.date, a.employee_id, a.position,
+                   CAST(substr(a.start_time, 1, 2) AS INTEGER) * 60 + CAST(substr(a.start_time, 4, 2) AS INTEGER) AS start_minute,
+                   CAST(substr(a.end_time, 1, 2) AS INTEGER) * 60 + CAST(substr(a.end_time, 4, 2) AS INTEGER) AS end_minute,
+                   COALESCE(e.hourly_wage, 0) AS hourly_wage
+            FROM shift_assignments a
+            JOIN shifts s ON s.id = a.shift_id
+            LEFT JOIN employees e ON e.id = a.employee_id
+            WHERE {conditions}
+            ORDER BY s.date, a.start_time, a.id
+        """, params, ASSIGNMENT_DTYPES, ["date"])
+        minutes = frame["end_minute"].astype("int32") - frame["start_minute"].astype("int32")
+        # Overnight assignments end on the next day
+        frame["hours"] = np.where(minutes <= 0, minutes + 24 * 60, minutes) / 60.0
+        # Straight-time cost; overtime premiums are in the labor rollups
+        frame["base_cost"] = frame["hours"] * frame["hourly_wage"]
+        return frame
+
+def with_status(employees: pd.DataFrame, status: Optional[EmploymentStatus]) -> pd.DataFrame:
+    """Employees with the given status (all when None)"""
+    if status is None:
+        return employees
+    return employees[employees["status"] == status.value]
+
+def employee_summary(employees: pd.DataFrame, excellent_attendance: float = 95.0,
+                     poor_attendance: float = 85.0) -> Dict[str, float]:
+    """Roster totals and averages, with the keys of DatabaseManager.get_employee_summary"""
+    def mean(column: str) -> float:
+        value = employees[column].mean()
+        return 0.0 if pd.isna(value) else float(value)
+
+    return {
+        "employee_count": len(employees),
+        "total_max_hours": float(employees["max_hours_per_week"].sum()),
+        "weekly_labor_cost": float(employees["weekly_labor_cost"].sum()),
+        "average_wage": mean("hourly_wage"),
+        "average_attendance": mean("attendance_rate"),
+        "average_punctuality": mean("punctuality_score"),
+        "average_rating": mean("customer_rating"),
+        "excellent_attendance_count": int((employees["attendance_rate"] >= excellent_attendance).sum()),
+        "poor_attendance_count": int((employees["attendance_rate"] < poor_attendance).sum()),
+    }
+
+def position_breakdown(employees: pd.DataFrame) -> List[Dict[str, Any]]:
+    """employee_count, total_max_hours and weekly_labor_cost per primary_position with staff,
+    largest first"""
+    grouped = employees.groupby("primary_position", observed=True).agg(
+        employee_count=("id", "size"), total_max_hours=("max_hours_per_week", "sum"),
+        weekly_labor_cost=("weekly_labor_cost", "sum"))
+    grouped = grouped.reset_index().astype({"primary_position": "str", "total_max_hours": "float64"})
+    grouped = grouped.sort_values(["employee_count", "primary_position"], ascending=[False, True])
+    return grouped.to_dict("records")
+
+def performance_records(employees: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Name, position and scores per employee, missing scores shown as 0"""
+    columns = ["id", "full_name", "primary_position", "attendance_rate", "punctuality_score", "customer_rating"]
+    records = employees[columns].astype({"primary_position": "str", "attendance_rate": "float64",
+                                         "punctuality_score": "float64", "customer_rating": "float64"})
+    return records.fillna({"attendance_rate": 0.0, "punctuality_score": 0.0, "customer_rating": 0.0}).to_dict("records")
+
+def labor_by_position(assignments: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+    """Scheduled hours, straight-time cost, assignments and distinct staff per position"""
+    grouped = assignments.groupby("position", observed=True).agg(
+        hours=("hours", "sum"), base_cost=("base_cost", "sum"),
+        assignment_count=("shift_id", "size"), headcount=("employee_id", "nunique"))
+    return {str(position): row for position, row in grouped.to_dict("index").items()}
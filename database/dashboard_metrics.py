@@ -0,0 +1,148 @@
+"""
+Live dashboard metrics for Restaurant Shift Management System
+
+DashboardMetrics seeds running aggregates with a few aggregate queries, then
+follows DatabaseManager change events: an employee change subtracts the
+employee's old values and adds the new ones, and an assignment change adds
+the labor delta of the week it touched. Every change is O(1), however large
+the roster or the shift history.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Any
+
+from database.db_manager import DatabaseManager, DataChange
+from models.employee import EmploymentStatus
+
+@dataclass
+class MetricsSnapshot:
+    employee_count: int = 0
+    active_count: int = 0
+    wage_sum: float = 0.0
+    estimated_cost_sum: float = 0.0  # Employee.weekly_labor_cost of active staff
+    attendance_sum: float = 0.0
+    punctuality_sum: float = 0.0
+    max_hours_sum: float = 0.0
+    position_counts: Dict[str, int] = field(default_factory=dict)
+    week_start: Optional[date] = None
+    scheduled_hours: float = 0.0
+    scheduled_overtime_hours: float = 0.0
+    scheduled_cost: float = 0.0
+    assignment_count: int = 0
+
+    @property
+    def average_wage(self) -> float:
+        return self.wage_sum / self.active_count if self.active_count else 0.0
+
+    @property
+    def average_attendance(self) -> float:
+        return self.attendance_sum / self.active_count if self.active_count else 0.0
+
+    @property
+    def average_punctuality(self) -> float:
+        return self.punctuality_sum / self.active_count if self.active_count else 0.0
+
+class DashboardMetrics:
+    """Running employee and labor aggregates kept current from change events"""
+
+    def __init__(self, db_manager: DatabaseManager, week_start: Optional[date] = None):
+        self.db_manager = db_manager
+        today = date.today()
+        self.week_start = week_start or today - timedelta(days=today.weekday())
+        self._lock = threading.Lock()
+        self._subscribers: List[Callable[[MetricsSnapshot], None]] = []
+        self._metrics = MetricsSnapshot(week_start=self.week_start)
+        self.load()
+        db_manager.add_change_listener(self.on_change)
+
+    def close(self):
+        """Stop following database changes"""
+        self.db_manager.remove_change_listener(self.on_change)
+        self._subscribers.clear()
+
+    def subscribe(self, callback: Callable[[MetricsSnapshot], None]):
+        """Call callback with a snapshot after every change (on the writing thread)"""
+        self._subscribers.append(callback)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Copy of the current aggregates"""
+        with self._lock:
+            metrics = self._metrics
+            return MetricsSnapshot(**{**metrics.__dict__, "position_counts": dict(metrics.position_counts)})
+
+    def load(self):
+        """Seed all aggregates from the database"""
+        active = self.db_manager.get_employee_summary(EmploymentStatus.ACTIVE)
+        everyone = self.db_manager.get_employee_summary(None)
+        positions = self.db_manager.get_position_summary(EmploymentStatus.ACTIVE)
+        count = int(active['employee_count'])
+        with self._lock:
+            metrics = self._metrics
+            metrics.employee_count = int(everyone['employee_count'])
+            metrics.active_count = count
+            metrics.wage_sum = active['average_wage'] * count
+            metrics.estimated_cost_sum = active['weekly_labor_cost']
+            metrics.attendance_sum = active['average_attendance'] * count
+            metrics.punctuality_sum = active['average_punctuality'] * count
+            metrics.max_hours_sum = active['total_max_hours']
+            metrics.position_counts = {row['primary_position']: row['employee_count'] for row in positions}
+        self.load_week(self.week_start)
+
+    def load_week(self, week_start: date):
+        """Seed the scheduled labor totals of a week from the rollup tables"""
+        rows = self.db_manager.get_labor_rollup(week_start, week_start, "week")
+        with self._lock:
+            self.week_start = week_start
+            metrics = self._metrics
+            metrics.week_start = week_start
+            metrics.scheduled_hours = sum(row['hours'] for row in rows)
+            metrics.scheduled_overtime_hours = sum(row['overtime_hours'] for row in rows)
+            metrics.scheduled_cost = sum(row['labor_cost'] for row in rows)
+            metrics.assignment_count = int(sum(row['assignment_count'] for row in rows))
+
+    def _apply_employee(self, values: Optional[Dict[str, Any]], sign: int):
+        """Add (sign 1) or remove (sign -1) one employee's contribution"""
+        if not values or values['status'] != EmploymentStatus.ACTIVE.value:
+            return
+        metrics = self._metrics
+        wage = values['hourly_wage'] or 0.0
+        metrics.active_count += sign
+        metrics.wage_sum += sign * wage
+        metrics.estimated_cost_sum += sign * ((values['min_hours_per_week'] or 0) +
+                                              (values['max_hours_per_week'] or 0)) / 2.0 * wage
+        metrics.attendance_sum += sign * (values['attendance_rate'] or 0.0)
+        metrics.punctuality_sum += sign * (values['punctuality_score'] or 0.0)
+        metrics.max_hours_sum += sign * (values['max_hours_per_week'] or 0)
+        position = values['primary_position']
+        metrics.position_counts[position] = metrics.position_counts.get(position, 0) + sign
+        if not metrics.position_counts[position]:
+            del metrics.position_counts[position]
+
+    def on_change(self, change: DataChange):
+        """Apply one DatabaseManager change event"""
+        if change.scope == "shifts" and change.kind == "rebuilt":
+            self.load_week(self.week_start)
+        elif change.scope == "employees" and change.kind == "rebuilt":
+            self.load()
+        else:
+            with self._lock:
+                metrics = self._metrics
+                if change.scope == "employees":
+                    self._apply_employee(change.before, -1)
+                    self._apply_employee(change.after, 1)
+                    if change.kind == "added":
+                        metrics.employee_count += 1
+                elif change.scope == "shifts" and change.key[0] == self.week_start.isoformat():
+                    metrics.scheduled_hours += change.after['hours']
+                    metrics.scheduled_overtime_hours += change.after['overtime_hours']
+                    metrics.scheduled_cost += change.after['labor_cost']
+                    metrics.assignment_count += int(change.after['assignment_count'])
+                else:
+                    return
+
+        if self._subscribers:
+            snapshot = self.snapshot()
+            for callback in list(self._subscribers):
+                callback(snapshot)
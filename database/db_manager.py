@@ -6,8 +6,10 @@ This module provides database operations for managing employees, shifts, and sch
 
 import sqlite3
 import json
-from datetime import datetime, date, time
-from typing import List, Optional, Dict, Any
+import threading
+from dataclasses import dataclass
+from datetime import datetime, date, time, timedelta
+from typing import List, Optional, Dict, Any, Tuple, Iterable, Iterator, Callable, Sequence
 from pathlib import Path
 import logging
 from contextlib import contextmanager
@@ -17,13 +19,40 @@ import sys
 sys.path.append('..')
 from models.employee import Employee, Position, EmploymentStatus, SkillLevel, Availability
 from models.shift import (Shift, ShiftTemplate, ShiftAssignment, WeeklySchedule, 
-                         ShiftType, ShiftPriority, PositionRequirement, WeekDay)
+                         ShiftType, ShiftPriority, PositionRequirement, WeekDay, OvertimeRules)
+from database.report_cache import ReportCache
+
+# Change counter scopes bumped by writes; reports name the ones they read
+DATA_SCOPES = ("employees", "templates", "shifts", "settings")
+
+# Employee columns carried by employee DataChange events
+EMPLOYEE_METRIC_COLUMNS = ("status", "primary_position", "hourly_wage", "min_hours_per_week",
+                           "max_hours_per_week", "attendance_rate", "punctuality_score", "customer_rating")
+
+@dataclass
+class DataChange:
+    """A committed write, sent to DatabaseManager change listeners
+
+    Employee changes (key: employee id) carry EMPLOYEE_METRIC_COLUMNS values
+    before and after. Shift changes (key: (week_start, location_id, position))
+    carry the labor totals delta as after: hours, overtime_hours, labor_cost
+    and assignment_count. kind "rebuilt" means totals were recomputed or rows
+    were imported wholesale; listeners should reload that scope.
+    """
+    scope: str
+    kind: str  # "added", "updated", "rebuilt"
+    key: Any = None
+    before: Optional[Dict[str, Any]] = None
+    after: Optional[Dict[str, Any]] = None
 
 class DatabaseManager:
     def __init__(self, db_path: str = "shifts.db"):
         self.db_path = db_path
         self.setup_logging()
         self.create_tables()
+        self.report_cache = ReportCache(self.get_data_version)
+        self._change_listeners: List[Callable[[DataChange], None]] = []
+        self._listener_lock = threading.Lock()
     
     def setup_logging(self):
         """Setup logging for database operations"""
@@ -36,7 +65,8 @@ class DatabaseManager:
     @contextmanager
     def get_connection(self):
         """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path)
+        # Generous timeout so batch workers sharing a database file wait for locks
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
         conn.row_factory = sqlite3.Row  # Enable column access by name
         try:
             yield conn
@@ -52,6 +82,9 @@ class DatabaseManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
+            # WAL lets several processes read while one writes
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
             # Employees table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS employees (
@@ -96,11 +129,23 @@ class DatabaseManager:
                 )
             """)
             
+            # cannot_work_with entries, one row per listed pair; read back symmetrically
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS employee_conflicts (
+                    employee_id INTEGER NOT NULL,
+                    other_employee_id INTEGER NOT NULL,
+                    PRIMARY KEY (employee_id, other_employee_id),
+                    FOREIGN KEY (employee_id) REFERENCES employees (id),
+                    FOREIGN KEY (other_employee_id) REFERENCES employees (id)
+                )
+            """)
+            
             # Shift templates table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS shift_templates (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     name TEXT NOT NULL,
+                    location_id INTEGER,
                     shift_type TEXT NOT NULL,
                     start_time TEXT NOT NULL,
                     end_time TEXT NOT NULL,
@@ -138,6 +183,7 @@ class DatabaseManager:
                 CREATE TABLE IF NOT EXISTS shifts (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     template_id INTEGER,
+                    location_id INTEGER,
                     date TEXT NOT NULL,
                     start_time TEXT NOT NULL,
                     end_time TEXT NOT NULL,
@@ -209,9 +255,159 @@ class DatabaseManager:
                 )
             """)
             
+            # Monotonic change counter per data scope, see _bump_data_version
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS data_versions (
+                    scope TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL
+                )
+            """)
+            
+            # Labor rollups per day and per week (Monday start) x location x position,
+            # kept current by the shift write path; see _labor_rollup_delta
+            for table, period_column in (("labor_daily_rollup", "date"), ("labor_weekly_rollup", "week_start")):
+                cursor.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        {period_column} TEXT NOT NULL,
+                        location_id INTEGER,
+                        position TEXT NOT NULL,
+                        hours REAL NOT NULL DEFAULT 0,
+                        regular_hours REAL NOT NULL DEFAULT 0,
+                        overtime_hours REAL NOT NULL DEFAULT 0,
+                        labor_cost REAL NOT NULL DEFAULT 0,
+                        headcount INTEGER NOT NULL DEFAULT 0,
+                        assignment_count INTEGER NOT NULL DEFAULT 0
+                    )
+                """)
+                self._ensure_rollup_key(cursor, table, period_column)
+            
+            # Columns added after the first release
+            self.ensure_column(cursor, "shift_templates", "location_id", "INTEGER")
+            self.ensure_column(cursor, "shifts", "location_id", "INTEGER")
+            
+            # Indexes for date range and per-shift lookups
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_shifts_date ON shifts (date, location_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_shifts_template_date ON shifts (template_id, date)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_assignments_shift ON shift_assignments (shift_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_assignments_employee ON shift_assignments (employee_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_conflicts_other ON employee_conflicts (other_employee_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_employees_status ON employees (status, primary_position)")
+            
+            self._backfill_employee_conflicts(cursor)
+            
             conn.commit()
             self.logger.info("Database tables created successfully")
     
+    def ensure_column(self, cursor: sqlite3.Cursor, table: str, column: str, definition: str):
+        """Add column to an existing table if an older database is missing it"""
+        cursor.execute(f"PRAGMA table_info({table})")
+        existing_columns = {row['name'] for row in cursor.fetchall()}
+        if column not in existing_columns:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+            self.logger.info(f"Added column {table}.{column}")
+    
+    def _ensure_rollup_key(self, cursor: sqlite3.Cursor, table: str, period_column: str):
+        """Give a rollup table its unique cell key, merging duplicate cells of older databases
+        
+        location_id is NULL for shifts without a location; the key indexes it
+        through IFNULL so those cells are unique too.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (f"uq_{table}_cell",))
+        if cursor.fetchone():
+            return
+        cursor.execute(f"DROP INDEX IF EXISTS idx_{table}_period")
+        measures = ', '.join(self.ROLLUP_MEASURES)
+        cursor.execute(f"""
+            CREATE TEMP TABLE merged_rollup AS
+            SELECT {period_column}, location_id, position,
+                   {', '.join(f'SUM({measure}) AS {measure}' for measure in self.ROLLUP_MEASURES)}
+            FROM {table} GROUP BY {period_column}, location_id, position
+        """)
+        cursor.execute(f"DELETE FROM {table}")
+        cursor.execute(f"""
+            INSERT INTO {table} ({period_column}, location_id, position, {measures})
+            SELECT {period_column}, location_id, position, {measures} FROM merged_rollup
+        """)
+        cursor.execute("DROP TABLE merged_rollup")
+        cursor.execute(f"""
+            CREATE UNIQUE INDEX uq_{table}_cell ON {table} ({period_column}, IFNULL(location_id, -1), position)
+        """)
+    
+    def _bump_data_version(self, cursor: sqlite3.Cursor, *scopes: str):
+        """Advance change counters inside the write's own transaction"""
+        cursor.executemany("""
+            INSERT INTO data_versions (scope, version) VALUES (?, 1)
+            ON CONFLICT(scope) DO UPDATE SET version = version + 1
+        """, [(scope,) for scope in scopes])
+    
+    def get_data_version(self, scopes: Iterable[str] = DATA_SCOPES) -> Tuple[int, ...]:
+        """Get current change counters of the given scopes, in order"""
+        scopes = list(scopes)
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT scope, version FROM data_versions WHERE scope IN ({', '.join('?' * len(scopes))})",
+                           scopes)
+            versions = {row['scope']: row['version'] for row in cursor.fetchall()}
+            return tuple(versions.get(scope, 0) for scope in scopes)
+    
+    def add_change_listener(self, listener: Callable[[DataChange], None]):
+        """Call listener with a DataChange after each committed write
+        
+        Listeners run on the writing thread and should return quickly.
+        """
+        with self._listener_lock:
+            self._change_listeners.append(listener)
+    
+    def remove_change_listener(self, listener: Callable[[DataChange], None]):
+        """Stop calling a change listener"""
+        with self._listener_lock:
+            if listener in self._change_listeners:
+                self._change_listeners.remove(listener)
+    
+    def _notify_changes(self, changes: Iterable[DataChange]):
+        with self._listener_lock:
+            listeners = list(self._change_listeners)
+        for change in changes:
+            for listener in listeners:
+                try:
+                    listener(change)
+                except Exception as e:
+                    self.logger.error(f"Change listener failed: {e}")
+    
+    def _employee_metric_values(self, cursor: sqlite3.Cursor, employee_id: int) -> Optional[Dict[str, Any]]:
+        """Stored EMPLOYEE_METRIC_COLUMNS of one employee"""
+        cursor.execute(f"SELECT {', '.join(EMPLOYEE_METRIC_COLUMNS)} FROM employees WHERE id = ?", (employee_id,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+    
+    def _backfill_employee_conflicts(self, cursor: sqlite3.Cursor):
+        """Fill the conflict pair table from employee JSON lists on older databases"""
+        cursor.execute("SELECT 1 FROM employee_conflicts LIMIT 1")
+        if cursor.fetchone():
+            return
+        cursor.execute("SELECT id, cannot_work_with FROM employees WHERE cannot_work_with NOT IN ('', '[]')")
+        for row in cursor.fetchall():
+            self._sync_employee_conflicts(cursor, row['id'], json.loads(row['cannot_work_with'] or '[]'))
+    
+    def _sync_employee_conflicts(self, cursor: sqlite3.Cursor, employee_id: int, other_ids: List[int]):
+        """Replace an employee's stored cannot_work_with pairs"""
+        cursor.execute("DELETE FROM employee_conflicts WHERE employee_id = ?", (employee_id,))
+        cursor.executemany(
+            "INSERT OR IGNORE INTO employee_conflicts (employee_id, other_employee_id) VALUES (?, ?)",
+            [(employee_id, other_id) for other_id in other_ids if other_id != employee_id]
+        )
+    
+    def get_employee_conflict_pairs(self) -> List[Tuple[int, int]]:
+        """Get every cannot_work_with pair once, as (lower id, higher id)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT DISTINCT MIN(employee_id, other_employee_id) AS first_id,
+                                MAX(employee_id, other_employee_id) AS second_id
+                FROM employee_conflicts
+            """)
+            return [(row['first_id'], row['second_id']) for row in cursor.fetchall()]
+    
     # Employee CRUD operations
     def add_employee(self, employee: Employee) -> int:
         """Add new employee to database"""
@@ -241,6 +437,7 @@ class DatabaseManager:
             ))
             
             employee_id = cursor.lastrowid
+            self._sync_employee_conflicts(cursor, employee_id, employee.cannot_work_with)
             
             # Add availability records
             for availability in employee.availability:
@@ -255,9 +452,12 @@ class DatabaseManager:
                     availability.is_preferred
                 ))
             
+            self._bump_data_version(cursor, "employees")
+            after = self._employee_metric_values(cursor, employee_id)
             conn.commit()
             self.logger.info(f"Added employee: {employee.full_name} (ID: {employee_id})")
-            return employee_id
+        self._notify_changes([DataChange("employees", "added", employee_id, None, after)])
+        return employee_id
     
     def get_employee(self, employee_id: int) -> Optional[Employee]:
         """Get employee by ID"""
@@ -343,8 +543,24 @@ class DatabaseManager:
         if not employee.id:
             return False
         
+        changes: List[DataChange] = []
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            before = self._employee_metric_values(cursor, employee.id)
+            
+            # A wage change re-costs the employee's scheduled history in the labor rollups
+            if before and before['hourly_wage'] != employee.hourly_wage:
+                cursor.execute("""
+                    SELECT MIN(s.date) AS first_date, MAX(s.date) AS last_date
+                    FROM shift_assignments a JOIN shifts s ON s.id = a.shift_id
+                    WHERE a.employee_id = ?
+                """, (employee.id,))
+                history = cursor.fetchone()
+                if history['first_date']:
+                    with self._labor_rollup_delta(cursor, {employee.id}, date.fromisoformat(history['first_date']),
+                                                  date.fromisoformat(history['last_date']), changes):
+                        cursor.execute("UPDATE employees SET hourly_wage = ? WHERE id = ?",
+                                       (employee.hourly_wage, employee.id))
             
             # Update main employee record
             cursor.execute("""
@@ -371,6 +587,8 @@ class DatabaseManager:
                 datetime.now().isoformat(), employee.id
             ))
             
+            self._sync_employee_conflicts(cursor, employee.id, employee.cannot_work_with)
+            
             # Update availability
             cursor.execute("DELETE FROM employee_availability WHERE employee_id = ?", (employee.id,))
             for availability in employee.availability:
@@ -385,22 +603,33 @@ class DatabaseManager:
                     availability.is_preferred
                 ))
             
+            self._bump_data_version(cursor, "employees")
+            changes.insert(0, DataChange("employees", "updated", employee.id, before,
+                                         self._employee_metric_values(cursor, employee.id)))
             conn.commit()
             self.logger.info(f"Updated employee: {employee.full_name}")
-            return True
+        self._notify_changes(changes)
+        return True
     
     def delete_employee(self, employee_id: int) -> bool:
         """Delete employee (soft delete by setting status to TERMINATED)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            before = self._employee_metric_values(cursor, employee_id)
             
             cursor.execute("""
                 UPDATE employees SET status = ?, updated_at = ? WHERE id = ?
             """, (EmploymentStatus.TERMINATED.value, datetime.now().isoformat(), employee_id))
+            terminated = cursor.rowcount > 0
             
+            if terminated:
+                self._bump_data_version(cursor, "employees")
             conn.commit()
             self.logger.info(f"Terminated employee ID: {employee_id}")
-            return cursor.rowcount > 0
+        if terminated:
+            self._notify_changes([DataChange("employees", "updated", employee_id, before,
+                                             dict(before, status=EmploymentStatus.TERMINATED.value))])
+        return terminated
     
     # Shift template CRUD operations
     def add_shift_template(self, template: ShiftTemplate) -> int:
@@ -410,13 +639,13 @@ class DatabaseManager:
             
             cursor.execute("""
                 INSERT INTO shift_templates (
-                    name, shift_type, start_time, end_time, break_duration_minutes,
+                    name, location_id, shift_type, start_time, end_time, break_duration_minutes,
                     lunch_duration_minutes, minimum_break_coverage, is_peak_hours,
                     priority, special_requirements, applicable_days, estimated_labor_cost,
                     overtime_threshold_hours, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
-                template.name, template.shift_type.value,
+                template.name, template.location_id, template.shift_type.value,
                 template.start_time.isoformat(), template.end_time.isoformat(),
                 template.break_duration_minutes, template.lunch_duration_minutes,
                 template.minimum_break_coverage, template.is_peak_hours,
@@ -441,11 +670,624 @@ class DatabaseManager:
                     json.dumps(req.must_have_training), req.supervisor_required
                 ))
             
+            self._bump_data_version(cursor, "templates")
             conn.commit()
             self.logger.info(f"Added shift template: {template.name} (ID: {template_id})")
             return template_id
     
-    # Additional CRUD methods for shifts, schedules, etc. would follow similar patterns...
+    def get_all_shift_templates(self, location_id: Optional[int] = None) -> List[ShiftTemplate]:
+        """Get all shift templates, optionally filtered by location"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            if location_id is not None:
+                cursor.execute("SELECT * FROM shift_templates WHERE location_id = ? ORDER BY id", (location_id,))
+            else:
+                cursor.execute("SELECT * FROM shift_templates ORDER BY id")
+            template_rows = cursor.fetchall()
+            
+            # Load all requirements in one query and group them by template
+            cursor.execute("SELECT * FROM position_requirements ORDER BY id")
+            requirements: Dict[int, List[PositionRequirement]] = {}
+            for req_row in cursor.fetchall():
+                requirements.setdefault(req_row['template_id'], []).append(PositionRequirement(
+                    position=Position(req_row['position']),
+                    minimum_required=req_row['minimum_required'],
+                    maximum_allowed=req_row['maximum_allowed'],
+                    preferred_skill_level=req_row['preferred_skill_level'],
+                    must_have_training=json.loads(req_row['must_have_training'] or '[]'),
+                    supervisor_required=bool(req_row['supervisor_required'])
+                ))
+            
+            templates = []
+            for row in template_rows:
+                templates.append(ShiftTemplate(
+                    id=row['id'],
+                    name=row['name'],
+                    location_id=row['location_id'],
+                    shift_type=ShiftType(row['shift_type']),
+                    start_time=time.fromisoformat(row['start_time']),
+                    end_time=time.fromisoformat(row['end_time']),
+                    position_requirements=requirements.get(row['id'], []),
+                    break_duration_minutes=row['break_duration_minutes'],
+                    lunch_duration_minutes=row['lunch_duration_minutes'],
+                    minimum_break_coverage=row['minimum_break_coverage'],
+                    is_peak_hours=bool(row['is_peak_hours']),
+                    priority=ShiftPriority(row['priority']),
+                    special_requirements=row['special_requirements'],
+                    applicable_days={WeekDay(day) for day in json.loads(row['applicable_days'] or '[]')},
+                    estimated_labor_cost=row['estimated_labor_cost'],
+                    overtime_threshold_hours=row['overtime_threshold_hours']
+                ))
+            
+            return templates
+    
+    # Shift CRUD operations
+    def add_shift(self, shift: Shift) -> int:
+        """Add new shift with its assignments"""
+        changes: List[DataChange] = []
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            shift_id = self._insert_shift(cursor, shift, changes)
+            self._bump_data_version(cursor, "shifts")
+            conn.commit()
+        self._notify_changes(changes)
+        return shift_id
+    
+    def add_shifts(self, shifts: List[Shift]) -> List[int]:
+        """Add several shifts in a single transaction"""
+        changes: List[DataChange] = []
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            rules = self._read_overtime_rules(cursor)
+            shift_ids = [self._insert_shift(cursor, shift, changes, rules) for shift in shifts]
+            self._bump_data_version(cursor, "shifts")
+            conn.commit()
+            self.logger.info(f"Added {len(shift_ids)} shifts")
+        self._notify_changes(changes)
+        return shift_ids
+    
+    def add_template_shifts(self, rows: Iterable[Tuple[int, Optional[int], str, str, str]],
+                            batch_size: int = 5000) -> int:
+        """Insert unstaffed shifts generated from templates, skipping ones that exist
+        
+        rows are (template_id, location_id, date, start_time, end_time) with ISO
+        strings. A shift already stored for the same template, location and date is
+        left alone, so re-running a generation is harmless. Rows are written in
+        batches of batch_size, one transaction each. Returns the number inserted.
+        """
+        inserted = 0
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            for batch in self._batched(rows, batch_size):
+                now = datetime.now().isoformat()
+                before = conn.total_changes
+                cursor.executemany("""
+                    INSERT INTO shifts (
+                        template_id, location_id, date, start_time, end_time, is_published,
+                        is_completed, sales_target, actual_sales, customer_count, average_wait_time,
+                        scheduled_labor_cost, actual_labor_cost, overtime_hours, manager_notes,
+                        issues_reported, created_at, updated_at
+                    )
+                    SELECT ?, ?, ?, ?, ?, 0, 0, 0, 0, 0, 0, 0, 0, 0, '', '[]', ?, ?
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM shifts WHERE template_id = ? AND date = ? AND location_id IS ?
+                    )
+                """, [
+                    (template_id, location_id, shift_date, start_time, end_time, now, now,
+                     template_id, shift_date, location_id)
+                    for template_id, location_id, shift_date, start_time, end_time in batch
+                ])
+                if conn.total_changes > before:
+                    inserted += conn.total_changes - before
+                    self._bump_data_version(cursor, "shifts")
+                conn.commit()
+        self.logger.info(f"Added {inserted} shifts from templates")
+        return inserted
+    
+    @staticmethod
+    def _batched(rows: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+        """Yield lists of up to batch_size rows from an iterable"""
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    def _insert_shift(self, cursor: sqlite3.Cursor, shift: Shift, changes: Optional[List[DataChange]] = None,
+                      rules: Optional[OvertimeRules] = None) -> int:
+        """Insert shift row and assignments using an open cursor"""
+        if shift.assignments:
+            with self._labor_rollup_delta(cursor, {a.employee_id for a in shift.assignments}, shift.date,
+                                          changes=changes, rules=rules):
+                return self._insert_shift_row(cursor, shift)
+        return self._insert_shift_row(cursor, shift)
+    
+    def _insert_shift_row(self, cursor: sqlite3.Cursor, shift: Shift) -> int:
+        cursor.execute("""
+            INSERT INTO shifts (
+                template_id, location_id, date, start_time, end_time, is_published,
+                is_completed, actual_start_time, actual_end_time, sales_target,
+                actual_sales, customer_count, average_wait_time, scheduled_labor_cost,
+                actual_labor_cost, overtime_hours, manager_notes, issues_reported,
+                created_at, updated_at, created_by
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            shift.template_id, shift.location_id, shift.date.isoformat(),
+            shift.start_time.isoformat(), shift.end_time.isoformat(),
+            shift.is_published, shift.is_completed,
+            shift.actual_start_time.isoformat() if shift.actual_start_time else None,
+            shift.actual_end_time.isoformat() if shift.actual_end_time else None,
+            shift.sales_target, shift.actual_sales, shift.customer_count,
+            shift.average_wait_time, shift.scheduled_labor_cost, shift.actual_labor_cost,
+            shift.overtime_hours, shift.manager_notes, json.dumps(shift.issues_reported),
+            shift.created_at.isoformat(), shift.updated_at.isoformat(), shift.created_by
+        ))
+        shift.id = cursor.lastrowid
+        self._insert_assignments(cursor, shift)
+        return shift.id
+    
+    def _insert_assignments(self, cursor: sqlite3.Cursor, shift: Shift):
+        """Insert all assignments of a shift using an open cursor"""
+        cursor.executemany("""
+            INSERT INTO shift_assignments (
+                shift_id, employee_id, position, start_time, end_time,
+                is_overtime, break_times, notes
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                shift.id, assignment.employee_id, assignment.position.value,
+                assignment.start_time.isoformat(), assignment.end_time.isoformat(),
+                assignment.is_overtime,
+                json.dumps([[start.isoformat(), end.isoformat()] for start, end in assignment.break_times]),
+                assignment.notes
+            )
+            for assignment in shift.assignments
+        ])
+    
+    def update_shift_assignments(self, shift: Shift) -> bool:
+        """Replace stored assignments of a shift with its current assignments"""
+        return self.update_shifts_assignments([shift]) > 0
+    
+    def update_shifts_assignments(self, shifts: List[Shift]) -> int:
+        """Replace stored assignments of several shifts in a single transaction
+        
+        Shifts without an id are skipped. Returns the number of shifts updated.
+        """
+        shifts = [shift for shift in shifts if shift.id]
+        if not shifts:
+            return 0
+        
+        changes: List[DataChange] = []
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            rules = self._read_overtime_rules(cursor)
+            now = datetime.now().isoformat()
+            for shift in shifts:
+                cursor.execute("SELECT employee_id FROM shift_assignments WHERE shift_id = ?", (shift.id,))
+                employee_ids = {row['employee_id'] for row in cursor.fetchall()}
+                employee_ids.update(a.employee_id for a in shift.assignments)
+                with self._labor_rollup_delta(cursor, employee_ids, shift.date, changes=changes, rules=rules):
+                    cursor.execute("DELETE FROM shift_assignments WHERE shift_id = ?", (shift.id,))
+                    self._insert_assignments(cursor, shift)
+                cursor.execute("""
+                    UPDATE shifts SET scheduled_labor_cost = ?, updated_at = ? WHERE id = ?
+                """, (shift.scheduled_labor_cost, now, shift.id))
+            self._bump_data_version(cursor, "shifts")
+            conn.commit()
+        self._notify_changes(changes)
+        return len(shifts)
+    
+    def get_shifts(self, start_date: date, end_date: date, location_id: Optional[int] = None) -> List[Shift]:
+        """Get shifts with assignments between two dates (inclusive)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            conditions = "s.date BETWEEN ? AND ?"
+            params: List[Any] = [start_date.isoformat(), end_date.isoformat()]
+            if location_id is not None:
+                conditions += " AND s.location_id = ?"
+                params.append(location_id)
+            
+            cursor.execute(f"""
+                SELECT s.* FROM shifts s WHERE {conditions}
+                ORDER BY s.date, s.start_time, s.id
+            """, params)
+            shift_rows = cursor.fetchall()
+            
+            if not shift_rows:
+                return []
+            
+            # Fetch assignments for the whole range at once instead of per shift
+            cursor.execute(f"""
+                SELECT a.* FROM shift_assignments a
+                JOIN shifts s ON s.id = a.shift_id
+                WHERE {conditions}
+                ORDER BY a.id
+            """, params)
+            assignments: Dict[int, List[ShiftAssignment]] = {}
+            for row in cursor.fetchall():
+                assignments.setdefault(row['shift_id'], []).append(self._row_to_assignment(row))
+            
+            return [self._row_to_shift(row, assignments.get(row['id'], [])) for row in shift_rows]
+    
+    def get_assignment_records(self, start_date: date, end_date: date,
+                               location_id: Optional[int] = None) -> List[sqlite3.Row]:
+        """Get flat assignment rows joined with their shift for bulk analytics
+
+        Each row has shift_id, template_id, location_id, date, employee_id, position,
+        start_time and end_time, the employee's hourly_wage (0 when unknown) and the
+        template's overtime_threshold_hours, plus day_number (date ordinal) and
+        start/end minutes computed in SQL, ordered by date and start time.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            conditions = "s.date BETWEEN ? AND ?"
+            params: List[Any] = [start_date.isoformat(), end_date.isoformat()]
+            if location_id is not None:
+                conditions += " AND s.location_id = ?"
+                params.append(location_id)
+            
+            cursor.execute(f"""
+                SELECT a.shift_id, s.template_id, s.location_id, s.date, a.employee_id,
+                       a.position, a.start_time, a.end_time,
+                       COALESCE(e.hourly_wage, 0) AS hourly_wage, t.overtime_threshold_hours,
+                       CAST(julianday(s.date) - 1721424.5 AS INTEGER) AS day_number,
+                       CAST(substr(a.start_time, 1, 2) AS INTEGER) * 60 + CAST(substr(a.start_time, 4, 2) AS INTEGER) AS start_minute,
+                       CAST(substr(a.end_time, 1, 2) AS INTEGER) * 60 + CAST(substr(a.end_time, 4, 2) AS INTEGER) AS end_minute
+                FROM shift_assignments a
+                JOIN shifts s ON s.id = a.shift_id
+                LEFT JOIN employees e ON e.id = a.employee_id
+                LEFT JOIN shift_templates t ON t.id = s.template_id
+                WHERE {conditions}
+                ORDER BY s.date, a.start_time, a.id
+            """, params)
+            return cursor.fetchall()
+    
+    def get_demand_records(self, start_date: date, end_date: date,
+                           location_id: Optional[int] = None) -> List[sqlite3.Row]:
+        """Get date, times, customer_count and actual_sales of shifts that recorded customers"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            conditions = "date BETWEEN ? AND ? AND customer_count > 0"
+            params: List[Any] = [start_date.isoformat(), end_date.isoformat()]
+            if location_id is not None:
+                conditions += " AND location_id = ?"
+                params.append(location_id)
+            
+            cursor.execute(f"""
+                SELECT date, start_time, end_time, customer_count, actual_sales
+                FROM shifts WHERE {conditions}
+                ORDER BY date, start_time
+            """, params)
+            return cursor.fetchall()
+    
+    def get_daily_shift_counts(self, start_date: date, end_date: date,
+                               location_id: Optional[int] = None) -> List[sqlite3.Row]:
+        """Get date, shift_count, assignment_count and unstaffed_count per day with shifts"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            conditions = "s.date BETWEEN ? AND ?"
+            params: List[Any] = [start_date.isoformat(), end_date.isoformat()]
+            if location_id is not None:
+                conditions += " AND s.location_id = ?"
+                params.append(location_id)
+            
+            cursor.execute(f"""
+                SELECT date, COUNT(*) AS shift_count, SUM(staff) AS assignment_count,
+                       SUM(staff = 0) AS unstaffed_count
+                FROM (
+                    SELECT s.date, (SELECT COUNT(*) FROM shift_assignments a WHERE a.shift_id = s.id) AS staff
+                    FROM shifts s WHERE {conditions}
+                )
+                GROUP BY date
+                ORDER BY date
+            """, params)
+            return cursor.fetchall()
+    
+    def _row_to_assignment(self, row: sqlite3.Row) -> ShiftAssignment:
+        """Convert shift_assignments row to ShiftAssignment"""
+        return ShiftAssignment(
+            employee_id=row['employee_id'],
+            position=Position(row['position']),
+            start_time=time.fromisoformat(row['start_time']),
+            end_time=time.fromisoformat(row['end_time']),
+            is_overtime=bool(row['is_overtime']),
+            break_times=[(time.fromisoformat(start), time.fromisoformat(end))
+                         for start, end in json.loads(row['break_times'] or '[]')],
+            notes=row['notes'] or ""
+        )
+    
+    def _row_to_shift(self, row: sqlite3.Row, assignments: List[ShiftAssignment]) -> Shift:
+        """Convert shifts row to Shift"""
+        return Shift(
+            id=row['id'],
+            template_id=row['template_id'],
+            location_id=row['location_id'],
+            date=date.fromisoformat(row['date']),
+            start_time=time.fromisoformat(row['start_time']),
+            end_time=time.fromisoformat(row['end_time']),
+            assignments=assignments,
+            is_published=bool(row['is_published']),
+            is_completed=bool(row['is_completed']),
+            actual_start_time=time.fromisoformat(row['actual_start_time']) if row['actual_start_time'] else None,
+            actual_end_time=time.fromisoformat(row['actual_end_time']) if row['actual_end_time'] else None,
+            sales_target=row['sales_target'] or 0.0,
+            actual_sales=row['actual_sales'] or 0.0,
+            customer_count=row['customer_count'] or 0,
+            average_wait_time=row['average_wait_time'] or 0.0,
+            scheduled_labor_cost=row['scheduled_labor_cost'] or 0.0,
+            actual_labor_cost=row['actual_labor_cost'] or 0.0,
+            overtime_hours=row['overtime_hours'] or 0.0,
+            manager_notes=row['manager_notes'] or "",
+            issues_reported=json.loads(row['issues_reported'] or '[]'),
+            created_at=datetime.fromisoformat(row['created_at']),
+            updated_at=datetime.fromisoformat(row['updated_at']),
+            created_by=row['created_by']
+        )
+    
+    # Labor rollups
+    ROLLUP_MEASURES = ("hours", "regular_hours", "overtime_hours", "labor_cost", "headcount", "assignment_count")
+    ROLLUP_TABLES = {"day": ("labor_daily_rollup", "date"), "week": ("labor_weekly_rollup", "week_start")}
+    
+    def _labor_contributions(self, cursor: sqlite3.Cursor, employee_ids: Optional[Iterable[int]],
+                             start_date: date, end_date: date,
+                             rules: OvertimeRules) -> Dict[Tuple[str, str, Optional[int], str], List[float]]:
+        """Cost assignments of whole weeks into rollup cells
+        
+        Returns {(scope, period, location_id, position): measures} for scope "day"
+        and "week", measures ordered as ROLLUP_MEASURES. Overtime is split by
+        OvertimeRules.split_hours with each template's overtime_threshold_hours as
+        the daily threshold, as WeeklySchedule.split_overtime does. Only the given employees are costed (all when None);
+        since overtime never crosses employees, their cells can be subtracted and
+        re-added on their own.
+        """
+        start_date = start_date - timedelta(days=start_date.weekday())
+        end_date = end_date + timedelta(days=6 - end_date.weekday())
+        base_query = """
+            SELECT a.employee_id, s.date, s.location_id, a.position,
+                   COALESCE(e.hourly_wage, 0) AS hourly_wage, t.overtime_threshold_hours,
+                   CAST(substr(a.start_time, 1, 2) AS INTEGER) * 60 + CAST(substr(a.start_time, 4, 2) AS INTEGER) AS start_minute,
+                   CAST(substr(a.end_time, 1, 2) AS INTEGER) * 60 + CAST(substr(a.end_time, 4, 2) AS INTEGER) AS end_minute
+            FROM shift_assignments a
+            JOIN shifts s ON s.id = a.shift_id
+            LEFT JOIN employees e ON e.id = a.employee_id
+            LEFT JOIN shift_templates t ON t.id = s.template_id
+            WHERE s.date BETWEEN ? AND ?
+        """
+        order = " ORDER BY a.employee_id, s.date, a.start_time, a.id"
+        params = [start_date.isoformat(), end_date.isoformat()]
+        
+        rows: List[sqlite3.Row] = []
+        if employee_ids is None:
+            cursor.execute(base_query + order, params)
+            rows = cursor.fetchall()
+        else:
+            for batch in self._batched(sorted(set(employee_ids)), 500):
+                cursor.execute(base_query + f" AND a.employee_id IN ({', '.join('?' * len(batch))})" + order,
+                               params + batch)
+                rows.extend(cursor.fetchall())
+        
+        cells: Dict[Tuple[str, str, Optional[int], str], List[float]] = {}
+        index = 0
+        while index < len(rows):
+            # One employee's rows at a time
+            employee_id = rows[index]['employee_id']
+            end = index
+            while end < len(rows) and rows[end]['employee_id'] == employee_id:
+                end += 1
+            employee_rows = rows[index:end]
+            index = end
+            
+            worked = []
+            for row in employee_rows:
+                minutes = row['end_minute'] - row['start_minute']
+                # Overnight assignments end on the next day
+                if minutes <= 0:
+                    minutes += 24 * 60
+                worked.append((date.fromisoformat(row['date']), minutes / 60.0, row['overtime_threshold_hours']))
+            
+            seen = set()
+            for row, (work_date, hours, _), (regular, overtime) in zip(employee_rows, worked, rules.split_hours(worked)):
+                wage = row['hourly_wage']
+                week_start = (work_date - timedelta(days=work_date.weekday())).isoformat()
+                for key in (("day", row['date'], row['location_id'], row['position']),
+                            ("week", week_start, row['location_id'], row['position'])):
+                    measures = cells.setdefault(key, [0.0] * len(self.ROLLUP_MEASURES))
+                    measures[0] += hours
+                    measures[1] += regular
+                    measures[2] += overtime
+                    measures[3] += wage * regular + wage * overtime * rules.overtime_multiplier
+                    measures[4] += key not in seen
+                    measures[5] += 1
+                    seen.add(key)
+        return cells
+    
+    @contextmanager
+    def _labor_rollup_delta(self, cursor: sqlite3.Cursor, employee_ids: Iterable[int],
+                            start_date: date, end_date: Optional[date] = None,
+                            changes: Optional[List[DataChange]] = None,
+                            rules: Optional[OvertimeRules] = None):
+        """Keep labor rollups current across a write to these employees' assignments
+        
+        The employees' contributions to the weeks between start_date and end_date
+        are costed before and after the wrapped write, and only the difference is
+        applied, so a write costs a few weeks of a few employees rather than a
+        rescan. Weekly deltas are appended to changes as shift DataChanges for
+        the caller to send after commit. Writes covering several shifts should read
+        rules once per transaction and pass them in. Changing overtime settings or
+        template thresholds needs rebuild_labor_rollups.
+        """
+        employee_ids = set(employee_ids)
+        end_date = end_date or start_date
+        rules = rules or self._read_overtime_rules(cursor)
+        before = self._labor_contributions(cursor, employee_ids, start_date, end_date, rules)
+        yield
+        after = self._labor_contributions(cursor, employee_ids, start_date, end_date, rules)
+        
+        empty = [0.0] * len(self.ROLLUP_MEASURES)
+        for key in before.keys() | after.keys():
+            scope, period, location_id, position = key
+            table, period_column = self.ROLLUP_TABLES[scope]
+            delta = [new - old for new, old in zip(after.get(key, empty), before.get(key, empty))]
+            if not any(delta):
+                continue
+            if changes is not None and scope == "week":
+                changes.append(DataChange("shifts", "updated", (period, location_id, position), None, {
+                    "hours": delta[0], "overtime_hours": delta[2],
+                    "labor_cost": delta[3], "assignment_count": delta[5]
+                }))
+            
+            cursor.execute(f"""
+                INSERT INTO {table} ({period_column}, location_id, position, {', '.join(self.ROLLUP_MEASURES)})
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT ({period_column}, IFNULL(location_id, -1), position) DO UPDATE SET
+                    {', '.join(f'{measure} = {measure} + excluded.{measure}' for measure in self.ROLLUP_MEASURES)}
+            """, [period, location_id, position] + delta)
+            cursor.execute(f"""
+                DELETE FROM {table}
+                WHERE {period_column} = ? AND IFNULL(location_id, -1) = IFNULL(?, -1) AND position = ?
+                  AND assignment_count <= 0
+            """, (period, location_id, position))
+    
+    def rebuild_labor_rollups(self, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                              weeks_per_batch: int = 13) -> int:
+        """Recompute labor rollups from stored assignments, for backfills
+        
+        Defaults to every week with shifts; a range is widened to whole weeks.
+        Weeks are rebuilt weeks_per_batch at a time, one transaction each.
+        Returns the number of weeks rebuilt.
+        """
+        rules = self.get_overtime_rules()
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            if start_date is None or end_date is None:
+                cursor.execute("SELECT MIN(date) AS first_date, MAX(date) AS last_date FROM shifts")
+                row = cursor.fetchone()
+                if not row['first_date']:
+                    return 0
+                start_date = start_date or date.fromisoformat(row['first_date'])
+                end_date = end_date or date.fromisoformat(row['last_date'])
+            
+            week = start_date - timedelta(days=start_date.weekday())
+            weeks = (end_date - week).days // 7 + 1
+            while week <= end_date:
+                batch_end = week + timedelta(weeks=weeks_per_batch) - timedelta(days=1)
+                cells = self._labor_contributions(cursor, None, week, batch_end, rules)
+                for scope, (table, period_column) in self.ROLLUP_TABLES.items():
+                    cursor.execute(f"DELETE FROM {table} WHERE {period_column} BETWEEN ? AND ?",
+                                   (week.isoformat(), batch_end.isoformat()))
+                    cursor.executemany(f"""
+                        INSERT INTO {table} ({period_column}, location_id, position, {', '.join(self.ROLLUP_MEASURES)})
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, [[period, location_id, position] + measures
+                          for (cell_scope, period, location_id, position), measures in cells.items()
+                          if cell_scope == scope])
+                self._bump_data_version(cursor, "shifts")
+                conn.commit()
+                week = batch_end + timedelta(days=1)
+        
+        self.logger.info(f"Rebuilt labor rollups for {weeks} weeks from {start_date} to {end_date}")
+        self._notify_changes([DataChange("shifts", "rebuilt", (start_date, end_date))])
+        return weeks
+    
+    def get_labor_rollup(self, start_date: date, end_date: date, period: str = "day",
+                         location_id: Optional[int] = None) -> List[sqlite3.Row]:
+        """Get pre-aggregated labor rows per period x location x position
+        
+        period is "day", "week", "month" or "year"; rows carry period (ISO date,
+        week start, YYYY-MM or YYYY) plus hours, regular_hours, overtime_hours,
+        labor_cost, headcount and assignment_count. headcount is distinct
+        employees for days and weeks, and the busiest day's for months and years.
+        """
+        if period in self.ROLLUP_TABLES:
+            table, period_column = self.ROLLUP_TABLES[period]
+            period_sql = period_column
+            measures_sql = ", ".join(self.ROLLUP_MEASURES)
+            group_sql = ""
+        elif period in ("month", "year"):
+            table, period_column = self.ROLLUP_TABLES["day"]
+            period_sql = f"substr(date, 1, {7 if period == 'month' else 4})"
+            measures_sql = ", ".join(f"MAX({measure}) AS {measure}" if measure == "headcount" else
+                                     f"SUM({measure}) AS {measure}" for measure in self.ROLLUP_MEASURES)
+            group_sql = "GROUP BY 1, location_id, position"
+        else:
+            raise ValueError(f"Unknown rollup period: {period}")
+        
+        conditions = f"{period_column} BETWEEN ? AND ?"
+        params: List[Any] = [start_date.isoformat(), end_date.isoformat()]
+        if location_id is not None:
+            conditions += " AND location_id = ?"
+            params.append(location_id)
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {period_sql} AS period, location_id, position, {measures_sql}
+                FROM {table} WHERE {conditions}
+                {group_sql}
+                ORDER BY 1, location_id, position
+            """, params)
+            return cursor.fetchall()
+    
+    # Reporting queries
+    # Aggregates are computed with GROUP BY in SQLite so reports receive a few
+    # rows instead of every Employee object. Weekly cost uses the same estimate
+    # as Employee.weekly_labor_cost: average of min and max hours times wage.
+    WEEKLY_COST_SQL = "(COALESCE(min_hours_per_week, 0) + COALESCE(max_hours_per_week, 0)) / 2.0 * hourly_wage"
+    
+    def _status_condition(self, status: Optional[EmploymentStatus]) -> Tuple[str, List[Any]]:
+        if status is None:
+            return "1 = 1", []
+        return "status = ?", [status.value]
+    
+    def get_employee_summary(self, status: Optional[EmploymentStatus] = EmploymentStatus.ACTIVE,
+                             excellent_attendance: float = 95.0,
+                             poor_attendance: float = 85.0) -> Dict[str, float]:
+        """Get roster totals and averages in one aggregate query
+        
+        Keys: employee_count, total_max_hours, weekly_labor_cost, average_wage,
+        average_attendance, average_punctuality, average_rating,
+        excellent_attendance_count and poor_attendance_count.
+        """
+        condition, params = self._status_condition(status)
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT COUNT(*) AS employee_count,
+                       COALESCE(SUM(max_hours_per_week), 0) AS total_max_hours,
+                       COALESCE(SUM({self.WEEKLY_COST_SQL}), 0) AS weekly_labor_cost,
+                       COALESCE(AVG(hourly_wage), 0) AS average_wage,
+                       COALESCE(AVG(attendance_rate), 0) AS average_attendance,
+                       COALESCE(AVG(punctuality_score), 0) AS average_punctuality,
+                       COALESCE(AVG(customer_rating), 0) AS average_rating,
+                       COALESCE(SUM(attendance_rate >= ?), 0) AS excellent_attendance_count,
+                       COALESCE(SUM(attendance_rate < ?), 0) AS poor_attendance_count
+                FROM employees WHERE {condition}
+            """, [excellent_attendance, poor_attendance] + params)
+            return dict(cursor.fetchone())
+    
+    def get_position_summary(self, status: Optional[EmploymentStatus] = EmploymentStatus.ACTIVE) -> List[sqlite3.Row]:
+        """Get employee_count, total_max_hours and weekly_labor_cost per primary_position"""
+        condition, params = self._status_condition(status)
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT primary_position,
+                       COUNT(*) AS employee_count,
+                       COALESCE(SUM(max_hours_per_week), 0) AS total_max_hours,
+                       COALESCE(SUM({self.WEEKLY_COST_SQL}), 0) AS weekly_labor_cost
+                FROM employees WHERE {condition}
+                GROUP BY primary_position
+                ORDER BY employee_count DESC, primary_position
+            """, params)
+            return cursor.fetchall()
     
     def get_restaurant_setting(self, setting_name: str) -> Optional[str]:
         """Get restaurant setting value"""
@@ -463,7 +1305,173 @@ class DatabaseManager:
                 INSERT OR REPLACE INTO restaurant_settings (setting_name, setting_value, description, updated_at)
                 VALUES (?, ?, ?, ?)
             """, (setting_name, setting_value, description, datetime.now().isoformat()))
+            self._bump_data_version(cursor, "settings")
+            conn.commit()
+    
+    def get_numeric_setting(self, setting_name: str, default: float) -> float:
+        """Get restaurant setting as a number, falling back to default"""
+        return self._numeric_setting_value(setting_name, self.get_restaurant_setting(setting_name), default)
+    
+    def _numeric_setting_value(self, setting_name: str, value: Optional[str], default: float) -> float:
+        try:
+            return float(value) if value not in (None, "") else default
+        except ValueError:
+            self.logger.warning(f"Setting {setting_name} is not numeric: {value!r}")
+            return default
+    
+    # Restaurant settings holding each OvertimeRules field
+    OVERTIME_SETTINGS = {
+        "daily_overtime_threshold": "daily_threshold_hours",
+        "weekly_overtime_threshold": "weekly_threshold_hours",
+        "overtime_multiplier": "overtime_multiplier"
+    }
+    
+    def get_overtime_rules(self) -> OvertimeRules:
+        """Get overtime rules from restaurant settings"""
+        with self.get_connection() as conn:
+            return self._read_overtime_rules(conn.cursor())
+    
+    def _read_overtime_rules(self, cursor: sqlite3.Cursor) -> OvertimeRules:
+        """Read overtime rules in one query on an open cursor, e.g. inside a write transaction"""
+        cursor.execute(f"""
+            SELECT setting_name, setting_value FROM restaurant_settings
+            WHERE setting_name IN ({', '.join('?' * len(self.OVERTIME_SETTINGS))})
+        """, list(self.OVERTIME_SETTINGS))
+        stored = {row['setting_name']: row['setting_value'] for row in cursor.fetchall()}
+        defaults = OvertimeRules()
+        return OvertimeRules(**{
+            field_name: self._numeric_setting_value(setting_name, stored.get(setting_name),
+                                                    getattr(defaults, field_name))
+            for setting_name, field_name in self.OVERTIME_SETTINGS.items()
+        })
+    
+    def get_time_window_setting(self, setting_name: str, default: Tuple[time, time]) -> Tuple[time, time]:
+        """Get an "HH:MM-HH:MM" restaurant setting as a (start, end) pair"""
+        value = self.get_restaurant_setting(setting_name)
+        if not value:
+            return default
+        try:
+            start_text, end_text = value.split("-")
+            return time.fromisoformat(start_text.strip()), time.fromisoformat(end_text.strip())
+        except ValueError:
+            self.logger.warning(f"Setting {setting_name} is not a time window: {value!r}")
+            return default
+    
+    def get_rush_windows(self) -> Dict[str, Tuple[time, time]]:
+        """Get configured breakfast, lunch and dinner rush windows"""
+        return {
+            "breakfast": self.get_time_window_setting("breakfast_rush", (time(7, 0), time(10, 0))),
+            "lunch": self.get_time_window_setting("lunch_rush", (time(11, 30), time(14, 0))),
+            "dinner": self.get_time_window_setting("dinner_rush", (time(17, 0), time(20, 0)))
+        }
+    
+    def get_holidays(self) -> Dict[date, Optional[WeekDay]]:
+        """Get holiday overrides from the "holidays" setting
+        
+        The setting is a JSON object mapping ISO dates to "closed" or to the weekday
+        whose templates should run instead, e.g. {"2024-12-25": "closed",
+        "2024-07-04": "SUNDAY"}. Closed days map to None.
+        """
+        value = self.get_restaurant_setting("holidays")
+        if not value:
+            return {}
+        try:
+            holidays = {}
+            for day_text, rule in json.loads(value).items():
+                holidays[date.fromisoformat(day_text)] = None if rule == "closed" else WeekDay[rule.upper()]
+            return holidays
+        except (ValueError, KeyError, AttributeError):
+            self.logger.warning(f"Setting holidays is not a valid holiday map: {value!r}")
+            return {}
+    
+    # Tables bulk_import accepts, with the data scope their rows belong to
+    IMPORT_SCOPES = {"employees": "employees", "shift_templates": "templates", "position_requirements": "templates",
+                     "shifts": "shifts", "shift_assignments": "shifts"}
+    
+    # Columns that must match for an archived row to count as one already stored under its id
+    IMPORT_IDENTITY = {
+        "employees": ("employee_number",),
+        "shift_templates": ("name", "location_id"),
+        "position_requirements": ("template_id", "position"),
+        "shifts": ("date", "template_id"),
+        "shift_assignments": ("shift_id", "employee_id"),
+    }
+    
+    def bulk_import(self, table: str, columns: Sequence[str],
+                    batches: Iterable[Sequence[Sequence[Any]]]) -> Dict[str, int]:
+        """Insert archived rows into a table, keeping their ids
+        
+        Rows are tuples in the order of columns, which must include id and the
+        table's IMPORT_IDENTITY columns. A row is skipped when its id is stored
+        with the same identity (the same employee number, template name and
+        location, shift date and template, shift and employee), so importing the same
+        archive twice is harmless. An id stored with a different identity, or
+        an employee number stored under another id, would attach imported rows
+        to the wrong record, so it raises ValueError instead. Each table is
+        imported in one transaction, so a conflict leaves it untouched. Labor
+        rollups are left alone; rebuild_labor_rollups the imported dates after
+        importing shifts. Returns counts of rows "inserted" and "skipped".
+        """
+        columns = list(columns)
+        identity = ("id",) + self.IMPORT_IDENTITY.get(table, ())
+        if table not in self.IMPORT_SCOPES or any(name not in columns for name in identity):
+            raise ValueError(f"Cannot bulk import {table} with columns {columns}")
+        
+        insert_sql = f"""
+            INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})
+        """
+        identity_indexes = [columns.index(name) for name in identity]
+        conflicts_index = columns.index("cannot_work_with") if "cannot_work_with" in columns else None
+        inserted = skipped = 0
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            for batch in batches:
+                archived = {row[identity_indexes[0]]: tuple(row[index] for index in identity_indexes)
+                            for row in batch}
+                stored = {}
+                for id_batch in self._batched(list(archived), 500):
+                    cursor.execute(f"SELECT {', '.join(identity)} FROM {table} "
+                                   f"WHERE id IN ({', '.join('?' * len(id_batch))})", id_batch)
+                    stored.update((row['id'], tuple(row)) for row in cursor.fetchall())
+                if table == "employees":
+                    # Employee numbers are unique, so one held by another id clashes too
+                    numbers = {key[1]: row_id for row_id, key in archived.items()}
+                    for number_batch in self._batched(list(numbers), 500):
+                        cursor.execute(f"SELECT id, employee_number FROM employees "
+                                       f"WHERE employee_number IN ({', '.join('?' * len(number_batch))})",
+                                       number_batch)
+                        for row in cursor.fetchall():
+                            if row['id'] != numbers[row['employee_number']]:
+                                stored.setdefault(numbers[row['employee_number']], tuple(row))
+                
+                new_rows = []
+                for row in batch:
+                    key = archived[row[identity_indexes[0]]]
+                    match = stored.get(key[0])
+                    if match is None:
+                        new_rows.append(row)
+                        # Ids repeated within the archive are inserted once
+                        stored[key[0]] = key
+                    elif match == key:
+                        skipped += 1
+                    else:
+                        raise ValueError(f"Archived {table} row {dict(zip(identity, key))} "
+                                         f"conflicts with stored row {dict(zip(identity, match))}")
+                
+                cursor.executemany(insert_sql, new_rows)
+                inserted += len(new_rows)
+                if conflicts_index is not None:
+                    for row in new_rows:
+                        self._sync_employee_conflicts(cursor, row[identity_indexes[0]],
+                                                      json.loads(row[conflicts_index] or '[]'))
+            if inserted:
+                self._bump_data_version(cursor, self.IMPORT_SCOPES[table])
             conn.commit()
+        
+        self.logger.info(f"Imported {inserted} rows into {table}, skipped {skipped} already stored")
+        if table == "employees" and inserted:
+            self._notify_changes([DataChange("employees", "rebuilt")])
+        return {"inserted": inserted, "skipped": skipped}
     
     def backup_database(self, backup_path: str) -> bool:
         """Create database backup"""
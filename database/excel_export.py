@@ -0,0 +1,215 @@
+"""
+Streaming Excel export for Restaurant Shift Management System
+
+Sheets are filled straight from database cursors: rows are fetched in chunks
+and appended to an openpyxl write-only workbook, so memory stays flat however
+many rows are exported. Sheets longer than Excel's row limit continue on
+numbered sheets. Exports can run on a background thread that reports progress
+and supports cancelling.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+from database.db_manager import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+EXCEL_MAX_ROWS = 1_048_576
+DEFAULT_CHUNK_SIZE = 5000
+
+# progress(sheet title, rows written so far, total rows across all sheets)
+ProgressCallback = Callable[[str, int, int], None]
+
+class ExportCancelled(Exception):
+    pass
+
+@dataclass
+class ExportSheet:
+    """One worksheet, filled from a query (streamed) or from ready rows (small sheets)
+
+    row_count, when the caller already knows how many rows the query returns,
+    saves the COUNT(*) pass used for progress totals.
+    """
+    title: str
+    headers: List[str]
+    query: Optional[str] = None
+    params: Sequence[Any] = field(default_factory=tuple)
+    rows: Optional[List[Sequence[Any]]] = None
+    format_row: Optional[Callable[[sqlite3.Row], Sequence[Any]]] = None
+    row_count: Optional[int] = None
+
+class StreamingExcelExporter:
+    """Writes ExportSheets to .xlsx with constant memory"""
+
+    def __init__(self, db_manager: DatabaseManager, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.db_manager = db_manager
+        self.chunk_size = chunk_size
+
+    def count_rows(self, cursor: sqlite3.Cursor, sheets: Sequence[ExportSheet]) -> int:
+        total = 0
+        for sheet in sheets:
+            if sheet.rows is not None:
+                total += len(sheet.rows)
+            elif sheet.row_count is not None:
+                total += sheet.row_count
+            else:
+                cursor.execute(f"SELECT COUNT(*) FROM ({sheet.query})", tuple(sheet.params))
+                total += cursor.fetchone()[0]
+        return total
+
+    def export(self, filename: str, sheets: Sequence[ExportSheet],
+               progress: Optional[ProgressCallback] = None,
+               cancel_event: Optional[threading.Event] = None) -> int:
+        """Write sheets to filename and return the number of data rows written"""
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        written = 0
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            total = self.count_rows(cursor, sheets)
+            for sheet in sheets:
+                worksheet, sheet_rows, part = None, EXCEL_MAX_ROWS, 1
+                for chunk in self._chunks(cursor, sheet):
+                    if cancel_event and cancel_event.is_set():
+                        raise ExportCancelled(f"Export to {filename} cancelled")
+                    for row in chunk:
+                        if sheet_rows >= EXCEL_MAX_ROWS:
+                            title = sheet.title if part == 1 else f"{sheet.title} ({part})"
+                            worksheet = workbook.create_sheet(title[:31])
+                            worksheet.append(sheet.headers)
+                            sheet_rows, part = 1, part + 1
+                        worksheet.append(sheet.format_row(row) if sheet.format_row else list(row))
+                        sheet_rows += 1
+                    written += len(chunk)
+                    if progress:
+                        progress(sheet.title, written, total)
+                if worksheet is None:
+                    # Keep empty sheets, with their headers
+                    workbook.create_sheet(sheet.title[:31]).append(sheet.headers)
+        workbook.save(filename)
+        logger.info(f"Exported {written} rows in {len(sheets)} sheets to {filename}")
+        return written
+
+    def _chunks(self, cursor: sqlite3.Cursor, sheet: ExportSheet) -> Iterable[List[Any]]:
+        if sheet.rows is not None:
+            for start in range(0, len(sheet.rows), self.chunk_size):
+                yield sheet.rows[start:start + self.chunk_size]
+            return
+        cursor.execute(sheet.query, tuple(sheet.params))
+        while True:
+            chunk = cursor.fetchmany(self.chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def export_in_background(self, filename: str, sheets: Sequence[ExportSheet],
+                             on_progress: Optional[ProgressCallback] = None,
+                             on_done: Optional[Callable[[int], None]] = None,
+                             on_error: Optional[Callable[[Exception], None]] = None) -> threading.Event:
+        """Run export on a daemon thread; set the returned event to cancel
+
+        Callbacks run on the worker thread, so UI code should hand them to its
+        event loop (for tkinter, widget.after).
+        """
+        cancel_event = threading.Event()
+
+        def run():
+            try:
+                written = self.export(filename, sheets, on_progress, cancel_event)
+            except Exception as e:
+                logger.error(f"Export to {filename} failed: {e}")
+                if on_error:
+                    on_error(e)
+                return
+            if on_done:
+                on_done(written)
+
+        threading.Thread(target=run, daemon=True).start()
+        return cancel_event
+
+# Sheet builders for the application's exports
+
+def _json_list(text: Optional[str]) -> str:
+    return ", ".join(json.loads(text or "[]"))
+
+def employee_data_sheet(employee_count: Optional[int] = None) -> ExportSheet:
+    """Employee Data sheet, every employee with display formatting"""
+    def format_row(row: sqlite3.Row) -> List[Any]:
+        weekly_cost = ((row['min_hours_per_week'] or 0) + (row['max_hours_per_week'] or 0)) / 2 * row['hourly_wage']
+        return [
+            row['employee_number'], row['first_name'], row['last_name'], row['email'], row['phone'],
+            row['address'], row['hire_date'][:10], row['status'], f"${row['hourly_wage']:.2f}",
+            row['primary_position'], _json_list(row['secondary_positions']),
+            row['min_hours_per_week'], row['max_hours_per_week'],
+            f"{row['attendance_rate'] or 0:.1f}%", f"{row['punctuality_score'] or 0:.1f}%",
+            f"{row['customer_rating'] or 0:.1f}/5.0", _json_list(row['training_completed']),
+            row['special_requirements'], row['notes'], f"${weekly_cost:.2f}"
+        ]
+
+    return ExportSheet(
+        title="Employee Data",
+        headers=['Employee Number', 'First Name', 'Last Name', 'Email', 'Phone', 'Address', 'Hire Date',
+                 'Status', 'Hourly Wage', 'Primary Position', 'Secondary Positions', 'Min Hours/Week',
+                 'Max Hours/Week', 'Attendance Rate', 'Punctuality Score', 'Customer Rating',
+                 'Training Completed', 'Special Requirements', 'Notes', 'Weekly Labor Cost'],
+        query="""
+            SELECT employee_number, first_name, last_name, email, phone, address, hire_date, status,
+                   hourly_wage, primary_position, secondary_positions, min_hours_per_week,
+                   max_hours_per_week, attendance_rate, punctuality_score, customer_rating,
+                   training_completed, special_requirements, notes
+            FROM employees ORDER BY id
+        """,
+        format_row=format_row,
+        row_count=employee_count
+    )
+
+def position_breakdown_sheet() -> ExportSheet:
+    """Position Breakdown sheet, employees per primary position"""
+    return ExportSheet(
+        title="Position Breakdown",
+        headers=['Position', 'Count'],
+        query="SELECT primary_position, COUNT(*) FROM employees GROUP BY primary_position ORDER BY MIN(id)"
+    )
+
+def labor_cost_sheet(status: str, employee_count: Optional[int] = None) -> ExportSheet:
+    """Labor Costs sheet, estimated weekly cost of employees with a status"""
+    return ExportSheet(
+        title="Labor Costs",
+        headers=['Employee Name', 'Position', 'Hourly Wage', 'Weekly Hours', 'Weekly Labor Cost', 'Status'],
+        query=f"""
+            SELECT first_name || ' ' || last_name, primary_position, hourly_wage, max_hours_per_week,
+                   {DatabaseManager.WEEKLY_COST_SQL}, status
+            FROM employees WHERE status = ? ORDER BY id
+        """,
+        params=(status,),
+        row_count=employee_count
+    )
+
+def assignments_sheet(start_date: date, end_date: date, location_id: Optional[int] = None) -> ExportSheet:
+    """Assignments sheet, one row per stored assignment in a date range"""
+    conditions = "s.date BETWEEN ? AND ?"
+    params: List[Any] = [start_date.isoformat(), end_date.isoformat()]
+    if location_id is not None:
+        conditions += " AND s.location_id = ?"
+        params.append(location_id)
+    return ExportSheet(
+        title="Assignments",
+        headers=['Date', 'Location', 'Employee Number', 'Employee Name', 'Position', 'Start', 'End', 'Hourly Wage'],
+        query=f"""
+            SELECT s.date, s.location_id, e.employee_number, e.first_name || ' ' || e.last_name,
+                   a.position, substr(a.start_time, 1, 5), substr(a.end_time, 1, 5), e.hourly_wage
+            FROM shift_assignments a
+            JOIN shifts s ON s.id = a.shift_id
+            LEFT JOIN employees e ON e.id = a.employee_id
+            WHERE {conditions}
+            ORDER BY s.date, a.start_time, a.id
+        """,
+        params=params
+    )
@@ -0,0 +1,347 @@
+"""
+Columnar archive for Restaurant Shift Management System
+
+Employees, shift templates with their position requirements, shifts, shift
+assignments and the labor rollups are exported to Parquet datasets that BI tools can query without touching the SQLite file.
+Dated tables are partitioned by year (hive style, year=2024/) and written in
+date order, so a reader filtering on a date range skips whole partitions and,
+through the row group statistics, most row groups of the years it opens.
+Rows stream from the database cursor in batches and are never loaded whole.
+The same datasets import back through DatabaseManager.bulk_import.
+
+Usage:
+    python -m database.parquet_archive export --db shifts.db --dir archive --start 2020-01-01 --end 2024-12-31
+    python -m database.parquet_archive import --db shifts.db --dir archive --start 2024-01-01
+"""
+
+import argparse
+import itertools
+import logging
+import shutil
+import time as timer
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from database.db_manager import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50_000
+IMPORT_BATCH_SIZE = 5000
+
+@dataclass(frozen=True)
+class ArchiveTable:
+    """One exported dataset
+
+    query selects the schema's columns, takes the date range as its two
+    parameters and orders by date_column. import_table is the SQLite table
+    rows are imported into (None for derived tables such as rollups);
+    columns outside that table, like the assignment's shift date, are
+    dropped on import.
+    """
+    name: str
+    schema: pa.Schema
+    query: str
+    date_column: Optional[str] = None
+    import_table: Optional[str] = None
+    import_columns: Tuple[str, ...] = ()
+
+_ROLLUP_FIELDS = [
+    ("location_id", pa.int64()), ("position", pa.string()), ("hours", pa.float64()),
+    ("regular_hours", pa.float64()), ("overtime_hours", pa.float64()), ("labor_cost", pa.float64()),
+    ("headcount", pa.int64()), ("assignment_count", pa.int64()),
+]
+
+_EMPLOYEE_SCHEMA = pa.schema([
+    ("id", pa.int64()), ("employee_number", pa.string()), ("first_name", pa.string()),
+    ("last_name", pa.string()), ("email", pa.string()), ("phone", pa.string()), ("address", pa.string()),
+    ("hire_date", pa.string()), ("status", pa.string()), ("hourly_wage", pa.float64()),
+    ("primary_position", pa.string()), ("secondary_positions", pa.string()), ("skill_levels", pa.string()),
+    ("max_hours_per_week", pa.int64()), ("min_hours_per_week", pa.int64()), ("preferred_shifts", pa.string()),
+    ("attendance_rate", pa.float64()), ("punctuality_score", pa.float64()), ("customer_rating", pa.float64()),
+    ("training_completed", pa.string()), ("cannot_work_with", pa.string()),
+    ("special_requirements", pa.string()), ("notes", pa.string()),
+    ("created_at", pa.string()), ("updated_at", pa.string()),
+])
+
+_TEMPLATE_SCHEMA = pa.schema([
+    ("id", pa.int64()), ("name", pa.string()), ("location_id", pa.int64()), ("shift_type", pa.string()),
+    ("start_time", pa.string()), ("end_time", pa.string()), ("break_duration_minutes", pa.int64()),
+    ("lunch_duration_minutes", pa.int64()), ("minimum_break_coverage", pa.int64()),
+    ("is_peak_hours", pa.bool_()), ("priority", pa.string()), ("special_requirements", pa.string()),
+    ("applicable_days", pa.string()), ("estimated_labor_cost", pa.float64()),
+    ("overtime_threshold_hours", pa.float64()), ("created_at", pa.string()), ("updated_at", pa.string()),
+])
+
+_REQUIREMENT_SCHEMA = pa.schema([
+    ("id", pa.int64()), ("template_id", pa.int64()), ("position", pa.string()),
+    ("minimum_required", pa.int64()), ("maximum_allowed", pa.int64()), ("preferred_skill_level", pa.string()),
+    ("must_have_training", pa.string()), ("supervisor_required", pa.bool_()),
+])
+
+_SHIFT_SCHEMA = pa.schema([
+    ("id", pa.int64()), ("template_id", pa.int64()), ("location_id", pa.int64()), ("date", pa.date32()),
+    ("start_time", pa.string()), ("end_time", pa.string()), ("is_published", pa.bool_()),
+    ("is_completed", pa.bool_()), ("actual_start_time", pa.string()), ("actual_end_time", pa.string()),
+    ("sales_target", pa.float64()), ("actual_sales", pa.float64()), ("customer_count", pa.int64()),
+    ("average_wait_time", pa.float64()), ("scheduled_labor_cost", pa.float64()),
+    ("actual_labor_cost", pa.float64()), ("overtime_hours", pa.float64()), ("manager_notes", pa.string()),
+    ("issues_reported", pa.string()), ("created_at", pa.string()), ("updated_at", pa.string()),
+    ("created_by", pa.int64()),
+])
+
+_ASSIGNMENT_SCHEMA = pa.schema([
+    ("id", pa.int64()), ("shift_id", pa.int64()), ("employee_id", pa.int64()), ("position", pa.string()),
+    ("start_time", pa.string()), ("end_time", pa.string()), ("is_overtime", pa.bool_()),
+    ("break_times", pa.string()), ("notes", pa.string()), ("date", pa.date32()),
+])
+
+def _columns(schema: pa.Schema) -> str:
+    return ", ".join(schema.names)
+
+ARCHIVE_TABLES: Dict[str, ArchiveTable] = {
+    table.name: table for table in [
+        ArchiveTable(
+            "employees", _EMPLOYEE_SCHEMA,
+            f"SELECT {_columns(_EMPLOYEE_SCHEMA)} FROM employees ORDER BY id",
+            import_table="employees", import_columns=tuple(_EMPLOYEE_SCHEMA.names)
+        ),
+        ArchiveTable(
+            "shift_templates", _TEMPLATE_SCHEMA,
+            f"SELECT {_columns(_TEMPLATE_SCHEMA)} FROM shift_templates ORDER BY id",
+            import_table="shift_templates", import_columns=tuple(_TEMPLATE_SCHEMA.names)
+        ),
+        ArchiveTable(
+            "position_requirements", _REQUIREMENT_SCHEMA,
+            f"SELECT {_columns(_REQUIREMENT_SCHEMA)} FROM position_requirements ORDER BY id",
+            import_table="position_requirements", import_columns=tuple(_REQUIREMENT_SCHEMA.names)
+        ),
+        ArchiveTable(
+            "shifts", _SHIFT_SCHEMA,
+            f"SELECT {_columns(_SHIFT_SCHEMA)} FROM shifts WHERE date BETWEEN ? AND ? ORDER BY date, id",
+            date_column="date", import_table="shifts", import_columns=tuple(_SHIFT_SCHEMA.names)
+        ),
+        ArchiveTable(
+            "shift_assignments", _ASSIGNMENT_SCHEMA,
+            f"""
+                SELECT {', '.join(f'a.{name}' for name in _ASSIGNMENT_SCHEMA.names[:-1])}, s.date
+                FROM shift_assignments a JOIN shifts s ON s.id = a.shift_id
+                WHERE s.date BETWEEN ? AND ? ORDER BY s.date, a.id
+            """,
+            date_column="date", import_table="shift_assignments",
+            import_columns=tuple(name for name in _ASSIGNMENT_SCHEMA.names if name != "date")
+        ),
+        ArchiveTable(
+            "labor_daily_rollup", pa.schema([("date", pa.date32())] + _ROLLUP_FIELDS),
+            f"""
+                SELECT date, {', '.join(name for name, _ in _ROLLUP_FIELDS)} FROM labor_daily_rollup
+                WHERE date BETWEEN ? AND ? ORDER BY date
+            """,
+            date_column="date"
+        ),
+        ArchiveTable(
+            "labor_weekly_rollup", pa.schema([("week_start", pa.date32())] + _ROLLUP_FIELDS),
+            f"""
+                SELECT week_start, {', '.join(name for name, _ in _ROLLUP_FIELDS)} FROM labor_weekly_rollup
+                WHERE week_start BETWEEN ? AND ? ORDER BY week_start
+            """,
+            date_column="week_start"
+        ),
+    ]
+}
+
+# Tables import_archive reads by default, in dependency order: shifts need their
+# templates (for overtime thresholds) and assignments need their shifts and employees
+IMPORT_TABLES = ("employees", "shift_templates", "position_requirements", "shifts", "shift_assignments")
+
+def _storage_type(data_type: pa.DataType) -> pa.DataType:
+    """Type of the SQLite values behind an archive column (ISO text dates, 0/1 booleans)"""
+    if data_type == pa.date32():
+        return pa.string()
+    if data_type == pa.bool_():
+        return pa.int64()
+    return data_type
+
+def _rows_to_batch(rows: Sequence[Sequence[Any]], schema: pa.Schema) -> pa.RecordBatch:
+    columns = list(zip(*rows))
+    return pa.RecordBatch.from_arrays(
+        [pa.array(values, type=_storage_type(field.type)).cast(field.type)
+         for values, field in zip(columns, schema)],
+        schema=schema
+    )
+
+def _batch_to_rows(batch: pa.RecordBatch, columns: Sequence[str]) -> List[Tuple[Any, ...]]:
+    arrays = [batch.column(name) for name in columns]
+    return list(zip(*[array.cast(_storage_type(array.type)).to_pylist() for array in arrays]))
+
+def export_archive(db_manager: DatabaseManager, directory: str,
+                   start_date: Optional[date] = None, end_date: Optional[date] = None,
+                   tables: Sequence[str] = tuple(ARCHIVE_TABLES),
+                   batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, int]:
+    """Write tables to Parquet datasets under directory, one subdirectory each
+
+    Dated tables are limited to start_date..end_date (default: everything).
+    Each exported table replaces that table's dataset. Every fetched batch
+    becomes one row group. Returns rows written per table.
+    """
+    start_text = (start_date or date.min).isoformat()
+    end_text = (end_date or date.max).isoformat()
+    written = {}
+    with db_manager.get_connection() as conn:
+        cursor = conn.cursor()
+        for name in tables:
+            table = ARCHIVE_TABLES[name]
+            target = Path(directory) / name
+            if target.exists():
+                shutil.rmtree(target)
+            target.mkdir(parents=True)
+
+            params = (start_text, end_text) if table.date_column else ()
+            cursor.execute(table.query, params)
+            date_index = table.schema.get_field_index(table.date_column) if table.date_column else None
+            writers: Dict[Optional[int], pq.ParquetWriter] = {}
+            count = 0
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    # Rows arrive in date order, so a batch spans at most a year boundary or two
+                    for year, year_rows in itertools.groupby(
+                            rows, key=lambda row: int(row[date_index][:4]) if date_index is not None else None):
+                        year_rows = list(year_rows)
+                        if year not in writers:
+                            folder = target / f"year={year}" if year is not None else target
+                            folder.mkdir(exist_ok=True)
+                            writers[year] = pq.ParquetWriter(folder / "part-0.parquet", table.schema,
+                                                             compression="zstd")
+                        writers[year].write_batch(_rows_to_batch(year_rows, table.schema))
+                        count += len(year_rows)
+            finally:
+                for writer in writers.values():
+                    writer.close()
+            written[name] = count
+            logger.info(f"Exported {count} {name} rows to {target}")
+    return written
+
+def _date_filter(table: ArchiveTable, start_date: Optional[date], end_date: Optional[date],
+                 location_id: Optional[int] = None) -> Optional[ds.Expression]:
+    """Partition and row group predicate for a date range"""
+    conditions = []
+    if table.date_column and start_date:
+        conditions += [ds.field("year") >= start_date.year, ds.field(table.date_column) >= start_date]
+    if table.date_column and end_date:
+        conditions += [ds.field("year") <= end_date.year, ds.field(table.date_column) <= end_date]
+    if location_id is not None and "location_id" in table.schema.names:
+        conditions.append(ds.field("location_id") == location_id)
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+def open_dataset(directory: str, name: str) -> ds.Dataset:
+    """Open an exported table as a pyarrow dataset, with its year partitions"""
+    table = ARCHIVE_TABLES[name]
+    if not table.date_column:
+        return ds.dataset(Path(directory) / name, schema=table.schema, format="parquet")
+    year = pa.schema([("year", pa.int32())])
+    return ds.dataset(Path(directory) / name, schema=pa.unify_schemas([table.schema, year]), format="parquet",
+                      partitioning=ds.partitioning(year, flavor="hive"))
+
+def read_archive(directory: str, name: str, start_date: Optional[date] = None,
+                 end_date: Optional[date] = None, location_id: Optional[int] = None,
+                 columns: Optional[List[str]] = None) -> pa.Table:
+    """Read an exported table, pushing the date range and location down to the files
+
+    Partitions outside the range are never opened and row groups whose date
+    statistics fall outside it are skipped. Call .to_pandas() for a DataFrame.
+    """
+    table = ARCHIVE_TABLES[name]
+    result = open_dataset(directory, name).to_table(
+        columns=columns, filter=_date_filter(table, start_date, end_date, location_id))
+    if "year" in result.column_names and (columns is None or "year" not in columns):
+        result = result.drop_columns(["year"])
+    return result
+
+def _import_batches(dataset: ds.Dataset, table: ArchiveTable, expression: Optional[ds.Expression],
+                    batch_size: int) -> Iterator[List[Tuple[Any, ...]]]:
+    for batch in dataset.to_batches(columns=list(table.import_columns), filter=expression,
+                                    batch_size=batch_size):
+        if batch.num_rows:
+            yield _batch_to_rows(batch, table.import_columns)
+
+def import_archive(db_manager: DatabaseManager, directory: str,
+                   start_date: Optional[date] = None, end_date: Optional[date] = None,
+                   tables: Sequence[str] = IMPORT_TABLES,
+                   batch_size: int = IMPORT_BATCH_SIZE) -> Dict[str, Dict[str, int]]:
+    """Import exported tables back into the database, keeping ids
+
+    Rows already stored are skipped. Labor rollups are rebuilt for the dates of
+    the imported shifts and assignments rather than copied. Returns the
+    "inserted" and "skipped" row counts per table. A row whose id is stored as
+    a different record raises ValueError; that table is left untouched and
+    the tables after it are not imported (see DatabaseManager.bulk_import).
+    """
+    counts = {}
+    rebuild_dates: List[date] = []
+    for name in tables:
+        table = ARCHIVE_TABLES[name]
+        if not table.import_table:
+            raise ValueError(f"{name} is derived and cannot be imported; rebuild it instead")
+        if not (Path(directory) / name).exists():
+            logger.warning(f"No {name} dataset in {directory}")
+            continue
+        dataset = open_dataset(directory, name)
+        expression = _date_filter(table, start_date, end_date)
+        counts[name] = db_manager.bulk_import(
+            table.import_table, table.import_columns, _import_batches(dataset, table, expression, batch_size))
+
+        if name in ("shifts", "shift_assignments") and counts[name]["inserted"]:
+            dates = dataset.to_table(columns=["date"], filter=expression).column("date")
+            rebuild_dates += [pc.min(dates).as_py(), pc.max(dates).as_py()]
+
+    # Rollups once every table is in, since they join shifts with assignments
+    if rebuild_dates:
+        db_manager.rebuild_labor_rollups(min(rebuild_dates), max(rebuild_dates))
+    return counts
+
+def main():
+    """Command line entry point for archive export and import"""
+    parser = argparse.ArgumentParser(description="Export or import the Parquet history archive")
+    parser.add_argument("action", choices=["export", "import"])
+    parser.add_argument("--db", default="shifts.db", help="Database file")
+    parser.add_argument("--dir", required=True, help="Archive directory")
+    parser.add_argument("--start", type=date.fromisoformat, help="First date (YYYY-MM-DD, default: all)")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last date (YYYY-MM-DD, default: all)")
+    parser.add_argument("--tables", nargs="*", choices=list(ARCHIVE_TABLES), help="Tables (default: all)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    started = timer.perf_counter()
+    db_manager = DatabaseManager(args.db)
+    if args.action == "export":
+        counts = export_archive(db_manager, args.dir, args.start, args.end,
+                                args.tables or tuple(ARCHIVE_TABLES))
+        summary = ", ".join(f"{count} {name}" for name, count in counts.items())
+    else:
+        try:
+            counts = import_archive(db_manager, args.dir, args.start, args.end,
+                                    args.tables or IMPORT_TABLES)
+        except ValueError as e:
+            print(f"Import failed: {e}")
+            return 1
+        summary = ", ".join(f"{count['inserted']} {name} ({count['skipped']} already stored)"
+                            for name, count in counts.items())
+    print(f"{args.action.capitalize()}ed {summary} in {timer.perf_counter() - started:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,141 @@
+"""
+Report result cache for Restaurant Shift Management System
+
+Results are cached per (report, parameters) together with the data versions
+of the scopes the report reads ("employees", "templates", "shifts",
+"settings"). DatabaseManager bumps a scope's version in the same transaction
+as every write to it, so an entry is reused only while nothing it depends on
+has changed. Entries are held in LRU order under an approximate memory cap.
+"""
+
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Set, Tuple
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory held by a result
+
+    pandas and NumPy objects report their own deep usage. Containers, mappings
+    (including sqlite3.Row) and plain objects such as the model dataclasses are
+    walked recursively, counting each object once.
+    """
+    return _estimate_size(value, set())
+
+def _estimate_size(value: Any, seen: Set[int]) -> int:
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        # pandas DataFrame, Series and Index; deep includes object column contents
+        usage = memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    if isinstance(getattr(value, "nbytes", None), int):
+        # NumPy arrays and other buffers that know their size
+        return max(sys.getsizeof(value), value.nbytes)
+
+    size = sys.getsizeof(value)
+    if value is None or isinstance(value, (str, bytes, bytearray, int, float, Enum, type)):
+        # Enum members and classes are shared, not owned by the result
+        return size
+    if isinstance(value, Mapping):
+        size += sum(_estimate_size(key, seen) + _estimate_size(item, seen) for key, item in value.items())
+    elif isinstance(value, sqlite3.Row):
+        size += sum(_estimate_size(item, seen) for item in value)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_estimate_size(item, seen) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += _estimate_size(vars(value), seen)
+    return size
+
+@dataclass
+class _CacheEntry:
+    versions: Tuple[int, ...]
+    value: Any
+    size: int
+
+class ReportCache:
+    """LRU cache of report results invalidated by data version counters
+
+    Cached values are shared between callers and must not be modified.
+    """
+
+    def __init__(self, version_provider: Callable[[Sequence[str]], Tuple[int, ...]],
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.version_provider = version_provider
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, Hashable], _CacheEntry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, report: str, params: Hashable, scopes: Sequence[str],
+                       compute: Callable[[], Any]) -> Any:
+        """Return the cached result for report and params, computing it if stale
+
+        scopes lists the data the report reads; the result is recomputed once
+        any of their versions has moved since it was cached.
+        """
+        key = (report, params)
+        versions = self.version_provider(scopes)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry.versions == versions:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            self.misses += 1
+
+        # Compute outside the lock; a write during compute leaves this entry
+        # under the older versions, so the next lookup recomputes it
+        value = compute()
+        size = estimate_size(value)
+        with self._lock:
+            self._discard(key)
+            if size <= self.max_bytes:
+                self._entries[key] = _CacheEntry(versions, value, size)
+                self._size += size
+                while self._size > self.max_bytes:
+                    oldest = next(iter(self._entries))
+                    self._discard(oldest)
+                    self.evictions += 1
+        return value
+
+    def _discard(self, key: Tuple[str, Hashable]):
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._size -= entry.size
+
+    def invalidate(self, report: Optional[str] = None):
+        """Drop every entry of one report, or everything when report is None"""
+        with self._lock:
+            for key in [key for key in self._entries if report is None or key[0] == report]:
+                self._discard(key)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get entry count, size and hit/miss/eviction counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
@@ -0,0 +1,36 @@
+"""
+Labor rollup maintenance for Restaurant Shift Management System
+
+Shift writes keep the labor_daily_rollup and labor_weekly_rollup tables current.
+This command rebuilds them from stored assignments, for backfills, imported
+history, or after overtime settings or template thresholds change.
+
+Usage:
+    python -m database.rollups --db shifts.db --start 2024-01-01 --end 2024-12-31
+"""
+
+import argparse
+import logging
+import time as timer
+from datetime import date
+
+from database.db_manager import DatabaseManager
+
+def main():
+    """Command line entry point for rebuilding labor rollups"""
+    parser = argparse.ArgumentParser(description="Rebuild labor rollup tables from stored shifts")
+    parser.add_argument("--db", default="shifts.db", help="Database file")
+    parser.add_argument("--start", type=date.fromisoformat, help="First date (YYYY-MM-DD, default: first shift)")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last date (YYYY-MM-DD, default: last shift)")
+    parser.add_argument("--weeks-per-batch", type=int, default=13, help="Weeks rebuilt per transaction")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    started = timer.perf_counter()
+    weeks = DatabaseManager(args.db).rebuild_labor_rollups(args.start, args.end, args.weeks_per_batch)
+    print(f"Rebuilt {weeks} weeks of labor rollups in {timer.perf_counter() - started:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
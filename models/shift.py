@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime, date, time, timedelta
-from typing import List, Optional, Dict, Set
+from typing import List, Optional, Dict, Set, Tuple, Callable
 from enum import Enum
 from .employee import Position, Employee
 
@@ -27,6 +27,36 @@ class WeekDay(Enum):
     SATURDAY = 5
     SUNDAY = 6
 
+@dataclass
+class OvertimeRules:
+    daily_threshold_hours: float = 8.0
+    weekly_threshold_hours: float = 40.0
+    overtime_multiplier: float = 1.5
+    
+    def split_hours(self, worked: List[Tuple[date, float, Optional[float]]]) -> List[Tuple[float, float]]:
+        """Split one employee's chronological (date, hours, daily threshold) entries into
+        (regular, overtime) hours. Daily overtime is applied first; only the remaining
+        regular hours count toward the weekly threshold."""
+        split = []
+        day_hours: Dict[date, float] = {}
+        week_regular_hours: Dict[date, float] = {}
+        
+        for work_date, hours, daily_threshold in worked:
+            threshold = self.daily_threshold_hours if daily_threshold is None else daily_threshold
+            before = day_hours.get(work_date, 0.0)
+            day_hours[work_date] = before + hours
+            daily_overtime = max(0.0, before + hours - threshold) - max(0.0, before - threshold)
+            regular = hours - daily_overtime
+            
+            week_start = work_date - timedelta(days=work_date.weekday())
+            week_before = week_regular_hours.get(week_start, 0.0)
+            week_regular_hours[week_start] = week_before + regular
+            weekly_overtime = (max(0.0, week_before + regular - self.weekly_threshold_hours) -
+                               max(0.0, week_before - self.weekly_threshold_hours))
+            
+            split.append((regular - weekly_overtime, daily_overtime + weekly_overtime))
+        return split
+
 @dataclass
 class PositionRequirement:
     position: Position
@@ -40,6 +70,7 @@ class PositionRequirement:
 class ShiftTemplate:
     id: Optional[int] = None
     name: str = ""
+    location_id: Optional[int] = None
     shift_type: ShiftType = ShiftType.MORNING
     start_time: time = time(9, 0)
     end_time: time = time(17, 0)
@@ -110,11 +141,17 @@ class ShiftAssignment:
             
         duration_minutes = end_minutes - start_minutes
         return duration_minutes / 60
+    
+    def get_interval(self, shift_date: date) -> Tuple[datetime, datetime]:
+        """Get absolute start and end of the assignment for a shift date"""
+        start = datetime.combine(shift_date, self.start_time)
+        return start, start + timedelta(hours=self.duration_hours)
 
 @dataclass
 class Shift:
     id: Optional[int] = None
     template_id: Optional[int] = None
+    location_id: Optional[int] = None
     date: date = field(default_factory=date.today)
     start_time: time = time(9, 0)
     end_time: time = time(17, 0)
@@ -174,11 +211,25 @@ class Shift:
             position_count[position] = position_count.get(position, 0) + 1
         return position_count
     
-    @property
-    def is_understaffed(self) -> bool:
-        """Check if shift is understaffed based on template requirements"""
-        # This would need template requirements to compare against
-        return self.total_scheduled_employees < 3  # Basic check
+    def is_understaffed(self, template: Optional[ShiftTemplate] = None) -> bool:
+        """Check whether any position is below the template's minimum
+        
+        Without a template the requirements are unknown, so only a shift with
+        nobody assigned counts as understaffed.
+        """
+        if template is None:
+            return not self.assignments
+        return bool(self.get_understaffed_positions(template))
+    
+    def get_understaffed_positions(self, template: ShiftTemplate) -> Dict[Position, int]:
+        """Get missing headcount per position against template minimums"""
+        filled = self.positions_filled
+        missing = {}
+        for req in template.position_requirements:
+            shortfall = req.minimum_required - filled.get(req.position, 0)
+            if shortfall > 0:
+                missing[req.position] = shortfall
+        return missing
     
     def get_employee_assignment(self, employee_id: int) -> Optional[ShiftAssignment]:
         """Get assignment for specific employee"""
@@ -187,7 +238,9 @@ class Shift:
                 return assignment
         return None
     
-    def calculate_labor_cost(self, employees: List[Employee]) -> float:
+    def calculate_labor_cost(self, employees: List[Employee], 
+                             overtime_threshold_hours: float = 8.0,
+                             overtime_multiplier: float = 1.5) -> float:
         """Calculate total labor cost for this shift"""
         total_cost = 0.0
         employee_dict = {emp.id: emp for emp in employees}
@@ -195,19 +248,26 @@ class Shift:
         for assignment in self.assignments:
             employee = employee_dict.get(assignment.employee_id)
             if employee:
-                hours = assignment.duration_hours
-                regular_hours = min(hours, 8.0)
-                overtime_hours = max(0, hours - 8.0)
-                
-                cost = (regular_hours * employee.hourly_wage + 
-                       overtime_hours * employee.hourly_wage * 1.5)
-                total_cost += cost
+                total_cost += self.calculate_assignment_cost(
+                    assignment, employee.hourly_wage, overtime_threshold_hours, overtime_multiplier)
         
         return total_cost
     
+    @staticmethod
+    def calculate_assignment_cost(assignment: ShiftAssignment, hourly_wage: float,
+                                  overtime_threshold_hours: float = 8.0,
+                                  overtime_multiplier: float = 1.5) -> float:
+        """Calculate labor cost of one assignment at the given wage"""
+        hours = assignment.duration_hours
+        regular_hours = min(hours, overtime_threshold_hours)
+        overtime_hours = max(0, hours - overtime_threshold_hours)
+        
+        return (regular_hours * hourly_wage + 
+                overtime_hours * hourly_wage * overtime_multiplier)
+    
     def add_assignment(self, employee_id: int, position: Position, 
                       start_time: Optional[time] = None, 
-                      end_time: Optional[time] = None):
+                      end_time: Optional[time] = None) -> ShiftAssignment:
         """Add employee assignment to shift"""
         assignment = ShiftAssignment(
             employee_id=employee_id,
@@ -216,11 +276,21 @@ class Shift:
             end_time=end_time or self.end_time
         )
         self.assignments.append(assignment)
+        return assignment
     
     def remove_assignment(self, employee_id: int):
         """Remove employee assignment from shift"""
         self.assignments = [a for a in self.assignments if a.employee_id != employee_id]
 
+@dataclass
+class ScheduleChange:
+    kind: str  # "added", "removed", "recosted" or "reset"
+    shift: Optional[Shift] = None
+    assignment: Optional[ShiftAssignment] = None
+    employee_id: Optional[int] = None
+    hours_delta: float = 0.0
+    cost_delta: float = 0.0
+
 @dataclass 
 class WeeklySchedule:
     id: Optional[int] = None
@@ -242,6 +312,25 @@ class WeeklySchedule:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     
+    # Overtime rules used for running labor costs
+    overtime_rules: OvertimeRules = field(default_factory=OvertimeRules)
+    
+    # Maintained indexes; kept current by add_shift / add_assignment / remove_assignment
+    _employee_assignments: Dict[int, List[Tuple[Shift, ShiftAssignment]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _employee_hours: Dict[int, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _employee_costs: Dict[int, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _employee_overtime: Dict[int, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _hourly_wages: Dict[int, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _overtime_thresholds: Dict[int, Optional[float]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _listeners: List[Callable[[ScheduleChange], None]] = field(
+        default_factory=list, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.shifts:
+            self.reindex()
+    
     @property
     def week_end_date(self) -> date:
         """Get end date of the week"""
@@ -256,26 +345,164 @@ class WeeklySchedule:
         """Get all shifts for specific date"""
         return self.shifts.get(target_date, [])
     
+    def reindex(self):
+        """Rebuild indexes after shifts or assignments were changed directly"""
+        self._employee_assignments = {}
+        self._employee_hours = {}
+        self._employee_costs = {}
+        self._employee_overtime = {}
+        self.total_labor_hours = 0.0
+        self.total_labor_cost = 0.0
+        # Listeners drop their totals and rebuild from the "added" changes that follow
+        self._notify(ScheduleChange("reset"))
+        for shifts_list in self.shifts.values():
+            for shift in shifts_list:
+                for assignment in shift.assignments:
+                    self._index_assignment(shift, assignment)
+    
+    def set_employees(self, employees: List[Employee]):
+        """Register employee wages used for running labor costs"""
+        for employee in employees:
+            # Re-cost only the employees whose wage changed
+            if self._hourly_wages.get(employee.id) != employee.hourly_wage:
+                self._hourly_wages[employee.id] = employee.hourly_wage
+                self._notify_recost(employee.id, self._recost_employee(employee.id))
+    
+    def set_templates(self, templates_by_id: Dict[int, ShiftTemplate]):
+        """Register template daily overtime thresholds used for running labor costs
+        
+        Shifts whose template is not registered use the overtime rules' daily threshold.
+        """
+        changed = False
+        for template_id, template in templates_by_id.items():
+            if self._overtime_thresholds.get(template_id) != template.overtime_threshold_hours:
+                self._overtime_thresholds[template_id] = template.overtime_threshold_hours
+                changed = True
+        if changed:
+            for employee_id in self._employee_assignments:
+                self._notify_recost(employee_id, self._recost_employee(employee_id))
+    
+    def get_daily_threshold(self, shift: Shift) -> Optional[float]:
+        """Daily overtime threshold of a shift's template; None means the rules' default"""
+        return self._overtime_thresholds.get(shift.template_id)
+    
+    def split_overtime(self, entries: List[Tuple[Shift, ShiftAssignment]]) -> List[Tuple[float, float]]:
+        """Split chronological (shift, assignment) entries of one employee into
+        (regular, overtime) hours with each shift's template threshold"""
+        return self.overtime_rules.split_hours(
+            [(shift.date, assignment.duration_hours, self.get_daily_threshold(shift))
+             for shift, assignment in entries])
+    
+    def set_overtime_rules(self, overtime_rules: OvertimeRules):
+        """Change overtime rules and re-cost every scheduled employee"""
+        self.overtime_rules = overtime_rules
+        for employee_id in self._employee_assignments:
+            self._notify_recost(employee_id, self._recost_employee(employee_id))
+    
+    def add_listener(self, listener: Callable[[ScheduleChange], None]):
+        """Call listener with a ScheduleChange after every assignment or cost change"""
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener: Callable[[ScheduleChange], None]):
+        """Stop calling a listener"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _notify(self, change: ScheduleChange):
+        for listener in self._listeners:
+            listener(change)
+    
+    def _notify_recost(self, employee_id: int, cost_delta: float):
+        if cost_delta:
+            self._notify(ScheduleChange("recosted", employee_id=employee_id, cost_delta=cost_delta))
+    
+    def _recost_employee(self, employee_id: int) -> float:
+        """Recompute one employee's weekly cost and overtime; returns the cost change"""
+        entries = sorted(self._employee_assignments.get(employee_id, []),
+                         key=lambda entry: (entry[0].date, entry[1].start_time))
+        split = self.split_overtime(entries)
+        
+        wage = self._hourly_wages.get(employee_id, 0.0)
+        multiplier = self.overtime_rules.overtime_multiplier
+        cost = sum(regular * wage + overtime * wage * multiplier for regular, overtime in split)
+        
+        cost_delta = cost - self._employee_costs.get(employee_id, 0.0)
+        self.total_labor_cost += cost_delta
+        self._employee_costs[employee_id] = cost
+        self._employee_overtime[employee_id] = sum(overtime for _, overtime in split)
+        return cost_delta
+    
+    def _index_assignment(self, shift: Shift, assignment: ShiftAssignment):
+        """Add assignment to the per-employee indexes and running totals"""
+        employee_id = assignment.employee_id
+        hours = assignment.duration_hours
+        
+        self._employee_assignments.setdefault(employee_id, []).append((shift, assignment))
+        self._employee_hours[employee_id] = self._employee_hours.get(employee_id, 0.0) + hours
+        self.total_labor_hours += hours
+        cost_delta = self._recost_employee(employee_id)
+        if self._listeners:
+            self._notify(ScheduleChange("added", shift, assignment, employee_id, hours, cost_delta))
+    
+    def _unindex_assignment(self, shift: Shift, assignment: ShiftAssignment):
+        """Remove assignment from the per-employee indexes and running totals"""
+        employee_id = assignment.employee_id
+        hours = assignment.duration_hours
+        
+        self._employee_assignments[employee_id] = [
+            entry for entry in self._employee_assignments.get(employee_id, []) if entry[1] is not assignment
+        ]
+        self._employee_hours[employee_id] = self._employee_hours.get(employee_id, 0.0) - hours
+        self.total_labor_hours -= hours
+        cost_delta = self._recost_employee(employee_id)
+        if self._listeners:
+            self._notify(ScheduleChange("removed", shift, assignment, employee_id, -hours, cost_delta))
+    
     def add_shift(self, shift: Shift):
         """Add shift to schedule"""
         if shift.date not in self.shifts:
             self.shifts[shift.date] = []
         self.shifts[shift.date].append(shift)
+        for assignment in shift.assignments:
+            self._index_assignment(shift, assignment)
+    
+    def add_assignment(self, shift: Shift, employee_id: int, position: Position,
+                       start_time: Optional[time] = None,
+                       end_time: Optional[time] = None) -> ShiftAssignment:
+        """Add employee assignment to a shift of this schedule"""
+        assignment = shift.add_assignment(employee_id, position, start_time, end_time)
+        self._index_assignment(shift, assignment)
+        return assignment
+    
+    def remove_assignment(self, shift: Shift, employee_id: int):
+        """Remove employee assignment from a shift of this schedule"""
+        for assignment in shift.assignments:
+            if assignment.employee_id == employee_id:
+                self._unindex_assignment(shift, assignment)
+        shift.remove_assignment(employee_id)
+    
+    def get_employee_assignments(self, employee_id: int) -> List[Tuple[Shift, ShiftAssignment]]:
+        """Get all (shift, assignment) pairs for employee this week"""
+        return list(self._employee_assignments.get(employee_id, []))
     
     def get_employee_total_hours(self, employee_id: int) -> float:
         """Get total scheduled hours for employee this week"""
-        total_hours = 0.0
-        for shifts_list in self.shifts.values():
-            for shift in shifts_list:
-                assignment = shift.get_employee_assignment(employee_id)
-                if assignment:
-                    total_hours += assignment.duration_hours
-        return total_hours
+        return self._employee_hours.get(employee_id, 0.0)
+    
+    def get_employee_labor_cost(self, employee_id: int) -> float:
+        """Get scheduled labor cost for employee this week"""
+        return self._employee_costs.get(employee_id, 0.0)
+    
+    def get_employee_overtime_hours(self, employee_id: int) -> float:
+        """Get scheduled overtime hours for employee this week"""
+        return self._employee_overtime.get(employee_id, 0.0)
+    
+    def get_hourly_wage(self, employee_id: int) -> float:
+        """Get the registered hourly wage of an employee"""
+        return self._hourly_wages.get(employee_id, 0.0)
     
-    def calculate_weekly_labor_cost(self, employees: List[Employee]) -> float:
+    def calculate_weekly_labor_cost(self, employees: Optional[List[Employee]] = None) -> float:
         """Calculate total labor cost for the week"""
-        total_cost = 0.0
-        for shifts_list in self.shifts.values():
-            for shift in shifts_list:
-                total_cost += shift.calculate_labor_cost(employees)
-        return total_cost 
\ No newline at end of file
+        if employees is not None:
+            self.set_employees(employees)
+        return self.total_labor_cost
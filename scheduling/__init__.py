@@ -0,0 +1 @@
+# Scheduling package for Restaurant Shift Management System 
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""
+Batch schedule solving for Restaurant Shift Management System
+
+Every database and week is an independent scheduling problem, so a batch is split
+into shards that are solved in parallel worker processes. Locations of one database
+share their employees, so a shard schedules its locations one after another and each
+sees the assignments stored by the previous ones. Each worker opens its own
+DatabaseManager connection; nothing is shared between processes.
+
+Usage:
+    python -m scheduling.batch --db shifts.db --week 2024-07-01 --weeks 4 --locations 1 2 3
+"""
+
+import argparse
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List, Optional, Callable, Sequence, Tuple
+
+from database.db_manager import DatabaseManager
+from scheduling.scheduler import ShiftScheduler
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class ScheduleShard:
+    db_path: str
+    week_start: date
+    # Scheduled in order; None schedules all locations at once
+    location_ids: Tuple[Optional[int], ...] = (None,)
+
+    @property
+    def label(self) -> str:
+        if self.location_ids == (None,):
+            locations = "all locations"
+        else:
+            locations = "locations " + ", ".join(str(location_id) for location_id in self.location_ids)
+        return f"{os.path.basename(self.db_path)} / {locations} / week of {self.week_start}"
+
+@dataclass
+class ShardResult:
+    shard: ScheduleShard
+    shift_count: int = 0
+    assignment_count: int = 0
+    labor_hours: float = 0.0
+    labor_cost: float = 0.0
+    elapsed_seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+def build_shards(db_paths: Sequence[str], week_starts: Sequence[date],
+                 location_ids: Optional[Sequence[Optional[int]]] = None) -> List[ScheduleShard]:
+    """Create one shard per database and week, covering all requested locations
+
+    Locations are not split into separate shards: employees work at every
+    location, and solving two locations of one database in parallel would book
+    the same people into overlapping shifts.
+    """
+    location_ids = tuple(location_ids or [None])
+    return [
+        ScheduleShard(db_path, week_start, location_ids)
+        for db_path in db_paths
+        for week_start in week_starts
+    ]
+
+def solve_shard(shard: ScheduleShard) -> ShardResult:
+    """Solve a single shard; runs inside a worker process"""
+    started = time.perf_counter()
+    try:
+        db_manager = DatabaseManager(shard.db_path)
+        scheduler = ShiftScheduler(db_manager)
+        result = ShardResult(shard=shard)
+        for location_id in shard.location_ids:
+            schedule = scheduler.schedule_week(shard.week_start, location_id)
+            shifts = [shift for shifts_list in schedule.shifts.values() for shift in shifts_list]
+            result.shift_count += len(shifts)
+            result.assignment_count += sum(shift.total_scheduled_employees for shift in shifts)
+            result.labor_hours += schedule.total_labor_hours
+            result.labor_cost += schedule.total_labor_cost
+        result.elapsed_seconds = time.perf_counter() - started
+        return result
+    except Exception as e:
+        return ShardResult(shard=shard, elapsed_seconds=time.perf_counter() - started, error=str(e))
+
+def run_batch_schedule(shards: Sequence[ScheduleShard], max_workers: Optional[int] = None,
+                       progress_callback: Optional[Callable[[int, int, ShardResult], None]] = None
+                       ) -> List[ShardResult]:
+    """Solve all shards across worker processes and report per-shard progress
+
+    progress_callback receives (completed, total, result) as each shard finishes.
+    Results are returned in the same order as the shards.
+    """
+    total = len(shards)
+    if total == 0:
+        return []
+
+    max_workers = min(max_workers or os.cpu_count() or 1, total)
+    started = time.perf_counter()
+    results: List[Optional[ShardResult]] = [None] * total
+
+    def record(index: int, result: ShardResult, completed: int):
+        results[index] = result
+        if result.succeeded:
+            logger.info(f"[{completed}/{total}] {result.shard.label}: {result.assignment_count} assignments "
+                        f"in {result.elapsed_seconds:.2f}s")
+        else:
+            logger.error(f"[{completed}/{total}] {result.shard.label} failed: {result.error}")
+        if progress_callback:
+            progress_callback(completed, total, result)
+
+    if max_workers == 1:
+        # Solve inline; avoids process start-up cost for tiny batches
+        for index, shard in enumerate(shards):
+            record(index, solve_shard(shard), index + 1)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(solve_shard, shard): index for index, shard in enumerate(shards)}
+            for completed, future in enumerate(as_completed(futures), start=1):
+                record(futures[future], future.result(), completed)
+
+    elapsed = time.perf_counter() - started
+    busy_time = sum(result.elapsed_seconds for result in results)
+    logger.info(
+        f"Solved {total} shards with {max_workers} workers in {elapsed:.2f}s "
+        f"({total / elapsed:.1f} shards/s, parallel speedup {busy_time / elapsed:.1f}x)"
+    )
+    return results
+
+def main():
+    """Command line entry point for batch scheduling"""
+    parser = argparse.ArgumentParser(description="Solve schedules for many locations and weeks in parallel")
+    parser.add_argument("--db", nargs="+", default=["shifts.db"], help="Database file(s), one per restaurant")
+    parser.add_argument("--week", required=True, type=date.fromisoformat, help="First week start date (YYYY-MM-DD)")
+    parser.add_argument("--weeks", type=int, default=1, help="Number of consecutive weeks to schedule")
+    parser.add_argument("--locations", nargs="*", type=int, help="Location IDs inside each database")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    week_starts = [args.week + timedelta(weeks=i) for i in range(args.weeks)]
+    shards = build_shards(args.db, week_starts, args.locations)
+    results = run_batch_schedule(shards, args.workers)
+
+    failed = [result for result in results if not result.succeeded]
+    print(f"Scheduled {len(results) - len(failed)}/{len(results)} shards, "
+          f"${sum(result.labor_cost for result in results):.2f} total labor cost")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
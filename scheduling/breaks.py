@@ -0,0 +1,183 @@
+"""
+Break planning for Restaurant Shift Management System
+
+This module places each assignment's lunch and rest break from the template's
+lunch_duration_minutes and break_duration_minutes. Breaks are staggered on the
+coverage timeline: every placed break takes one person of that position off the
+floor for its slots, later breaks see the reduced headcount, and candidate start
+times are scored in one vectorized pass per break. The floor never drops below
+minimum_break_coverage; rush windows and going under template minimums are avoided
+when possible.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional, Dict, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from database.db_manager import DatabaseManager
+from models.shift import Shift, ShiftTemplate, ShiftAssignment, WeeklySchedule
+from scheduling.coverage import CoverageEngine, CoverageTimeline, POSITION_INDEX
+
+logger = logging.getLogger(__name__)
+
+# Assignments at least this long get a lunch / a rest break
+LUNCH_MIN_SHIFT_HOURS = 6.0
+BREAK_MIN_SHIFT_HOURS = 4.0
+
+@dataclass
+class UnplacedBreak:
+    shift: Shift
+    assignment: ShiftAssignment
+    kind: str  # "lunch" or "break"
+
+@dataclass
+class BreakPlan:
+    placed: int = 0
+    unplaced: List[UnplacedBreak] = field(default_factory=list)
+    in_rush: int = 0  # placed breaks that had to overlap a rush window
+    below_requirement: int = 0  # placed breaks that had to dip under template minimums
+
+class BreakPlanner:
+    """Staggers breaks across shifts using a coverage timeline"""
+
+    def __init__(self, rush_windows: Optional[Dict[str, Tuple[time, time]]] = None, slot_minutes: int = 15):
+        self.rush_windows = rush_windows or {}
+        self.slot_minutes = slot_minutes
+
+    @classmethod
+    def from_settings(cls, db_manager: DatabaseManager, slot_minutes: int = 15) -> "BreakPlanner":
+        """Create planner using the rush windows stored in the database"""
+        return cls(db_manager.get_rush_windows(), slot_minutes)
+
+    def _rush_mask(self, timeline: CoverageTimeline) -> np.ndarray:
+        """Boolean mask of timeline slots inside any rush window"""
+        total_slots = timeline.scheduled.shape[-1]
+        mask = np.zeros(total_slots, dtype=bool)
+        slots_per_day = timeline.slots_per_day
+        for start, end in self.rush_windows.values():
+            first = (start.hour * 60 + start.minute) // self.slot_minutes
+            last = -(-(end.hour * 60 + end.minute) // self.slot_minutes)
+            for offset in range(0, total_slots, slots_per_day):
+                mask[offset + first:offset + last] = True
+        return mask
+
+    def plan_shifts(self, shifts: List[Shift], templates_by_id: Dict[int, ShiftTemplate],
+                    start_date: date, end_date: date) -> BreakPlan:
+        """Replace break_times of every assignment on the given shifts"""
+        plan = BreakPlan()
+        engine = CoverageEngine(self.slot_minutes)
+        timeline = engine.build_timeline(shifts, start_date, end_date, templates_by_id, include_breaks=False)
+        location_index = {location_id: row for row, location_id in enumerate(timeline.location_ids)}
+        rush = self._rush_mask(timeline)
+        # Headcount still on the floor; reduced as breaks are placed
+        floor = timeline.scheduled.copy()
+
+        for shift in sorted(shifts, key=lambda s: (s.date, s.start_time)):
+            template = templates_by_id.get(shift.template_id)
+            if not template or not start_date <= shift.date <= end_date:
+                continue
+            location = location_index[shift.location_id]
+            day_start = datetime.combine(start_date, time(0, 0))
+
+            # Break slots already given to each assignment on this shift
+            taken: Dict[int, List[Tuple[int, int]]] = {}
+            for assignment in shift.assignments:
+                assignment.break_times = []
+                taken[id(assignment)] = []
+
+            # Longest breaks first so they get the widest choice of times
+            for kind, minutes, min_hours in (("lunch", template.lunch_duration_minutes, LUNCH_MIN_SHIFT_HOURS),
+                                             ("break", template.break_duration_minutes, BREAK_MIN_SHIFT_HOURS)):
+                if not minutes:
+                    continue
+                for assignment in shift.assignments:
+                    if assignment.duration_hours < min_hours:
+                        continue
+                    placed = self._place(floor[location, POSITION_INDEX[assignment.position]],
+                                         timeline.required[location, POSITION_INDEX[assignment.position]],
+                                         rush, shift, assignment, kind, minutes,
+                                         template.minimum_break_coverage, day_start,
+                                         taken[id(assignment)], plan)
+                    if not placed:
+                        plan.unplaced.append(UnplacedBreak(shift, assignment, kind))
+
+            for assignment in shift.assignments:
+                assignment.break_times.sort()
+
+        logger.info(f"Placed {plan.placed} breaks ({len(plan.unplaced)} could not be placed)")
+        return plan
+
+    def _place(self, floor: np.ndarray, required: np.ndarray, rush: np.ndarray, shift: Shift,
+               assignment: ShiftAssignment, kind: str, minutes: int, minimum_coverage: int,
+               day_start: datetime, taken: List[Tuple[int, int]], plan: BreakPlan) -> bool:
+        """Pick the best start slot for one break and take the employee off the floor"""
+        start, end = assignment.get_interval(shift.date)
+        start_slot = -(-int((start - day_start).total_seconds() // 60) // self.slot_minutes)
+        end_slot = int((end - day_start).total_seconds() // 60) // self.slot_minutes
+        length = -(-minutes // self.slot_minutes)
+
+        # Lunch stays two hours from either end, rest breaks one hour
+        margin = (120 if kind == "lunch" else 60) // self.slot_minutes
+        first, last = start_slot + margin, end_slot - margin - length
+        if last < first:
+            first, last = start_slot, end_slot - length
+        if last < first:
+            return False
+
+        span = slice(first, last + length)
+        # Never overlap the employee's other breaks, and try to keep an hour between them
+        own_break = np.zeros(last + length - first, dtype=bool)
+        near_break = np.zeros(last + length - first, dtype=bool)
+        gap = 60 // self.slot_minutes
+        for taken_slot, taken_length in taken:
+            own_break[max(taken_slot - first, 0):max(taken_slot + taken_length - first, 0)] = True
+            near_break[max(taken_slot - gap - first, 0):max(taken_slot + taken_length + gap - first, 0)] = True
+
+        windows_floor = sliding_window_view(floor[span] - 1, length)
+        windows_required = sliding_window_view(required[span], length)
+        windows_rush = sliding_window_view(rush[span], length)
+        windows_own = sliding_window_view(own_break, length)
+        windows_near = sliding_window_view(near_break, length)
+
+        valid = (windows_floor.min(axis=1) >= minimum_coverage) & ~windows_own.any(axis=1)
+        if not valid.any():
+            return False
+
+        rush_overlap = windows_rush.sum(axis=1)
+        shortfall = np.maximum(windows_required - windows_floor, 0).sum(axis=1)
+        # Lunch aims for the middle of the assignment, rest breaks for the first third
+        ideal = (start_slot + end_slot - length) / 2 if kind == "lunch" else start_slot + (end_slot - start_slot) / 3
+        distance = np.abs(np.arange(first, last + 1) - ideal)
+        score = (rush_overlap * 1_000_000.0 + shortfall * 1_000.0 +
+                 windows_near.any(axis=1) * 100.0 + distance)
+        choice = int(np.argmin(np.where(valid, score, np.inf)))
+
+        slot = first + choice
+        floor[slot:slot + length] -= 1
+        taken.append((slot, length))
+        break_start = day_start + timedelta(minutes=slot * self.slot_minutes)
+        assignment.break_times.append((break_start.time(), (break_start + timedelta(minutes=minutes)).time()))
+
+        plan.placed += 1
+        plan.in_rush += int(rush_overlap[choice] > 0)
+        plan.below_requirement += int(shortfall[choice] > 0)
+        return True
+
+    def plan_schedule(self, schedule: WeeklySchedule, templates_by_id: Dict[int, ShiftTemplate]) -> BreakPlan:
+        """Place breaks for every shift of a weekly schedule"""
+        shifts = [shift for shifts_list in schedule.shifts.values() for shift in shifts_list]
+        return self.plan_shifts(shifts, templates_by_id, schedule.week_start_date, schedule.week_end_date)
+
+    def plan_stored_week(self, db_manager: DatabaseManager, week_start: date,
+                         location_id: Optional[int] = None) -> BreakPlan:
+        """Place breaks for a stored week and save them"""
+        week_end = week_start + timedelta(days=6)
+        shifts = db_manager.get_shifts(week_start, week_end, location_id)
+        templates_by_id = {template.id: template for template in db_manager.get_all_shift_templates()}
+        plan = self.plan_shifts(shifts, templates_by_id, week_start, week_end)
+        db_manager.update_shifts_assignments(shifts)
+        return plan
@@ -0,0 +1,160 @@
+"""
+Labor budget tracking for Restaurant Shift Management System
+
+LaborBudgetTracker keeps running scheduled-cost totals per location and day and
+per location and week. It listens to WeeklySchedule change events, so every
+assignment change updates the totals in O(1) and alerts fire as configured
+fractions of the budget are crossed. The scheduler uses it to treat the weekly
+labor_budget setting as a hard limit or a soft preference.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import date, timedelta
+from enum import Enum
+from typing import List, Optional, Dict, Tuple, Callable, Sequence
+
+from database.db_manager import DatabaseManager
+from models.shift import ScheduleChange, WeeklySchedule
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ALERT_THRESHOLDS = (0.8, 0.9, 1.0)
+
+class BudgetMode(Enum):
+    SOFT = "Soft"  # prefer staffing that stays within budget
+    HARD = "Hard"  # leave positions open rather than exceed the budget
+
+@dataclass
+class BudgetAlert:
+    scope: str  # "day" or "week"
+    location_id: Optional[int]
+    period_start: date
+    spent: float
+    budget: float
+    threshold: float
+
+    @property
+    def message(self) -> str:
+        location = f"location {self.location_id}" if self.location_id is not None else "all locations"
+        return (f"Labor cost for the {self.scope} of {self.period_start} ({location}) is "
+                f"${self.spent:.2f}, {self.spent / self.budget:.0%} of ${self.budget:.2f} budget")
+
+def week_start_of(target_date: date) -> date:
+    return target_date - timedelta(days=target_date.weekday())
+
+class LaborBudgetTracker:
+    """Running scheduled-cost totals with threshold alerts"""
+
+    def __init__(self, weekly_budget: float, daily_budget: Optional[float] = None,
+                 location_budgets: Optional[Dict[Optional[int], float]] = None,
+                 thresholds: Sequence[float] = DEFAULT_ALERT_THRESHOLDS,
+                 on_alert: Optional[Callable[[BudgetAlert], None]] = None):
+        self.weekly_budget = weekly_budget
+        self.daily_budget = daily_budget
+        self.location_budgets = location_budgets or {}
+        self.thresholds = sorted(thresholds)
+        self.on_alert = on_alert
+
+        self.day_costs: Dict[Tuple[Optional[int], date], float] = {}
+        self.week_costs: Dict[Tuple[Optional[int], date], float] = {}
+        # Highest threshold index already alerted per (scope, location, period)
+        self._alert_levels: Dict[Tuple[str, Optional[int], date], int] = {}
+        self.alerts: List[BudgetAlert] = []
+        # Where re-costing events without a shift are booked
+        self._recost_key: Optional[Tuple[Optional[int], date]] = None
+
+    @classmethod
+    def from_settings(cls, db_manager: DatabaseManager, **kwargs) -> "LaborBudgetTracker":
+        """Create tracker from the weekly labor_budget setting (0 means no budget)"""
+        return cls(db_manager.get_numeric_setting("labor_budget", 0.0), **kwargs)
+
+    def get_weekly_budget(self, location_id: Optional[int]) -> float:
+        return self.location_budgets.get(location_id, self.weekly_budget)
+
+    def get_day_cost(self, location_id: Optional[int], day: date) -> float:
+        return self.day_costs.get((location_id, day), 0.0)
+
+    def get_week_cost(self, location_id: Optional[int], day: date) -> float:
+        return self.week_costs.get((location_id, week_start_of(day)), 0.0)
+
+    def remaining_week_budget(self, location_id: Optional[int], day: date) -> float:
+        """Budget left in the week containing day; infinite when no budget is set"""
+        budget = self.get_weekly_budget(location_id)
+        return budget - self.get_week_cost(location_id, day) if budget > 0 else float("inf")
+
+    def would_exceed(self, location_id: Optional[int], day: date, amount: float) -> bool:
+        """Check if adding amount on a day would go over the daily or weekly budget"""
+        if self.daily_budget and self.get_day_cost(location_id, day) + amount > self.daily_budget:
+            return True
+        return amount > self.remaining_week_budget(location_id, day)
+
+    def add_cost(self, location_id: Optional[int], day: Optional[date], amount: float,
+                 week_start: Optional[date] = None):
+        """Add (or with a negative amount remove) scheduled cost
+
+        Pass day=None with week_start for cost that belongs to a week but no
+        particular day, such as a wage change re-costing existing hours.
+        """
+        week_start = week_start or week_start_of(day)
+        week_key = (location_id, week_start)
+        self.week_costs[week_key] = self.week_costs.get(week_key, 0.0) + amount
+        self._check("week", location_id, week_start, self.week_costs[week_key], self.get_weekly_budget(location_id))
+        if day is not None:
+            day_key = (location_id, day)
+            self.day_costs[day_key] = self.day_costs.get(day_key, 0.0) + amount
+            if self.daily_budget:
+                self._check("day", location_id, day, self.day_costs[day_key], self.daily_budget)
+
+    def _check(self, scope: str, location_id: Optional[int], period_start: date, spent: float, budget: float):
+        """Raise an alert when spending crosses the next threshold"""
+        if budget <= 0:
+            return
+        key = (scope, location_id, period_start)
+        level = sum(1 for threshold in self.thresholds if spent >= budget * threshold)
+        previous = self._alert_levels.get(key, 0)
+        self._alert_levels[key] = level
+        if level > previous:
+            alert = BudgetAlert(scope, location_id, period_start, spent, budget, self.thresholds[level - 1])
+            self.alerts.append(alert)
+            logger.warning(alert.message)
+            if self.on_alert:
+                self.on_alert(alert)
+
+    def watch(self, schedule: WeeklySchedule, location_id: Optional[int] = None):
+        """Load a schedule's current cost and follow its changes
+
+        Existing cost is attributed to days the way the schedule splits it, with
+        each template's daily overtime threshold, so it adds up with the change
+        deltas that follow and with ShiftScheduler.estimate_added_cost;
+        location_id is used for changes that carry no shift (re-costing).
+        """
+        rules = schedule.overtime_rules
+        employee_ids = {assignment.employee_id
+                        for shifts_list in schedule.shifts.values()
+                        for shift in shifts_list
+                        for assignment in shift.assignments}
+
+        for employee_id in employee_ids:
+            entries = sorted(schedule.get_employee_assignments(employee_id),
+                             key=lambda entry: (entry[0].date, entry[1].start_time))
+            wage = schedule.get_hourly_wage(employee_id)
+            split = schedule.split_overtime(entries)
+            for (shift, _), (regular, overtime) in zip(entries, split):
+                self.add_cost(shift.location_id, shift.date,
+                              wage * regular + wage * overtime * rules.overtime_multiplier)
+
+        self._recost_key = (location_id, schedule.week_start_date)
+        schedule.add_listener(self.on_change)
+
+    def on_change(self, change: ScheduleChange):
+        """Apply one WeeklySchedule change event"""
+        if change.kind == "reset":
+            self.day_costs.clear()
+            self.week_costs.clear()
+            self._alert_levels.clear()
+        elif change.shift is not None:
+            self.add_cost(change.shift.location_id, change.shift.date, change.cost_delta)
+        elif change.cost_delta and self._recost_key:
+            location_id, week_start = self._recost_key
+            self.add_cost(location_id, None, change.cost_delta, week_start)
@@ -0,0 +1,351 @@
+"""
+Schedule conflict detection for Restaurant Shift Management System
+
+This module detects double-booking, overlapping shifts, cannot_work_with pairs,
+rest-time violations and weekly hour limits. Assignments are indexed per employee
+by start time and forbidden pairs are kept in a symmetric bitset graph, so
+validating a whole WeeklySchedule is near-linear and single adds/removes are
+re-validated incrementally.
+"""
+
+from bisect import bisect_left
+from itertools import count
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import List, Optional, Dict, Set, Tuple, FrozenSet, Iterable
+
+from database.db_manager import DatabaseManager
+from models.employee import Employee
+from models.shift import Shift, ShiftAssignment, WeeklySchedule
+
+DEFAULT_MIN_REST_HOURS = 8.0
+
+class ConflictType(Enum):
+    DOUBLE_BOOKING = "Double Booking"
+    OVERLAPPING_SHIFTS = "Overlapping Shifts"
+    CANNOT_WORK_WITH = "Cannot Work With"
+    INSUFFICIENT_REST = "Insufficient Rest"
+    MAX_HOURS_EXCEEDED = "Max Hours Exceeded"
+
+@dataclass(frozen=True)
+class Conflict:
+    conflict_type: ConflictType
+    employee_id: int
+    shift_date: date
+    other_employee_id: Optional[int] = None
+    message: str = ""
+    # Assignments involved; the conflict disappears when any of them is removed
+    assignment_keys: FrozenSet[int] = field(default_factory=frozenset, compare=False, repr=False)
+
+def week_start_for(target_date: date) -> date:
+    """Get the Monday of the week containing target_date"""
+    return target_date - timedelta(days=target_date.weekday())
+
+class ConflictGraph:
+    """Symmetric cannot_work_with graph with one adjacency bitset per employee
+
+    Employee ids map to bit positions; each employee's row is a Python int with
+    the bits of everyone they cannot work with set. A pair check is one shift and
+    mask, and a crew check ORs one row per member.
+    """
+
+    def __init__(self, pairs: Iterable[Tuple[int, int]] = ()):
+        self._bit_index: Dict[int, int] = {}
+        self._rows: List[int] = []
+        for employee_id, other_id in pairs:
+            self.add_pair(employee_id, other_id)
+
+    @classmethod
+    def from_employees(cls, employees: Iterable[Employee]) -> "ConflictGraph":
+        """Build graph from each employee's cannot_work_with list"""
+        graph = cls()
+        graph.add_employees(employees)
+        return graph
+
+    @classmethod
+    def from_database(cls, db_manager: DatabaseManager) -> "ConflictGraph":
+        """Build graph from the stored conflict pair table"""
+        return cls(db_manager.get_employee_conflict_pairs())
+
+    def _bit(self, employee_id: int) -> int:
+        """Get an employee's bit position, registering new employees"""
+        if employee_id not in self._bit_index:
+            self._bit_index[employee_id] = len(self._rows)
+            self._rows.append(0)
+        return self._bit_index[employee_id]
+
+    def add_employees(self, employees: Iterable[Employee]):
+        """Add the cannot_work_with pairs listed on employees"""
+        for emp in employees:
+            for other_id in emp.cannot_work_with:
+                self.add_pair(emp.id, other_id)
+
+    def add_pair(self, employee_id: int, other_id: int):
+        """Mark two employees as unable to work together, in both directions"""
+        if employee_id == other_id:
+            return
+        first, second = self._bit(employee_id), self._bit(other_id)
+        self._rows[first] |= 1 << second
+        self._rows[second] |= 1 << first
+
+    def remove_pair(self, employee_id: int, other_id: int):
+        """Allow two employees to work together again"""
+        first, second = self._bit_index.get(employee_id), self._bit_index.get(other_id)
+        if first is None or second is None:
+            return
+        self._rows[first] &= ~(1 << second)
+        self._rows[second] &= ~(1 << first)
+
+    def conflicts(self, employee_id: int, other_id: int) -> bool:
+        """Check if two employees must not work together"""
+        first, second = self._bit_index.get(employee_id), self._bit_index.get(other_id)
+        if first is None or second is None:
+            return False
+        return bool((self._rows[first] >> second) & 1)
+
+    def crew_mask(self, employee_ids: Iterable[int]) -> int:
+        """Get the bitset of a crew; employees without conflicts contribute nothing"""
+        mask = 0
+        for employee_id in employee_ids:
+            bit = self._bit_index.get(employee_id)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def conflicts_with_crew(self, employee_id: int, crew_mask: int) -> bool:
+        """Check if an employee conflicts with anyone in a crew bitset"""
+        bit = self._bit_index.get(employee_id)
+        return bit is not None and bool(self._rows[bit] & crew_mask)
+
+    def is_valid_crew(self, employee_ids: Iterable[int]) -> bool:
+        """Check that no two employees of a crew conflict"""
+        members = [employee_id for employee_id in employee_ids if employee_id in self._bit_index]
+        mask = self.crew_mask(members)
+        return not any(self._rows[self._bit_index[employee_id]] & mask for employee_id in members)
+
+    def get_conflicting_ids(self, employee_id: int) -> List[int]:
+        """Get everyone an employee cannot work with"""
+        bit = self._bit_index.get(employee_id)
+        if bit is None:
+            return []
+        row = self._rows[bit]
+        return [other_id for other_id, other_bit in self._bit_index.items() if (row >> other_bit) & 1]
+
+class IntervalIndex:
+    """Intervals of one employee sorted by start time
+
+    Queries bisect on the start times and only scan back as far as the longest
+    stored interval, so lookups cost O(log n + matches).
+    """
+
+    def __init__(self):
+        self._starts: List[datetime] = []
+        self._entries: List[Tuple[datetime, datetime, int]] = []
+        self._max_length = timedelta(0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, start: datetime, end: datetime, key: int):
+        """Add interval identified by key"""
+        entry = (start, end, key)
+        index = bisect_left(self._entries, entry)
+        self._entries.insert(index, entry)
+        self._starts.insert(index, start)
+        self._max_length = max(self._max_length, end - start)
+
+    def remove(self, start: datetime, end: datetime, key: int):
+        """Remove interval identified by key"""
+        index = bisect_left(self._entries, (start, end, key))
+        if index < len(self._entries) and self._entries[index] == (start, end, key):
+            del self._entries[index]
+            del self._starts[index]
+
+    def overlapping(self, start: datetime, end: datetime) -> List[Tuple[datetime, datetime, int]]:
+        """Get intervals intersecting [start, end)"""
+        low = bisect_left(self._starts, start - self._max_length)
+        high = bisect_left(self._starts, end)
+        return [entry for entry in self._entries[low:high] if entry[1] > start]
+
+class ScheduleValidator:
+    """Validates schedules and keeps conflicts current as assignments change"""
+
+    def __init__(self, employees: List[Employee], min_rest_hours: float = DEFAULT_MIN_REST_HOURS,
+                 conflict_graph: Optional[ConflictGraph] = None):
+        self.employees = {emp.id: emp for emp in employees}
+        self.min_rest = timedelta(hours=min_rest_hours)
+        self.conflict_graph = conflict_graph or ConflictGraph.from_employees(employees)
+        # Assignments stored outside the validated schedule, e.g. other locations
+        self._preloaded: List[Tuple[Shift, ShiftAssignment]] = []
+
+        self.reset()
+
+    def reset(self):
+        """Clear all indexed assignments and conflicts, keeping preloaded assignments"""
+        self._timelines: Dict[int, IntervalIndex] = {}
+        self._shift_members: Dict[int, Dict[int, List[int]]] = {}
+        # Keeps the indexed assignment objects alive so their id() keys stay unique
+        self._indexed: Dict[int, Tuple[Shift, ShiftAssignment]] = {}
+        self._weekly_hours: Dict[Tuple[int, date], float] = {}
+        # Conflicts by serial number, plus the serials each assignment key takes part in
+        self._conflicts: Dict[int, Conflict] = {}
+        self._conflicts_by_key: Dict[int, Set[int]] = {}
+        self._serials = count()
+        self._hour_conflicts: Dict[Tuple[int, date], Conflict] = {}
+        for shift, assignment in self._preloaded:
+            self._index(shift, assignment, id(assignment))
+
+    def preload(self, shifts: Iterable[Shift]):
+        """Index assignments of shifts outside the schedule being validated
+
+        Employees are shared between locations, so a location's schedule must see
+        the work already stored elsewhere. Preloaded assignments count towards
+        overlaps, rest time and weekly hours of new assignments, survive reset and
+        validate, and produce no conflicts of their own.
+        """
+        for shift in shifts:
+            for assignment in shift.assignments:
+                self._preloaded.append((shift, assignment))
+                self._index(shift, assignment, id(assignment))
+
+    @property
+    def conflicts(self) -> List[Conflict]:
+        """Get all current conflicts"""
+        return list(self._conflicts.values()) + list(self._hour_conflicts.values())
+
+    def is_forbidden_pair(self, employee_id: int, other_id: int) -> bool:
+        """Check if two employees must not work together"""
+        return self.conflict_graph.conflicts(employee_id, other_id)
+
+    def validate(self, schedule: WeeklySchedule) -> List[Conflict]:
+        """Validate a whole schedule from scratch"""
+        self.reset()
+        for shift_date in sorted(schedule.shifts):
+            for shift in schedule.shifts[shift_date]:
+                for assignment in shift.assignments:
+                    self.add_assignment(shift, assignment)
+        return self.conflicts
+
+    def check_assignment(self, shift: Shift, assignment: ShiftAssignment) -> List[Conflict]:
+        """Get conflicts an assignment would cause, without indexing it"""
+        conflicts, hour_conflict = self._find_conflicts(shift, assignment, id(assignment))
+        return conflicts + [hour_conflict] if hour_conflict else conflicts
+
+    def add_assignment(self, shift: Shift, assignment: ShiftAssignment) -> List[Conflict]:
+        """Index an assignment and return the conflicts it introduced"""
+        key = id(assignment)
+        conflicts, hour_conflict = self._find_conflicts(shift, assignment, key)
+        week_key = self._index(shift, assignment, key)
+
+        for conflict in conflicts:
+            serial = next(self._serials)
+            self._conflicts[serial] = conflict
+            for conflict_key in conflict.assignment_keys:
+                self._conflicts_by_key.setdefault(conflict_key, set()).add(serial)
+        if hour_conflict:
+            self._hour_conflicts[week_key] = hour_conflict
+            conflicts.append(hour_conflict)
+        return conflicts
+
+    def _index(self, shift: Shift, assignment: ShiftAssignment, key: int) -> Tuple[int, date]:
+        """Add an assignment to the timelines and weekly hours; returns its week key"""
+        employee_id = assignment.employee_id
+        start, end = assignment.get_interval(shift.date)
+        week_key = (employee_id, week_start_for(shift.date))
+
+        self._timelines.setdefault(employee_id, IntervalIndex()).add(start, end, key)
+        self._shift_members.setdefault(id(shift), {}).setdefault(employee_id, []).append(key)
+        self._indexed[key] = (shift, assignment)
+        self._weekly_hours[week_key] = self._weekly_hours.get(week_key, 0.0) + assignment.duration_hours
+        return week_key
+
+    def remove_assignment(self, shift: Shift, employee_id: int):
+        """Un-index all assignments of an employee on a shift and drop their conflicts"""
+        members = self._shift_members.get(id(shift), {})
+        keys = set(members.pop(employee_id, []))
+        if not keys:
+            return
+
+        week_key = (employee_id, week_start_for(shift.date))
+        for key in keys:
+            _, assignment = self._indexed.pop(key)
+            start, end = assignment.get_interval(shift.date)
+            self._timelines[employee_id].remove(start, end, key)
+            self._weekly_hours[week_key] -= assignment.duration_hours
+
+        for key in keys:
+            for serial in self._conflicts_by_key.pop(key, set()):
+                conflict = self._conflicts.pop(serial, None)
+                if conflict:
+                    for other_key in conflict.assignment_keys - {key}:
+                        self._conflicts_by_key.get(other_key, set()).discard(serial)
+
+        # Re-check the weekly limit now that hours went down
+        self._hour_conflicts.pop(week_key, None)
+        employee = self.employees.get(employee_id)
+        total_hours = self._weekly_hours[week_key]
+        if employee and total_hours > employee.max_hours_per_week:
+            self._hour_conflicts[week_key] = self._hours_conflict(employee, week_key[1], total_hours)
+
+    def _hours_conflict(self, employee: Employee, week_start: date, total_hours: float) -> Conflict:
+        """Build the weekly hour limit conflict for an employee"""
+        return Conflict(
+            ConflictType.MAX_HOURS_EXCEEDED, employee.id, week_start,
+            message=f"Employee {employee.id} is scheduled {total_hours:.1f}h "
+                    f"(max {employee.max_hours_per_week}h)"
+        )
+
+    def _find_conflicts(self, shift: Shift, assignment: ShiftAssignment,
+                        key: int) -> Tuple[List[Conflict], Optional[Conflict]]:
+        """Find conflicts of an assignment against the indexed state"""
+        conflicts = []
+        employee_id = assignment.employee_id
+        start, end = assignment.get_interval(shift.date)
+        members = self._shift_members.get(id(shift), {})
+
+        # Same employee twice on one shift
+        for other_key in members.get(employee_id, []):
+            conflicts.append(Conflict(
+                ConflictType.DOUBLE_BOOKING, employee_id, shift.date,
+                message=f"Employee {employee_id} is assigned twice to the same shift",
+                assignment_keys=frozenset((key, other_key))
+            ))
+
+        # Overlaps and rest-time violations against other shifts
+        timeline = self._timelines.get(employee_id)
+        if timeline:
+            for other_start, other_end, other_key in timeline.overlapping(start - self.min_rest, end + self.min_rest):
+                if other_key == key or self._indexed[other_key][0] is shift:
+                    continue
+                if other_start < end and other_end > start:
+                    conflict_type = ConflictType.OVERLAPPING_SHIFTS
+                    message = f"Employee {employee_id} has overlapping shifts at {other_start:%a %H:%M}"
+                else:
+                    conflict_type = ConflictType.INSUFFICIENT_REST
+                    message = (f"Employee {employee_id} has less than "
+                               f"{self.min_rest.total_seconds() / 3600:g}h rest around {other_start:%a %H:%M}")
+                conflicts.append(Conflict(
+                    conflict_type, employee_id, shift.date, message=message,
+                    assignment_keys=frozenset((key, other_key))
+                ))
+
+        # Forbidden pairs on the same shift
+        for other_id, other_keys in members.items():
+            if other_id != employee_id and other_keys and self.is_forbidden_pair(employee_id, other_id):
+                conflicts.append(Conflict(
+                    ConflictType.CANNOT_WORK_WITH, employee_id, shift.date, other_employee_id=other_id,
+                    message=f"Employees {employee_id} and {other_id} cannot work together",
+                    assignment_keys=frozenset([key, *other_keys])
+                ))
+
+        # Weekly hour limit
+        hour_conflict = None
+        employee = self.employees.get(employee_id)
+        if employee:
+            week_key = (employee_id, week_start_for(shift.date))
+            total_hours = self._weekly_hours.get(week_key, 0.0) + assignment.duration_hours
+            if total_hours > employee.max_hours_per_week:
+                hour_conflict = self._hours_conflict(employee, week_key[1], total_hours)
+
+        return conflicts, hour_conflict
@@ -0,0 +1,230 @@
+"""
+Staffing coverage timeline for Restaurant Shift Management System
+
+This module turns assignments into per-location, per-position headcount arrays
+on a fixed slot grid (15 minutes by default). Every assignment adds +1/-1 to a
+difference array and one cumulative sum produces the headcount, so a month
+across many locations is built in a single vectorized pass. Template position
+requirements are laid out the same way for comparison, and rush windows from
+settings are checked against the total staff on the floor.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional, Dict, Tuple, Iterable
+
+import numpy as np
+
+from database.db_manager import DatabaseManager
+from models.employee import Position
+from models.shift import Shift, ShiftTemplate
+
+POSITIONS = list(Position)
+POSITION_INDEX = {position: index for index, position in enumerate(POSITIONS)}
+
+@dataclass
+class CoverageGap:
+    location_id: Optional[int]
+    position: Optional[Position]  # None means total staff across positions
+    start: datetime
+    end: datetime
+    scheduled: int
+    required: int
+    label: str = ""
+
+    @property
+    def shortfall(self) -> int:
+        return self.required - self.scheduled
+
+@dataclass
+class CoverageTimeline:
+    start_date: date
+    days: int
+    slot_minutes: int
+    location_ids: List[Optional[int]]
+    scheduled: np.ndarray  # [location, position, slot] headcount
+    required: np.ndarray  # [location, position, slot] template minimums
+
+    @property
+    def slots_per_day(self) -> int:
+        return 24 * 60 // self.slot_minutes
+
+    def slot_index(self, when: datetime) -> int:
+        """Get slot index containing a datetime"""
+        minutes = (when - datetime.combine(self.start_date, time(0, 0))).total_seconds() / 60
+        return int(minutes // self.slot_minutes)
+
+    def slot_start(self, slot: int) -> datetime:
+        """Get the datetime a slot starts at"""
+        return datetime.combine(self.start_date, time(0, 0)) + timedelta(minutes=int(slot) * self.slot_minutes)
+
+    def _location_index(self, location_id: Optional[int]) -> int:
+        """Get array row of a location"""
+        return self.location_ids.index(location_id)
+
+    def headcount_at(self, position: Optional[Position], when: datetime,
+                     location_id: Optional[int] = None) -> int:
+        """How many employees of a position (or in total) are on the floor at a time"""
+        slot = self.slot_index(when)
+        if not 0 <= slot < self.scheduled.shape[-1]:
+            return 0
+        if location_id in self.location_ids:
+            counts = self.scheduled[[self._location_index(location_id)], :, slot]
+        elif location_id is None:
+            # No specific location: count across all of them
+            counts = self.scheduled[:, :, slot]
+        else:
+            return 0
+        if position is not None:
+            counts = counts[:, POSITION_INDEX[position]]
+        return int(counts.sum())
+
+    def position_series(self, position: Position, location_id: Optional[int] = None) -> np.ndarray:
+        """Get the headcount series of one position at one location"""
+        return self.scheduled[self._location_index(location_id), POSITION_INDEX[position]]
+
+    def shortfall(self) -> np.ndarray:
+        """Get missing headcount per location, position and slot"""
+        return np.maximum(self.required - self.scheduled, 0)
+
+    def find_gaps(self) -> List[CoverageGap]:
+        """Get every contiguous period where a position is below its template minimum"""
+        shortfall = self.shortfall()
+        return self._runs_to_gaps(shortfall > 0, self.scheduled, self.required, by_position=True)
+
+    def check_rush_windows(self, rush_windows: Dict[str, Tuple[time, time]],
+                           minimum_staff: int) -> List[CoverageGap]:
+        """Get periods inside rush windows where total staff is below minimum_staff"""
+        total_slots = self.scheduled.shape[-1]
+        in_rush = np.zeros(total_slots, dtype=bool)
+        labels = np.full(total_slots, "", dtype=object)
+        for name, (start, end) in rush_windows.items():
+            first = (start.hour * 60 + start.minute) // self.slot_minutes
+            last = -(-(end.hour * 60 + end.minute) // self.slot_minutes)
+            for day in range(self.days):
+                offset = day * self.slots_per_day
+                in_rush[offset + first:offset + last] = True
+                labels[offset + first:offset + last] = name
+
+        totals = self.scheduled.sum(axis=1)  # [location, slot]
+        required = np.where(in_rush, minimum_staff, 0)[np.newaxis, :].repeat(len(self.location_ids), axis=0)
+        below = in_rush[np.newaxis, :] & (totals < minimum_staff)
+        gaps = self._runs_to_gaps(below[:, np.newaxis, :], totals[:, np.newaxis, :],
+                                  required[:, np.newaxis, :], by_position=False)
+        for gap in gaps:
+            gap.label = labels[self.slot_index(gap.start)]
+        return gaps
+
+    def _runs_to_gaps(self, mask: np.ndarray, scheduled: np.ndarray, required: np.ndarray,
+                      by_position: bool) -> List[CoverageGap]:
+        """Convert a [location, position, slot] boolean mask into contiguous gaps"""
+        padded = np.zeros(mask.shape[:-1] + (mask.shape[-1] + 2,), dtype=np.int8)
+        padded[..., 1:-1] = mask
+        edges = np.diff(padded, axis=-1)
+        # argwhere walks in C order, so starts and ends of each run line up
+        starts = np.argwhere(edges == 1)
+        ends = np.argwhere(edges == -1)
+
+        gaps = []
+        for (location, position, first), (_, _, last) in zip(starts, ends):
+            window = slice(first, last)
+            gaps.append(CoverageGap(
+                location_id=self.location_ids[location],
+                position=POSITIONS[position] if by_position else None,
+                start=self.slot_start(first),
+                end=self.slot_start(last),
+                scheduled=int(scheduled[location, position, window].min()),
+                required=int(required[location, position, window].max())
+            ))
+        return gaps
+
+class CoverageEngine:
+    """Builds coverage timelines from shifts or stored assignments"""
+
+    def __init__(self, slot_minutes: int = 15):
+        self.slot_minutes = slot_minutes
+
+    def _minute_range(self, start: time, end: time) -> Tuple[int, int]:
+        """Get start and end minute of a time range, ending after midnight if needed"""
+        start_minute = start.hour * 60 + start.minute
+        end_minute = end.hour * 60 + end.minute
+        if end_minute <= start_minute:
+            end_minute += 24 * 60
+        return start_minute, end_minute
+
+    def build_timeline(self, shifts: Iterable[Shift], start_date: date, end_date: date,
+                       templates_by_id: Optional[Dict[int, ShiftTemplate]] = None,
+                       include_breaks: bool = True) -> CoverageTimeline:
+        """Build headcount and requirement arrays for shifts between two dates (inclusive)"""
+        templates_by_id = templates_by_id or {}
+        shifts = [shift for shift in shifts if start_date <= shift.date <= end_date]
+        location_ids = sorted({shift.location_id for shift in shifts}, key=lambda value: (value is not None, value))
+        location_index = {location_id: index for index, location_id in enumerate(location_ids)}
+        slots_per_day = 24 * 60 // self.slot_minutes
+
+        # Each entry: location, position, start minute, end minute, headcount change
+        scheduled_rows: List[Tuple[int, int, int, int, int]] = []
+        required_rows: List[Tuple[int, int, int, int, int]] = []
+
+        for shift in shifts:
+            location = location_index[shift.location_id]
+            day_offset = (shift.date - start_date).days * 24 * 60
+
+            for assignment in shift.assignments:
+                position = POSITION_INDEX[assignment.position]
+                first, last = self._minute_range(assignment.start_time, assignment.end_time)
+                scheduled_rows.append((location, position, day_offset + first, day_offset + last, 1))
+                if include_breaks:
+                    for break_start, break_end in assignment.break_times:
+                        first_break, last_break = self._minute_range(break_start, break_end)
+                        # Breaks after midnight belong to the next day of an overnight shift
+                        if first_break < first:
+                            first_break, last_break = first_break + 24 * 60, last_break + 24 * 60
+                        scheduled_rows.append((location, position, day_offset + first_break,
+                                               day_offset + last_break, -1))
+
+            template = templates_by_id.get(shift.template_id)
+            if template:
+                first, last = self._minute_range(shift.start_time, shift.end_time)
+                for requirement in template.position_requirements:
+                    required_rows.append((location, POSITION_INDEX[requirement.position],
+                                          day_offset + first, day_offset + last, requirement.minimum_required))
+
+        days = (end_date - start_date).days + 1
+        # One extra day holds overnight shifts running past end_date
+        total_slots = (days + 1) * slots_per_day
+        shape = (max(len(location_ids), 1), len(POSITIONS), total_slots)
+
+        return CoverageTimeline(
+            start_date=start_date,
+            days=days,
+            slot_minutes=self.slot_minutes,
+            location_ids=location_ids or [None],
+            scheduled=self._accumulate(scheduled_rows, shape),
+            required=self._accumulate(required_rows, shape)
+        )
+
+    def _accumulate(self, rows: List[Tuple[int, int, int, int, int]], shape: Tuple[int, int, int]) -> np.ndarray:
+        """Turn interval rows into slot counts with a difference array and prefix sum"""
+        diff = np.zeros(shape[:-1] + (shape[-1] + 1,), dtype=np.int32)
+        if rows:
+            data = np.array(rows, dtype=np.int64)
+            locations, positions, weights = data[:, 0], data[:, 1], data[:, 4]
+            # A slot counts when any part of it is covered
+            first_slots = np.clip(data[:, 2] // self.slot_minutes, 0, shape[-1])
+            end_slots = np.clip(-(-data[:, 3] // self.slot_minutes), 0, shape[-1])
+            np.add.at(diff, (locations, positions, first_slots), weights)
+            np.add.at(diff, (locations, positions, end_slots), -weights)
+        return np.cumsum(diff, axis=-1)[..., :-1]
+
+    def load_timeline(self, db_manager: DatabaseManager, start_date: date, end_date: date,
+                      location_id: Optional[int] = None) -> CoverageTimeline:
+        """Build a timeline from stored shifts and templates"""
+        shifts = db_manager.get_shifts(start_date, end_date, location_id)
+        templates_by_id = {template.id: template for template in db_manager.get_all_shift_templates()}
+        return self.build_timeline(shifts, start_date, end_date, templates_by_id)
+
+    def find_rush_gaps(self, db_manager: DatabaseManager, timeline: CoverageTimeline) -> List[CoverageGap]:
+        """Check a timeline against the rush windows and peak staff minimum in settings"""
+        minimum_staff = int(db_manager.get_numeric_setting("peak_staff_minimum", 12))
+        return timeline.check_rush_windows(db_manager.get_rush_windows(), minimum_staff)
@@ -0,0 +1,129 @@
+"""
+Template expansion for Restaurant Shift Management System
+
+This module turns shift templates into concrete shifts for any date range.
+Templates apply on their applicable_days (every day when empty); holidays from
+settings either close the restaurant or run another weekday's templates. Rows
+are generated lazily and written in batches, and re-running a range only adds
+the shifts that are missing.
+
+Usage:
+    python -m scheduling.expansion --db shifts.db --start 2025-01-01 --end 2025-12-31
+"""
+
+import argparse
+import logging
+import time as timer
+from datetime import date, timedelta
+from typing import List, Optional, Dict, Iterator, Sequence, Tuple
+
+from database.db_manager import DatabaseManager
+from models.shift import Shift, ShiftTemplate, WeekDay
+
+logger = logging.getLogger(__name__)
+
+ShiftRow = Tuple[int, Optional[int], str, str, str]
+
+class TemplateExpander:
+    """Expands shift templates over date ranges, honoring holiday overrides"""
+
+    def __init__(self, holidays: Optional[Dict[date, Optional[WeekDay]]] = None):
+        # date -> weekday whose templates run that day, or None when closed
+        self.holidays = holidays or {}
+
+    @classmethod
+    def from_settings(cls, db_manager: DatabaseManager) -> "TemplateExpander":
+        """Create expander using the holidays stored in the database"""
+        return cls(db_manager.get_holidays())
+
+    def effective_weekday(self, shift_date: date) -> Optional[WeekDay]:
+        """Get the weekday whose templates apply on a date, or None when closed"""
+        if shift_date in self.holidays:
+            return self.holidays[shift_date]
+        return WeekDay(shift_date.weekday())
+
+    def _template_locations(self, template: ShiftTemplate,
+                            location_ids: Optional[Sequence[Optional[int]]]) -> List[Optional[int]]:
+        """Get the locations a template produces shifts for"""
+        if template.location_id is not None:
+            if location_ids is None or template.location_id in location_ids:
+                return [template.location_id]
+            return []
+        # Shared templates apply to every requested location
+        return list(location_ids) if location_ids is not None else [None]
+
+    def expand_rows(self, templates: List[ShiftTemplate], start_date: date, end_date: date,
+                    location_ids: Optional[Sequence[Optional[int]]] = None) -> Iterator[ShiftRow]:
+        """Yield (template_id, location_id, date, start_time, end_time) rows as ISO strings
+
+        location_ids limits output to those locations; templates without a
+        location are copied to each of them.
+        """
+        # Per-template values that do not change from day to day
+        prepared = []
+        for template in templates:
+            locations = self._template_locations(template, location_ids)
+            if locations:
+                prepared.append((template.id, template.applicable_days, locations,
+                                 template.start_time.isoformat(), template.end_time.isoformat()))
+
+        for offset in range((end_date - start_date).days + 1):
+            shift_date = start_date + timedelta(days=offset)
+            weekday = self.effective_weekday(shift_date)
+            if weekday is None:
+                continue
+            date_text = shift_date.isoformat()
+            for template_id, applicable_days, locations, start_text, end_text in prepared:
+                # Templates without explicit days apply to every day
+                if applicable_days and weekday not in applicable_days:
+                    continue
+                for location_id in locations:
+                    yield template_id, location_id, date_text, start_text, end_text
+
+    def expand_shifts(self, templates: List[ShiftTemplate], start_date: date, end_date: date,
+                      location_ids: Optional[Sequence[Optional[int]]] = None) -> List[Shift]:
+        """Create unstaffed Shift objects for a date range"""
+        templates_by_id = {template.id: template for template in templates}
+        return [
+            Shift(
+                template_id=template_id,
+                location_id=location_id,
+                date=date.fromisoformat(date_text),
+                start_time=templates_by_id[template_id].start_time,
+                end_time=templates_by_id[template_id].end_time
+            )
+            for template_id, location_id, date_text, _, _ in self.expand_rows(
+                templates, start_date, end_date, location_ids)
+        ]
+
+    def materialize(self, db_manager: DatabaseManager, start_date: date, end_date: date,
+                    location_ids: Optional[Sequence[Optional[int]]] = None,
+                    templates: Optional[List[ShiftTemplate]] = None,
+                    batch_size: int = 5000) -> int:
+        """Store every missing template shift in a date range; returns the number added"""
+        if templates is None:
+            templates = db_manager.get_all_shift_templates()
+        rows = self.expand_rows(templates, start_date, end_date, location_ids)
+        return db_manager.add_template_shifts(rows, batch_size)
+
+def main():
+    """Command line entry point for template expansion"""
+    parser = argparse.ArgumentParser(description="Generate shifts from templates for a date range")
+    parser.add_argument("--db", default="shifts.db", help="Database file")
+    parser.add_argument("--start", required=True, type=date.fromisoformat, help="First date (YYYY-MM-DD)")
+    parser.add_argument("--end", required=True, type=date.fromisoformat, help="Last date (YYYY-MM-DD)")
+    parser.add_argument("--locations", nargs="*", type=int, help="Location IDs (default: template locations)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per insert transaction")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    started = timer.perf_counter()
+    db_manager = DatabaseManager(args.db)
+    added = TemplateExpander.from_settings(db_manager).materialize(
+        db_manager, args.start, args.end, args.locations, batch_size=args.batch_size)
+    print(f"Added {added} shifts in {timer.perf_counter() - started:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
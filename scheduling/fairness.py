@@ -0,0 +1,288 @@
+"""
+Fairness and preference scoring for Restaurant Shift Management System
+
+This module scores a WeeklySchedule on how well it honors preferred_shifts and
+preferred availability, and how evenly it spreads hours, weekend shifts and
+closing shifts. Per-employee totals live in NumPy arrays and the score is built
+from running sums, so adding or removing one assignment is O(1) and scoring a
+move for a whole array of candidate employees is a single vectorized pass.
+"""
+
+from dataclasses import dataclass
+from datetime import date, time
+from typing import List, Optional, Dict, Sequence
+
+import numpy as np
+
+from models.employee import Employee
+from models.shift import Shift, ShiftAssignment, WeeklySchedule
+
+PERIODS = ["morning", "afternoon", "evening", "night"]
+CLOSING_MINUTE = 22 * 60
+
+def shift_period(start_time: time) -> str:
+    """Get the preferred_shifts period a start time falls in"""
+    hour = start_time.hour
+    if 5 <= hour < 11:
+        return "morning"
+    if 11 <= hour < 16:
+        return "afternoon"
+    if 16 <= hour < 21:
+        return "evening"
+    return "night"
+
+def is_closing_assignment(assignment: ShiftAssignment) -> bool:
+    """Check if an assignment runs to closing (22:00 or later, or past midnight)"""
+    start_minute = assignment.start_time.hour * 60 + assignment.start_time.minute
+    end_minute = assignment.end_time.hour * 60 + assignment.end_time.minute
+    return end_minute <= start_minute or end_minute >= CLOSING_MINUTE
+
+@dataclass
+class FairnessWeights:
+    preference: float = 1.0
+    hour_variation: float = 1.0
+    weekend_variance: float = 0.5
+    closing_variance: float = 0.5
+    min_hours_shortfall: float = 1.0
+
+@dataclass
+class FairnessMetrics:
+    score: float
+    preference_satisfaction: float  # mean over scheduled employees, 0-1
+    hour_variance: float
+    hour_variation: float  # squared coefficient of variation of hours
+    weekend_variance: float
+    closing_variance: float
+    min_hours_shortfall: float  # hours below min_hours_per_week, summed
+    employee_satisfaction: Dict[int, float]
+    weekend_share: Dict[int, float]
+    closing_share: Dict[int, float]
+
+class FairnessScorer:
+    """Incremental fairness and preference score over a set of employees"""
+
+    def __init__(self, employees: List[Employee], weights: Optional[FairnessWeights] = None):
+        self.weights = weights or FairnessWeights()
+        self.employee_ids = [emp.id for emp in employees]
+        self.index = {emp.id: position for position, emp in enumerate(employees)}
+        count = len(employees)
+
+        self.min_hours = np.array([emp.min_hours_per_week for emp in employees], dtype=np.float64)
+        self.total_min_hours = float(self.min_hours.sum())
+
+        # Preferred periods as bitmasks, preferred availability as [employee, weekday, hour]
+        self.period_masks = np.zeros(count, dtype=np.int64)
+        self.preferred_hours = np.zeros((count, 7, 24), dtype=bool)
+        for position, emp in enumerate(employees):
+            for period in emp.preferred_shifts:
+                if period.lower() in PERIODS:
+                    self.period_masks[position] |= 1 << PERIODS.index(period.lower())
+            for availability in emp.availability:
+                if availability.is_preferred:
+                    first = availability.start_time.hour
+                    last = availability.end_time.hour + (1 if availability.end_time.minute else 0)
+                    self.preferred_hours[position, availability.day_of_week, first:max(last, first + 1)] = True
+        self.has_preferred_hours = self.preferred_hours.any(axis=(1, 2))
+
+        self.reset()
+
+    def reset(self):
+        """Clear all per-employee totals"""
+        count = len(self.employee_ids)
+        self.hours = np.zeros(count)
+        self.weekend = np.zeros(count)
+        self.closing = np.zeros(count)
+        self.shift_counts = np.zeros(count)
+        self.preference_points = np.zeros(count)
+
+        self._sum_hours = self._sumsq_hours = 0.0
+        self._sum_weekend = self._sumsq_weekend = 0.0
+        self._sum_closing = self._sumsq_closing = 0.0
+        self._shortfall = self.total_min_hours
+        self._ratio_sum = 0.0
+        self._active = 0
+
+    def load(self, schedule: WeeklySchedule) -> "FairnessScorer":
+        """Rebuild totals from every assignment of a schedule"""
+        self.reset()
+        for shifts_list in schedule.shifts.values():
+            for shift in shifts_list:
+                for assignment in shift.assignments:
+                    self.add(shift, assignment)
+        return self
+
+    # Move features
+
+    def preference_match(self, shift_date: date, assignment: ShiftAssignment,
+                         positions: np.ndarray) -> np.ndarray:
+        """Get how well an assignment fits each employee's preferences, 0-1
+
+        Half the weight is the preferred_shifts period, half the share of the
+        assignment inside preferred availability. Employees without a
+        preference of either kind count as satisfied on that half.
+        """
+        period_bit = 1 << PERIODS.index(shift_period(assignment.start_time))
+        masks = self.period_masks[positions]
+        period_match = np.where(masks == 0, 1.0, (masks & period_bit) != 0)
+
+        hour_count = max(1, int(np.ceil(assignment.duration_hours)))
+        absolute_hours = assignment.start_time.hour + np.arange(hour_count)
+        weekdays = (shift_date.weekday() + absolute_hours // 24) % 7
+        hours = absolute_hours % 24
+        covered = self.preferred_hours[positions][:, weekdays, hours].mean(axis=1)
+        availability_match = np.where(self.has_preferred_hours[positions], covered, 1.0)
+
+        return 0.5 * period_match + 0.5 * availability_match
+
+    def _features(self, shift: Shift, assignment: ShiftAssignment):
+        """Get (hours, weekend, closing) added by an assignment"""
+        return (assignment.duration_hours,
+                1.0 if shift.date.weekday() >= 5 else 0.0,
+                1.0 if is_closing_assignment(assignment) else 0.0)
+
+    # Incremental updates
+
+    def _apply(self, position: int, hours: float, weekend: float, closing: float,
+               preference: float, sign: float):
+        """Add (sign=1) or remove (sign=-1) one assignment's contribution"""
+        old_hours = self.hours[position]
+        old_weekend = self.weekend[position]
+        old_closing = self.closing[position]
+        old_count = self.shift_counts[position]
+        old_ratio = self.preference_points[position] / old_count if old_count else 0.0
+
+        self.hours[position] += sign * hours
+        self.weekend[position] += sign * weekend
+        self.closing[position] += sign * closing
+        self.shift_counts[position] += sign
+        self.preference_points[position] += sign * preference
+
+        new_hours = self.hours[position]
+        new_count = self.shift_counts[position]
+        self._sum_hours += new_hours - old_hours
+        self._sumsq_hours += new_hours ** 2 - old_hours ** 2
+        self._sum_weekend += self.weekend[position] - old_weekend
+        self._sumsq_weekend += self.weekend[position] ** 2 - old_weekend ** 2
+        self._sum_closing += self.closing[position] - old_closing
+        self._sumsq_closing += self.closing[position] ** 2 - old_closing ** 2
+        minimum = self.min_hours[position]
+        self._shortfall += max(minimum - new_hours, 0.0) - max(minimum - old_hours, 0.0)
+        self._ratio_sum += (self.preference_points[position] / new_count if new_count else 0.0) - old_ratio
+        self._active += int(new_count > 0) - int(old_count > 0)
+
+    def add(self, shift: Shift, assignment: ShiftAssignment):
+        """Record an assignment"""
+        position = self.index.get(assignment.employee_id)
+        if position is None:
+            return
+        preference = float(self.preference_match(shift.date, assignment, np.array([position]))[0])
+        self._apply(position, *self._features(shift, assignment), preference, 1.0)
+
+    def remove(self, shift: Shift, assignment: ShiftAssignment):
+        """Forget an assignment previously recorded with add"""
+        position = self.index.get(assignment.employee_id)
+        if position is None:
+            return
+        preference = float(self.preference_match(shift.date, assignment, np.array([position]))[0])
+        self._apply(position, *self._features(shift, assignment), preference, -1.0)
+
+    # Scoring
+
+    def _score(self, sum_hours, sumsq_hours, sum_weekend, sumsq_weekend, sum_closing, sumsq_closing,
+               shortfall, ratio_sum, active):
+        """Combine running sums into a score; arguments may be scalars or arrays"""
+        count = max(len(self.employee_ids), 1)
+        mean_hours = sum_hours / count
+        hour_variance = np.maximum(sumsq_hours / count - mean_hours ** 2, 0.0)
+        hour_variation = np.where(mean_hours > 0, hour_variance / np.maximum(mean_hours, 1e-9) ** 2, 0.0)
+        weekend_variance = np.maximum(sumsq_weekend / count - (sum_weekend / count) ** 2, 0.0)
+        closing_variance = np.maximum(sumsq_closing / count - (sum_closing / count) ** 2, 0.0)
+        satisfaction = np.where(active > 0, ratio_sum / np.maximum(active, 1), 1.0)
+        shortfall_ratio = shortfall / self.total_min_hours if self.total_min_hours else 0.0
+
+        w = self.weights
+        score = (w.preference * satisfaction - w.hour_variation * hour_variation -
+                 w.weekend_variance * weekend_variance - w.closing_variance * closing_variance -
+                 w.min_hours_shortfall * shortfall_ratio)
+        return score, satisfaction, hour_variance, hour_variation, weekend_variance, closing_variance
+
+    @property
+    def score(self) -> float:
+        """Current schedule score; higher is fairer and better matched to preferences"""
+        return float(self._score(self._sum_hours, self._sumsq_hours, self._sum_weekend, self._sumsq_weekend,
+                                 self._sum_closing, self._sumsq_closing, self._shortfall,
+                                 self._ratio_sum, self._active)[0])
+
+    def evaluate_add(self, shift: Shift, assignment: ShiftAssignment,
+                     employee_ids: Sequence[int]) -> np.ndarray:
+        """Score change if each employee took the assignment, without applying it
+
+        The assignment's own employee_id is ignored; unknown employees get NaN.
+        """
+        positions = np.array([self.index.get(employee_id, -1) for employee_id in employee_ids], dtype=np.int64)
+        known = positions >= 0
+        positions = np.where(known, positions, 0)
+
+        hours, weekend, closing = self._features(shift, assignment)
+        preference = self.preference_match(shift.date, assignment, positions)
+
+        old_hours = self.hours[positions]
+        new_hours = old_hours + hours
+        old_weekend = self.weekend[positions]
+        old_closing = self.closing[positions]
+        old_count = self.shift_counts[positions]
+        old_points = self.preference_points[positions]
+        old_ratio = np.where(old_count > 0, old_points / np.maximum(old_count, 1), 0.0)
+        new_ratio = (old_points + preference) / (old_count + 1)
+        minimum = self.min_hours[positions]
+
+        scores = self._score(
+            self._sum_hours + hours,
+            self._sumsq_hours + new_hours ** 2 - old_hours ** 2,
+            self._sum_weekend + weekend,
+            self._sumsq_weekend + (old_weekend + weekend) ** 2 - old_weekend ** 2,
+            self._sum_closing + closing,
+            self._sumsq_closing + (old_closing + closing) ** 2 - old_closing ** 2,
+            self._shortfall + np.maximum(minimum - new_hours, 0.0) - np.maximum(minimum - old_hours, 0.0),
+            self._ratio_sum + new_ratio - old_ratio,
+            self._active + (old_count == 0)
+        )[0]
+        return np.where(known, scores - self.score, np.nan)
+
+    def evaluate_reassign(self, shift: Shift, assignment: ShiftAssignment,
+                          employee_ids: Sequence[int]) -> np.ndarray:
+        """Score change if a recorded assignment moved to each of the employees"""
+        before = self.score
+        self.remove(shift, assignment)
+        try:
+            return self.evaluate_add(shift, assignment, employee_ids) + (self.score - before)
+        finally:
+            self.add(shift, assignment)
+
+    def metrics(self) -> FairnessMetrics:
+        """Get the current score with its components and per-employee shares"""
+        score, satisfaction, hour_variance, hour_variation, weekend_variance, closing_variance = self._score(
+            self._sum_hours, self._sumsq_hours, self._sum_weekend, self._sumsq_weekend,
+            self._sum_closing, self._sumsq_closing, self._shortfall, self._ratio_sum, self._active)
+
+        counts = np.maximum(self.shift_counts, 1)
+        total_weekend = self.weekend.sum() or 1.0
+        total_closing = self.closing.sum() or 1.0
+        scheduled = self.shift_counts > 0
+        return FairnessMetrics(
+            score=float(score),
+            preference_satisfaction=float(satisfaction),
+            hour_variance=float(hour_variance),
+            hour_variation=float(hour_variation),
+            weekend_variance=float(weekend_variance),
+            closing_variance=float(closing_variance),
+            min_hours_shortfall=float(self._shortfall),
+            employee_satisfaction={
+                employee_id: float(self.preference_points[position] / counts[position])
+                for position, employee_id in enumerate(self.employee_ids) if scheduled[position]
+            },
+            weekend_share={employee_id: float(self.weekend[position] / total_weekend)
+                           for position, employee_id in enumerate(self.employee_ids)},
+            closing_share={employee_id: float(self.closing[position] / total_closing)
+                           for position, employee_id in enumerate(self.employee_ids)}
+        )
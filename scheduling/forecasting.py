@@ -0,0 +1,189 @@
+"""
+Demand forecasting for Restaurant Shift Management System
+
+This module learns customer volume per weekday and time-of-day interval from
+historical shifts (customer_count spread over each shift's hours) using Holt
+exponential smoothing, vectorized across every weekday/interval series at once.
+Forecasts are translated into recommended PositionRequirement counts for shift
+templates using customers-per-staff-hour productivity rates.
+"""
+
+import math
+from dataclasses import replace
+from datetime import date, timedelta
+from typing import List, Optional, Dict, Tuple
+
+import numpy as np
+
+from database.db_manager import DatabaseManager
+from models.employee import Position
+from models.shift import ShiftTemplate, PositionRequirement
+
+# Customers one employee of the position can serve per hour
+DEFAULT_CUSTOMERS_PER_STAFF_HOUR = {
+    Position.CASHIER: 30.0,
+    Position.DRIVE_THRU: 40.0,
+    Position.KITCHEN: 25.0
+}
+
+class DemandForecaster:
+    """Holt exponential smoothing per (weekday, interval) series"""
+
+    def __init__(self, interval_minutes: int = 60, alpha: float = 0.3, beta: float = 0.05):
+        self.interval_minutes = interval_minutes
+        self.intervals_per_day = 24 * 60 // interval_minutes
+        self.alpha = alpha
+        self.beta = beta
+
+        self.level: Optional[np.ndarray] = None  # [weekday, interval] customers per interval
+        self.trend: Optional[np.ndarray] = None  # [weekday, interval] change per week
+        self.last_date: Optional[date] = None
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.level is not None
+
+    def build_history_grid(self, dates: np.ndarray, start_minutes: np.ndarray, end_minutes: np.ndarray,
+                           customers: np.ndarray) -> Tuple[int, np.ndarray, np.ndarray]:
+        """Spread each shift's customers evenly over its intervals
+
+        dates are date ordinals. Returns (first ordinal, volume grid, observed mask),
+        both grids shaped [day, interval].
+        """
+        dates = np.asarray(dates, dtype=np.int64)
+        start_minutes = np.asarray(start_minutes, dtype=np.int64)
+        end_minutes = np.asarray(end_minutes, dtype=np.int64)
+        customers = np.asarray(customers, dtype=np.float64)
+        end_minutes = np.where(end_minutes <= start_minutes, end_minutes + 24 * 60, end_minutes)
+
+        first_slots = start_minutes // self.interval_minutes
+        slot_counts = np.maximum(-(-end_minutes // self.interval_minutes) - first_slots, 1)
+
+        # One row per (shift, interval) without a Python loop
+        shift_rows = np.repeat(np.arange(len(dates)), slot_counts)
+        offsets = np.arange(len(shift_rows)) - np.repeat(np.cumsum(slot_counts) - slot_counts, slot_counts)
+        slots = first_slots[shift_rows] + offsets
+
+        first_day = int(dates.min())
+        days = dates[shift_rows] - first_day + slots // self.intervals_per_day
+        intervals = slots % self.intervals_per_day
+        num_days = int(days.max()) + 1
+
+        cells = days * self.intervals_per_day + intervals
+        size = num_days * self.intervals_per_day
+        volume = np.bincount(cells, weights=(customers / slot_counts)[shift_rows], minlength=size)
+        observed = np.bincount(cells, minlength=size) > 0
+        shape = (num_days, self.intervals_per_day)
+        return first_day, volume.reshape(shape), observed.reshape(shape)
+
+    def fit(self, dates: np.ndarray, start_minutes: np.ndarray, end_minutes: np.ndarray,
+            customers: np.ndarray) -> "DemandForecaster":
+        """Fit smoothing state from historical shift arrays"""
+        self.level = np.zeros((7, self.intervals_per_day))
+        self.trend = np.zeros((7, self.intervals_per_day))
+        if len(dates) == 0:
+            self.last_date = None
+            return self
+
+        first_day, volume, observed = self.build_history_grid(dates, start_minutes, end_minutes, customers)
+
+        # Pad to whole weeks starting on Monday: [week, weekday, interval]
+        first_monday = first_day - (first_day - 1) % 7
+        lead = first_day - first_monday
+        total_days = lead + volume.shape[0]
+        weeks = -(-total_days // 7)
+        weekly_volume = np.zeros((weeks * 7, self.intervals_per_day))
+        weekly_observed = np.zeros((weeks * 7, self.intervals_per_day), dtype=bool)
+        weekly_volume[lead:total_days] = volume
+        weekly_observed[lead:total_days] = observed
+        weekly_volume = weekly_volume.reshape(weeks, 7, self.intervals_per_day)
+        weekly_observed = weekly_observed.reshape(weeks, 7, self.intervals_per_day)
+
+        level = np.zeros((7, self.intervals_per_day))
+        trend = np.zeros((7, self.intervals_per_day))
+        seen = np.zeros((7, self.intervals_per_day), dtype=bool)
+
+        # Every series advances together; weeks without data keep their state
+        for week in range(weeks):
+            values = weekly_volume[week]
+            mask = weekly_observed[week]
+            first_seen = mask & ~seen
+            level = np.where(first_seen, values, level)
+
+            update = mask & seen
+            new_level = self.alpha * values + (1 - self.alpha) * (level + trend)
+            new_trend = self.beta * (new_level - level) + (1 - self.beta) * trend
+            level = np.where(update, new_level, level)
+            trend = np.where(update, new_trend, trend)
+            seen |= mask
+
+        self.level = level
+        self.trend = trend
+        self.last_date = date.fromordinal(first_monday + weeks * 7 - 1)
+        return self
+
+    def fit_from_database(self, db_manager: DatabaseManager, start_date: date, end_date: date,
+                          location_id: Optional[int] = None) -> "DemandForecaster":
+        """Fit from shifts with recorded customer counts"""
+        records = db_manager.get_demand_records(start_date, end_date, location_id)
+        count = len(records)
+        return self.fit(
+            dates=np.fromiter((date.fromisoformat(row['date']).toordinal() for row in records),
+                              dtype=np.int64, count=count),
+            start_minutes=np.fromiter((int(row['start_time'][:2]) * 60 + int(row['start_time'][3:5])
+                                       for row in records), dtype=np.int64, count=count),
+            end_minutes=np.fromiter((int(row['end_time'][:2]) * 60 + int(row['end_time'][3:5])
+                                     for row in records), dtype=np.int64, count=count),
+            customers=np.fromiter((row['customer_count'] for row in records), dtype=np.float64, count=count)
+        )
+
+    def forecast_day(self, target_date: date) -> np.ndarray:
+        """Forecast customers per interval for one date"""
+        if not self.is_fitted:
+            raise ValueError("Forecaster has not been fitted")
+        weekday = target_date.weekday()
+        weeks_ahead = 0
+        if self.last_date:
+            weeks_ahead = max(0, -(-(target_date - self.last_date).days // 7))
+        return np.maximum(self.level[weekday] + self.trend[weekday] * weeks_ahead, 0.0)
+
+    def forecast_range(self, start_date: date, end_date: date) -> np.ndarray:
+        """Forecast customers per interval for each date in a range, shaped [day, interval]"""
+        days = (end_date - start_date).days + 1
+        return np.array([self.forecast_day(start_date + timedelta(days=offset)) for offset in range(days)])
+
+    def peak_hourly_customers(self, target_date: date, template: ShiftTemplate) -> float:
+        """Get the busiest forecast hour within a template's working hours"""
+        volume = np.concatenate([self.forecast_day(target_date),
+                                 self.forecast_day(target_date + timedelta(days=1))])
+        first = (template.start_time.hour * 60 + template.start_time.minute) // self.interval_minutes
+        last = first + max(1, math.ceil(template.duration_hours * 60 / self.interval_minutes))
+        window = volume[first:last]
+        return float(window.max()) * 60 / self.interval_minutes if len(window) else 0.0
+
+    def recommend_requirements(self, template: ShiftTemplate, target_date: date,
+                               customers_per_staff_hour: Optional[Dict[Position, float]] = None
+                               ) -> List[PositionRequirement]:
+        """Right-size a template's position requirements for a date's forecast demand
+
+        Positions without a productivity rate (managers, cleaning crew) keep their
+        template minimums. Others get the staff the peak hour needs, which may be
+        below the template minimum; a position the template requires keeps at
+        least one person, and one it marks optional (minimum 0) may get none.
+        """
+        rates = customers_per_staff_hour or DEFAULT_CUSTOMERS_PER_STAFF_HOUR
+        peak_customers = self.peak_hourly_customers(target_date, template)
+
+        recommended = []
+        for req in template.position_requirements:
+            rate = rates.get(req.position)
+            if not rate:
+                recommended.append(req)
+                continue
+            needed = max(min(1, req.minimum_required), math.ceil(peak_customers / rate))
+            recommended.append(replace(
+                req,
+                minimum_required=needed,
+                maximum_allowed=max(req.maximum_allowed, needed)
+            ))
+        return recommended
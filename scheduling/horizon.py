@@ -0,0 +1,139 @@
+"""
+Rolling-horizon planning for Restaurant Shift Management System
+
+This module plans several consecutive weeks (four to eight typically) for one
+location. Instead of solving the whole horizon as one problem, it solves week by
+week and carries a small per-employee hour balance forward: hours owed against
+min_hours_per_week over the horizon and overtime worked in the previous week.
+Each week's targets spread the remaining owed hours over the remaining weeks, so
+work and memory grow linearly with horizon length.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import List, Optional, Dict
+
+from database.db_manager import DatabaseManager
+from models.employee import Employee, EmploymentStatus
+from models.shift import ShiftTemplate, WeeklySchedule
+from scheduling.scheduler import ShiftScheduler
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class HourBalance:
+    employee_id: int
+    min_hours_per_week: float
+    max_hours_per_week: float
+    scheduled_hours: float = 0.0
+    weeks_planned: int = 0
+    last_overtime_hours: float = 0.0
+
+    @property
+    def owed_hours(self) -> float:
+        """Hours still owed against the weekly minimum for the weeks planned so far"""
+        return self.min_hours_per_week * self.weeks_planned - self.scheduled_hours
+
+    def target_for_week(self, weeks_remaining: int) -> float:
+        """Hours this employee should get in the next week of the horizon"""
+        horizon_minimum = self.min_hours_per_week * (self.weeks_planned + weeks_remaining)
+        remaining = horizon_minimum - self.scheduled_hours
+        target = remaining / max(weeks_remaining, 1)
+        # Give back overtime worked last week before adding more hours
+        target -= self.last_overtime_hours
+        return min(max(target, 0.0), self.max_hours_per_week)
+
+    def record_week(self, hours: float, overtime_hours: float):
+        """Add one planned week to the balance"""
+        self.scheduled_hours += hours
+        self.weeks_planned += 1
+        self.last_overtime_hours = overtime_hours
+
+@dataclass
+class HorizonPlan:
+    first_week: date
+    location_id: Optional[int]
+    schedules: List[WeeklySchedule] = field(default_factory=list)
+    balances: Dict[int, HourBalance] = field(default_factory=dict)
+    total_labor_hours: float = 0.0
+    total_labor_cost: float = 0.0
+
+    def get_short_employees(self) -> List[HourBalance]:
+        """Get employees who ended the horizon below their minimum hours"""
+        return sorted((balance for balance in self.balances.values() if balance.owed_hours > 0),
+                      key=lambda balance: -balance.owed_hours)
+
+class RollingHorizonPlanner:
+    """Plans consecutive weeks while carrying per-employee hour balances"""
+
+    def __init__(self, db_manager: DatabaseManager, scheduler: Optional[ShiftScheduler] = None):
+        self.db_manager = db_manager
+        self.scheduler = scheduler or ShiftScheduler(db_manager)
+
+    def create_balances(self, employees: List[Employee]) -> Dict[int, HourBalance]:
+        """Create empty hour balances for employees"""
+        return {
+            emp.id: HourBalance(emp.id, emp.min_hours_per_week, emp.max_hours_per_week)
+            for emp in employees
+        }
+
+    def load_overtime_carryover(self, balances: Dict[int, HourBalance], first_week: date):
+        """Seed last-week overtime from the stored week before the horizon"""
+        previous_week = first_week - timedelta(days=7)
+        overtime_rules = self.db_manager.get_overtime_rules()
+        weekly_hours: Dict[int, float] = {}
+        for row in self.db_manager.get_assignment_records(previous_week, first_week - timedelta(days=1)):
+            end_minute = row['end_minute']
+            if end_minute <= row['start_minute']:
+                end_minute += 24 * 60
+            hours = (end_minute - row['start_minute']) / 60.0
+            weekly_hours[row['employee_id']] = weekly_hours.get(row['employee_id'], 0.0) + hours
+
+        for employee_id, hours in weekly_hours.items():
+            if employee_id in balances:
+                balances[employee_id].last_overtime_hours = max(0.0, hours - overtime_rules.weekly_threshold_hours)
+
+    def plan(self, first_week: date, weeks: int = 4, location_id: Optional[int] = None,
+             employees: Optional[List[Employee]] = None,
+             templates: Optional[List[ShiftTemplate]] = None,
+             keep_schedules: bool = True) -> HorizonPlan:
+        """Schedule and save `weeks` consecutive weeks starting at first_week
+
+        Set keep_schedules to False on long horizons to keep only the balances
+        and totals in memory.
+        """
+        if weeks < 1:
+            raise ValueError("Horizon must contain at least one week")
+        if employees is None:
+            employees = self.db_manager.get_all_employees(EmploymentStatus.ACTIVE)
+        if templates is None:
+            templates = self.db_manager.get_all_shift_templates(location_id)
+
+        plan = HorizonPlan(first_week=first_week, location_id=location_id,
+                           balances=self.create_balances(employees))
+        self.load_overtime_carryover(plan.balances, first_week)
+
+        for index in range(weeks):
+            week_start = first_week + timedelta(weeks=index)
+            weeks_remaining = weeks - index
+            targets = {employee_id: balance.target_for_week(weeks_remaining)
+                       for employee_id, balance in plan.balances.items()}
+
+            schedule = self.scheduler.schedule_week(week_start, location_id, employees, templates,
+                                                    hour_targets=targets)
+
+            for employee_id, balance in plan.balances.items():
+                balance.record_week(schedule.get_employee_total_hours(employee_id),
+                                    schedule.get_employee_overtime_hours(employee_id))
+
+            plan.total_labor_hours += schedule.total_labor_hours
+            plan.total_labor_cost += schedule.total_labor_cost
+            if keep_schedules:
+                plan.schedules.append(schedule)
+
+        logger.info(
+            f"Planned {weeks} weeks from {first_week} (location {location_id}): "
+            f"{len(plan.get_short_employees())} employees below minimum hours"
+        )
+        return plan
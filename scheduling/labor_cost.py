@@ -0,0 +1,168 @@
+"""
+Vectorized labor cost engine for Restaurant Shift Management System
+
+This module costs a whole period of assignments at once with NumPy. It applies the
+same rules as OvertimeRules.split_hours: daily overtime against each assignment's
+threshold (ShiftTemplate.overtime_threshold_hours), then weekly overtime on the
+remaining regular hours, paid at the configured overtime multiplier.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional, Dict
+
+import numpy as np
+
+from database.db_manager import DatabaseManager
+from models.employee import Employee
+from models.shift import Shift, ShiftTemplate, OvertimeRules
+
+@dataclass
+class LaborCostResult:
+    regular_hours: np.ndarray
+    overtime_hours: np.ndarray
+    cost: np.ndarray
+
+    @property
+    def total_cost(self) -> float:
+        return float(self.cost.sum())
+
+    @property
+    def total_regular_hours(self) -> float:
+        return float(self.regular_hours.sum())
+
+    @property
+    def total_overtime_hours(self) -> float:
+        return float(self.overtime_hours.sum())
+
+def _group_cumsum(values: np.ndarray, group_starts: np.ndarray) -> np.ndarray:
+    """Cumulative sum that restarts wherever group_starts is True (input must be grouped)"""
+    totals = np.cumsum(values)
+    start_indexes = np.flatnonzero(group_starts)
+    group_ids = np.cumsum(group_starts) - 1
+    offsets = (totals - values)[start_indexes]
+    return totals - offsets[group_ids]
+
+class LaborCostEngine:
+    """Costs arrays of assignments with daily and weekly overtime"""
+
+    def __init__(self, overtime_rules: Optional[OvertimeRules] = None):
+        self.overtime_rules = overtime_rules or OvertimeRules()
+
+    @classmethod
+    def from_settings(cls, db_manager: DatabaseManager) -> "LaborCostEngine":
+        """Create engine using the overtime settings stored in the database"""
+        return cls(db_manager.get_overtime_rules())
+
+    def compute(self, durations: np.ndarray, wages: np.ndarray, employee_ids: np.ndarray,
+                days: np.ndarray, start_minutes: Optional[np.ndarray] = None,
+                daily_thresholds: Optional[np.ndarray] = None) -> LaborCostResult:
+        """Cost assignments given as parallel arrays
+
+        days are date ordinals (date.toordinal()); start_minutes orders assignments
+        within a day. daily_thresholds may hold NaN to use the default daily threshold.
+        Results are returned in input order.
+        """
+        rules = self.overtime_rules
+        durations = np.asarray(durations, dtype=np.float64)
+        wages = np.asarray(wages, dtype=np.float64)
+        employee_ids = np.asarray(employee_ids, dtype=np.int64)
+        days = np.asarray(days, dtype=np.int64)
+        count = len(durations)
+        if count == 0:
+            empty = np.zeros(0)
+            return LaborCostResult(empty, empty.copy(), empty.copy())
+
+        if start_minutes is None:
+            start_minutes = np.zeros(count, dtype=np.int64)
+        if daily_thresholds is None:
+            daily_thresholds = np.full(count, rules.daily_threshold_hours)
+        else:
+            daily_thresholds = np.asarray(daily_thresholds, dtype=np.float64)
+            daily_thresholds = np.where(np.isnan(daily_thresholds), rules.daily_threshold_hours, daily_thresholds)
+
+        # Chronological order per employee
+        order = np.lexsort((start_minutes, days, employee_ids))
+        employees_sorted = employee_ids[order]
+        days_sorted = days[order]
+        hours = durations[order]
+        thresholds = daily_thresholds[order]
+        # Ordinal 1 (0001-01-01) is a Monday, so this numbers Monday-based weeks
+        weeks_sorted = (days_sorted - 1) // 7
+
+        new_employee = np.ones(count, dtype=bool)
+        new_employee[1:] = employees_sorted[1:] != employees_sorted[:-1]
+        new_day = new_employee.copy()
+        new_day[1:] |= days_sorted[1:] != days_sorted[:-1]
+        new_week = new_employee.copy()
+        new_week[1:] |= weeks_sorted[1:] != weeks_sorted[:-1]
+
+        # Daily overtime: portion of each assignment past the day's threshold
+        day_after = _group_cumsum(hours, new_day)
+        day_before = day_after - hours
+        daily_overtime = (np.maximum(day_after - thresholds, 0.0) -
+                          np.maximum(day_before - thresholds, 0.0))
+        daily_overtime = np.clip(daily_overtime, 0.0, hours)
+        daily_regular = hours - daily_overtime
+
+        # Weekly overtime: regular hours past the weekly threshold
+        weekly_limit = rules.weekly_threshold_hours
+        week_after = _group_cumsum(daily_regular, new_week)
+        week_before = week_after - daily_regular
+        weekly_overtime = (np.maximum(week_after - weekly_limit, 0.0) -
+                           np.maximum(week_before - weekly_limit, 0.0))
+
+        regular_hours = np.empty(count)
+        overtime_hours = np.empty(count)
+        regular_hours[order] = daily_regular - weekly_overtime
+        overtime_hours[order] = daily_overtime + weekly_overtime
+
+        cost = wages * (regular_hours + overtime_hours * rules.overtime_multiplier)
+        return LaborCostResult(regular_hours, overtime_hours, cost)
+
+    def compute_for_shifts(self, shifts: List[Shift], employees: List[Employee],
+                           templates_by_id: Optional[Dict[int, ShiftTemplate]] = None) -> LaborCostResult:
+        """Cost all assignments of the given shifts, in shift then assignment order"""
+        wage_lookup = {emp.id: emp.hourly_wage for emp in employees}
+        templates_by_id = templates_by_id or {}
+
+        rows = [(shift, assignment) for shift in shifts for assignment in shift.assignments]
+        thresholds = []
+        for shift, _ in rows:
+            template = templates_by_id.get(shift.template_id)
+            thresholds.append(template.overtime_threshold_hours if template else np.nan)
+
+        return self.compute(
+            durations=np.fromiter((a.duration_hours for _, a in rows), dtype=np.float64, count=len(rows)),
+            wages=np.fromiter((wage_lookup.get(a.employee_id, 0.0) for _, a in rows), dtype=np.float64, count=len(rows)),
+            employee_ids=np.fromiter((a.employee_id for _, a in rows), dtype=np.int64, count=len(rows)),
+            days=np.fromiter((s.date.toordinal() for s, _ in rows), dtype=np.int64, count=len(rows)),
+            start_minutes=np.fromiter((a.start_time.hour * 60 + a.start_time.minute for _, a in rows),
+                                      dtype=np.int64, count=len(rows)),
+            daily_thresholds=np.array(thresholds, dtype=np.float64)
+        )
+
+    def compute_period(self, db_manager: DatabaseManager, start_date: date, end_date: date,
+                       location_id: Optional[int] = None) -> LaborCostResult:
+        """Cost every stored assignment between two dates straight from the database"""
+        # Wages and template thresholds come joined onto the rows, so this is one query
+        records = db_manager.get_assignment_records(start_date, end_date, location_id)
+        count = len(records)
+
+        start_minutes = np.fromiter((row['start_minute'] for row in records), dtype=np.int64, count=count)
+        end_minutes = np.fromiter((row['end_minute'] for row in records), dtype=np.int64, count=count)
+        # Overnight assignments end on the next day
+        durations = np.where(end_minutes <= start_minutes, end_minutes + 24 * 60, end_minutes) - start_minutes
+
+        return self.compute(
+            durations=durations / 60.0,
+            wages=np.fromiter((row['hourly_wage'] for row in records), dtype=np.float64, count=count),
+            employee_ids=np.fromiter((row['employee_id'] for row in records), dtype=np.int64, count=count),
+            days=np.fromiter((row['day_number'] for row in records), dtype=np.int64, count=count),
+            start_minutes=start_minutes,
+            # NaN means no template threshold; a threshold of 0 is kept as 0
+            daily_thresholds=np.fromiter(
+                (np.nan if row['overtime_threshold_hours'] is None else row['overtime_threshold_hours']
+                 for row in records),
+                dtype=np.float64, count=count)
+        )
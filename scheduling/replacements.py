@@ -0,0 +1,168 @@
+"""
+Callout replacement finder for Restaurant Shift Management System
+
+When an employee calls out, find_replacements ranks everyone who could cover the
+position right now. Eligibility, weekday availability, skill, attendance and hour
+limits are laid out in NumPy arrays once per roster, so a lookup filters and
+sorts thousands of employees in a few vectorized passes.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Iterable, Set
+
+import numpy as np
+
+from models.employee import Employee, Position
+from models.shift import Shift, WeeklySchedule
+from scheduling.conflicts import ConflictGraph
+from scheduling.scheduler import SKILL_RANK
+
+POSITIONS = list(Position)
+
+@dataclass
+class ReplacementCandidate:
+    employee_id: int
+    overtime_hours: float
+    added_cost: float
+    skill_rank: int
+    attendance_rate: float
+    remaining_hours: float  # hours left under max_hours_per_week after covering
+
+class ReplacementFinder:
+    """Ranks replacement employees for open positions on a weekly schedule"""
+
+    def __init__(self, schedule: WeeklySchedule, employees: List[Employee],
+                 conflict_graph: Optional[ConflictGraph] = None):
+        self.schedule = schedule
+        self.employees = employees
+        self.conflict_graph = conflict_graph or ConflictGraph.from_employees(employees)
+        count = len(employees)
+
+        self.employee_ids = np.array([emp.id for emp in employees], dtype=np.int64)
+        self.index = {emp.id: position for position, emp in enumerate(employees)}
+        self.wages = np.array([emp.hourly_wage for emp in employees], dtype=np.float64)
+        self.attendance = np.array([emp.attendance_rate for emp in employees], dtype=np.float64)
+        self.max_hours = np.array([emp.max_hours_per_week for emp in employees], dtype=np.float64)
+
+        # [position, employee] eligibility and skill rank
+        self.eligible = np.zeros((len(POSITIONS), count), dtype=bool)
+        self.skill = np.zeros((len(POSITIONS), count), dtype=np.int64)
+        for column, emp in enumerate(employees):
+            for row, position in enumerate(POSITIONS):
+                if emp.can_work_position(position):
+                    self.eligible[row, column] = True
+                    self.skill[row, column] = SKILL_RANK[emp.get_skill_level(position)]
+
+        # Availability windows per weekday as parallel (employee, start minute, end minute) arrays
+        windows: Dict[int, List[tuple]] = {day: [] for day in range(7)}
+        for column, emp in enumerate(employees):
+            for availability in emp.availability:
+                windows[availability.day_of_week].append((
+                    column,
+                    availability.start_time.hour * 60 + availability.start_time.minute,
+                    availability.end_time.hour * 60 + availability.end_time.minute
+                ))
+        self.windows = {day: np.array(rows, dtype=np.int64).reshape(-1, 3) for day, rows in windows.items()}
+
+    def _available(self, weekday: int, start_minute: int, end_minute: int) -> np.ndarray:
+        """Boolean mask of employees with an availability window covering the time"""
+        mask = np.zeros(len(self.employee_ids), dtype=bool)
+        rows = self.windows[weekday]
+        covering = (rows[:, 1] <= start_minute) & (rows[:, 2] >= end_minute)
+        mask[rows[covering, 0]] = True
+        return mask
+
+    def _busy_employees(self, shift: Shift) -> Set[int]:
+        """Employees already working at any time during the shift"""
+        shift_start = datetime.combine(shift.date, shift.start_time)
+        shift_end = shift_start + timedelta(hours=shift.duration_hours)
+        busy = set()
+        # Overnight shifts from the previous day can still be running
+        for day in (shift.date - timedelta(days=1), shift.date):
+            for other in self.schedule.get_shifts_for_date(day):
+                for assignment in other.assignments:
+                    other_start, other_end = assignment.get_interval(other.date)
+                    if other_start < shift_end and other_end > shift_start:
+                        busy.add(assignment.employee_id)
+        return busy
+
+    def _day_hours(self, shift: Shift, columns: np.ndarray) -> np.ndarray:
+        """Hours each candidate already works on the shift's date"""
+        hours_by_employee: Dict[int, float] = {}
+        for other in self.schedule.get_shifts_for_date(shift.date):
+            for assignment in other.assignments:
+                hours_by_employee[assignment.employee_id] = (
+                    hours_by_employee.get(assignment.employee_id, 0.0) + assignment.duration_hours)
+        return np.array([hours_by_employee.get(int(employee_id), 0.0) for employee_id in self.employee_ids[columns]])
+
+    def find_replacements(self, shift: Shift, position: Position, limit: int = 10,
+                          exclude: Iterable[int] = (), allow_over_max: bool = False,
+                          daily_threshold_hours: Optional[float] = None) -> List[ReplacementCandidate]:
+        """Rank employees who could cover a position on a shift
+
+        Candidates must be eligible for the position, available for the shift's
+        hours, not already working then and free of cannot_work_with conflicts
+        with the crew. They are ranked by overtime the cover would cause, then
+        skill, attendance_rate and hours left under max_hours_per_week.
+        """
+        rules = self.schedule.overtime_rules
+        daily_threshold = rules.daily_threshold_hours if daily_threshold_hours is None else daily_threshold_hours
+        start_minute = shift.start_time.hour * 60 + shift.start_time.minute
+        end_minute = shift.end_time.hour * 60 + shift.end_time.minute
+        # Availability windows are same-day, so overnight shifts must be covered to midnight
+        if end_minute <= start_minute:
+            end_minute = 24 * 60 - 1
+        duration = shift.duration_hours
+
+        row = POSITIONS.index(position)
+        mask = self.eligible[row] & self._available(shift.date.weekday(), start_minute, end_minute)
+
+        crew = [assignment.employee_id for assignment in shift.assignments]
+        blocked = self._busy_employees(shift) | set(exclude)
+        for employee_id in crew:
+            blocked.update(self.conflict_graph.get_conflicting_ids(employee_id))
+        for employee_id in blocked:
+            column = self.index.get(employee_id)
+            if column is not None:
+                mask[column] = False
+
+        columns = np.flatnonzero(mask)
+        if len(columns) == 0:
+            return []
+
+        week_hours = np.array([self.schedule.get_employee_total_hours(int(employee_id))
+                               for employee_id in self.employee_ids[columns]])
+        remaining = self.max_hours[columns] - week_hours - duration
+        if not allow_over_max:
+            keep = remaining >= 0
+            columns, week_hours, remaining = columns[keep], week_hours[keep], remaining[keep]
+            if len(columns) == 0:
+                return []
+
+        # Same split as OvertimeRules: daily overtime first, then weekly on the regular part
+        day_hours = self._day_hours(shift, columns)
+        daily_overtime = np.maximum(day_hours + duration - daily_threshold, 0.0) - np.maximum(day_hours - daily_threshold, 0.0)
+        regular = duration - daily_overtime
+        weekly_limit = rules.weekly_threshold_hours
+        weekly_overtime = np.maximum(week_hours + regular - weekly_limit, 0.0) - np.maximum(week_hours - weekly_limit, 0.0)
+        overtime = daily_overtime + weekly_overtime
+
+        wages = self.wages[columns]
+        added_cost = wages * (duration - overtime) + wages * overtime * rules.overtime_multiplier
+        skill = self.skill[row, columns]
+        attendance = self.attendance[columns]
+
+        # lexsort uses the last key as primary
+        order = np.lexsort((-remaining, -attendance, -skill, overtime))[:limit]
+        return [
+            ReplacementCandidate(
+                employee_id=int(self.employee_ids[columns[i]]),
+                overtime_hours=float(overtime[i]),
+                added_cost=float(added_cost[i]),
+                skill_rank=int(skill[i]),
+                attendance_rate=float(attendance[i]),
+                remaining_hours=float(remaining[i])
+            )
+            for i in order
+        ]
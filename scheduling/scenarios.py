@@ -0,0 +1,259 @@
+"""
+What-if scenarios for Restaurant Shift Management System
+
+A ScheduleScenario is a copy-on-write overlay on a base WeeklySchedule. Shifts
+are shared with the base until a scenario changes them; only then is that one
+shift copied (its assignment objects stay shared). Scenarios can branch from
+other scenarios, and costs and coverage are recomputed only for the employees
+and shifts a scenario actually changed.
+"""
+
+import copy
+from dataclasses import dataclass, field, replace
+from datetime import date, time
+from typing import List, Optional, Dict, Set, Tuple
+
+import numpy as np
+
+from models.employee import Position
+from models.shift import Shift, ShiftAssignment, WeeklySchedule
+from scheduling.coverage import CoverageEngine, CoverageGap, CoverageTimeline
+
+AssignmentKey = Tuple[int, Position, time, time]
+
+@dataclass
+class ScenarioDiff:
+    added: List[Tuple[Shift, ShiftAssignment]] = field(default_factory=list)
+    removed: List[Tuple[Shift, ShiftAssignment]] = field(default_factory=list)
+    hours_delta: float = 0.0
+    cost_delta: float = 0.0
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.added and not self.removed
+
+class ScheduleScenario:
+    """Copy-on-write overlay over a base WeeklySchedule"""
+
+    def __init__(self, base: WeeklySchedule, name: str = "", parent: Optional["ScheduleScenario"] = None):
+        self.base = base
+        self.name = name
+        self.parent = parent
+
+        # Copied shifts keyed by the id() of the base shift they replace
+        self._overlay: Dict[int, Shift] = {}
+        self._copy_keys: Dict[int, int] = {}
+        self._base_shifts: Dict[int, Shift] = (
+            parent._base_shifts if parent else
+            {id(shift): shift for shifts_list in base.shifts.values() for shift in shifts_list}
+        )
+
+        # Cached per-employee (hours, cost) for employees touched by the scenario chain
+        self._employee_totals: Dict[int, Tuple[float, float]] = {}
+        self._dirty_employees: Set[int] = set()
+        self._revision = 0
+        self._parent_revision = parent._chain_revision() if parent else 0
+
+    def branch(self, name: str = "") -> "ScheduleScenario":
+        """Create a child scenario that starts from this one's changes"""
+        return ScheduleScenario(self.base, name, parent=self)
+
+    # Shift resolution
+
+    def _key(self, shift: Shift) -> int:
+        """Get the base shift key of a base shift or any scenario copy of it"""
+        scenario = self
+        while scenario:
+            if id(shift) in scenario._copy_keys:
+                return scenario._copy_keys[id(shift)]
+            scenario = scenario.parent
+        if id(shift) not in self._base_shifts:
+            raise ValueError("Shift does not belong to the base schedule")
+        return id(shift)
+
+    def _resolve(self, key: int) -> Shift:
+        """Get the shift a key currently points to in this scenario"""
+        scenario = self
+        while scenario:
+            if key in scenario._overlay:
+                return scenario._overlay[key]
+            scenario = scenario.parent
+        return self._base_shifts[key]
+
+    def _writable(self, shift: Shift, employee_id: int) -> Tuple[int, Shift]:
+        """Get this scenario's own copy of a shift, copying it on first write"""
+        self._revision += 1
+        self._dirty_employees.add(employee_id)
+        self._employee_totals.pop(employee_id, None)
+        key = self._key(shift)
+        if key not in self._overlay:
+            current = self._resolve(key)
+            shift_copy = copy.copy(current)
+            shift_copy.assignments = list(current.assignments)
+            self._overlay[key] = shift_copy
+            self._copy_keys[id(shift_copy)] = key
+        return key, self._overlay[key]
+
+    def get_changed_keys(self) -> Set[int]:
+        """Get keys of every shift changed along the scenario chain"""
+        keys = set(self._overlay)
+        if self.parent:
+            keys |= self.parent.get_changed_keys()
+        return keys
+
+    def get_shifts_for_date(self, target_date: date) -> List[Shift]:
+        """Get the scenario's version of all shifts on a date"""
+        return [self._resolve(id(shift)) for shift in self.base.get_shifts_for_date(target_date)]
+
+    def get_shift(self, shift: Shift) -> Shift:
+        """Get the scenario's version of a base shift"""
+        return self._resolve(self._key(shift))
+
+    # Edits
+
+    def add_assignment(self, shift: Shift, employee_id: int, position: Position,
+                       start_time: Optional[time] = None,
+                       end_time: Optional[time] = None) -> ShiftAssignment:
+        """Add employee assignment to a shift in this scenario only"""
+        _, shift_copy = self._writable(shift, employee_id)
+        return shift_copy.add_assignment(employee_id, position, start_time, end_time)
+
+    def remove_assignment(self, shift: Shift, employee_id: int):
+        """Remove employee assignment from a shift in this scenario only"""
+        _, shift_copy = self._writable(shift, employee_id)
+        shift_copy.remove_assignment(employee_id)
+
+    def remove_position(self, shift: Shift, position: Position) -> Optional[int]:
+        """Cut the most recently assigned employee of a position; returns their id"""
+        for assignment in reversed(self.get_shift(shift).assignments):
+            if assignment.position == position:
+                self.remove_assignment(shift, assignment.employee_id)
+                return assignment.employee_id
+        return None
+
+    # Costs
+
+    def get_affected_employees(self) -> Set[int]:
+        """Get employees whose hours or cost may differ from the base"""
+        affected = set(self._dirty_employees)
+        if self.parent:
+            affected |= self.parent.get_affected_employees()
+        return affected
+
+    def _employee_entries(self, employee_id: int, changed_keys: Set[int]) -> List[Tuple[Shift, ShiftAssignment]]:
+        """Get an employee's assignments as seen by this scenario"""
+        entries = [(shift, assignment) for shift, assignment in self.base.get_employee_assignments(employee_id)
+                   if id(shift) not in changed_keys]
+        for key in changed_keys:
+            shift = self._resolve(key)
+            entries.extend((shift, assignment) for assignment in shift.assignments
+                           if assignment.employee_id == employee_id)
+        return sorted(entries, key=lambda entry: (entry[0].date, entry[1].start_time))
+
+    def _chain_revision(self) -> int:
+        """Count of edits made along the scenario chain"""
+        return self._revision + (self.parent._chain_revision() if self.parent else 0)
+
+    def _refresh_totals(self):
+        """Recompute hours and cost only for employees changed since the last call"""
+        # Own edits invalidate only the employees they touched; parent edits invalidate all
+        if self.parent and self.parent._chain_revision() != self._parent_revision:
+            self._employee_totals.clear()
+            self._parent_revision = self.parent._chain_revision()
+
+        stale = self.get_affected_employees() - set(self._employee_totals)
+        if not stale:
+            return
+        changed_keys = self.get_changed_keys()
+        rules = self.base.overtime_rules
+        for employee_id in stale:
+            entries = self._employee_entries(employee_id, changed_keys)
+            split = self.base.split_overtime(entries)
+            wage = self.base.get_hourly_wage(employee_id)
+            hours = sum(assignment.duration_hours for _, assignment in entries)
+            cost = sum(regular * wage + overtime * wage * rules.overtime_multiplier for regular, overtime in split)
+            self._employee_totals[employee_id] = (hours, cost)
+
+    @property
+    def total_labor_hours(self) -> float:
+        self._refresh_totals()
+        return self.base.total_labor_hours + sum(
+            hours - self.base.get_employee_total_hours(employee_id)
+            for employee_id, (hours, _) in self._employee_totals.items()
+        )
+
+    @property
+    def total_labor_cost(self) -> float:
+        self._refresh_totals()
+        return self.base.total_labor_cost + sum(
+            cost - self.base.get_employee_labor_cost(employee_id)
+            for employee_id, (_, cost) in self._employee_totals.items()
+        )
+
+    def get_employee_total_hours(self, employee_id: int) -> float:
+        """Get total scheduled hours for employee in this scenario"""
+        self._refresh_totals()
+        if employee_id in self._employee_totals:
+            return self._employee_totals[employee_id][0]
+        return self.base.get_employee_total_hours(employee_id)
+
+    # Comparison
+
+    def _assignment_keys(self, shift: Shift) -> Dict[AssignmentKey, ShiftAssignment]:
+        return {(a.employee_id, a.position, a.start_time, a.end_time): a for a in shift.assignments}
+
+    def diff(self, other: "ScheduleScenario") -> ScenarioDiff:
+        """Get what changes going from this scenario to another one on the same base"""
+        if other.base is not self.base:
+            raise ValueError("Scenarios must share the same base schedule")
+
+        result = ScenarioDiff(
+            hours_delta=other.total_labor_hours - self.total_labor_hours,
+            cost_delta=other.total_labor_cost - self.total_labor_cost
+        )
+        # Only shifts changed by either side can differ
+        for key in self.get_changed_keys() | other.get_changed_keys():
+            mine = self._resolve(key)
+            theirs = other._resolve(key)
+            if mine.assignments is theirs.assignments:
+                continue
+            my_keys = self._assignment_keys(mine)
+            their_keys = self._assignment_keys(theirs)
+            result.added.extend((theirs, their_keys[k]) for k in their_keys.keys() - my_keys.keys())
+            result.removed.extend((mine, my_keys[k]) for k in my_keys.keys() - their_keys.keys())
+        return result
+
+    def coverage_delta(self, engine: CoverageEngine) -> CoverageTimeline:
+        """Get headcount change versus the base for the changed shifts only"""
+        keys = self.get_changed_keys()
+        base_shifts = [self._base_shifts[key] for key in keys]
+        start, end = self.base.week_start_date, self.base.week_end_date
+        before = engine.build_timeline(base_shifts, start, end)
+        after = engine.build_timeline([self._resolve(key) for key in keys], start, end)
+        return replace(after, scheduled=after.scheduled - before.scheduled,
+                       required=np.zeros_like(after.required))
+
+    def find_gaps(self, engine: CoverageEngine, base_timeline: CoverageTimeline) -> List[CoverageGap]:
+        """Get coverage gaps of this scenario by patching a timeline of the base"""
+        delta = self.coverage_delta(engine)
+        scheduled = base_timeline.scheduled.copy()
+        for row, location_id in enumerate(delta.location_ids):
+            if location_id in base_timeline.location_ids:
+                scheduled[base_timeline.location_ids.index(location_id)] += delta.scheduled[row]
+        return replace(base_timeline, scheduled=scheduled).find_gaps()
+
+    def apply(self):
+        """Write this scenario's changes into the base schedule
+
+        The scenario and any branches of it should be discarded afterwards.
+        """
+        for key in self.get_changed_keys():
+            base_shift = self._base_shifts[key]
+            target = self._assignment_keys(self._resolve(key))
+            current = self._assignment_keys(base_shift)
+            for employee_id in {k[0] for k in current.keys() - target.keys()}:
+                self.base.remove_assignment(base_shift, employee_id)
+            current = self._assignment_keys(base_shift)
+            for assignment_key in target.keys() - current.keys():
+                employee_id, position, start_time, end_time = assignment_key
+                self.base.add_assignment(base_shift, employee_id, position, start_time, end_time)
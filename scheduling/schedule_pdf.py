@@ -0,0 +1,379 @@
+"""
+PDF schedule rendering for Restaurant Shift Management System
+
+A WeeklySchedule is rendered with reportlab into a landscape document with a
+location overview (every shift and who works it), a position grid and an
+employee grid with weekly hours and cost. Fonts, paragraph styles and table
+styles are built once per process and reused by every document it renders.
+Batches of location schedules render in parallel worker processes, and
+render_in_background keeps a batch off the Tk main loop.
+
+Usage:
+    python -m scheduling.schedule_pdf --db shifts.db --week 2024-07-01 --locations 1 2 3 --out schedules
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import landscape, letter
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import (BaseDocTemplate, Frame, PageBreak, PageTemplate, Paragraph,
+                                Spacer, Table, TableStyle)
+
+from database.db_manager import DatabaseManager
+from models.employee import Employee
+from models.shift import Shift, ShiftTemplate, WeeklySchedule
+
+logger = logging.getLogger(__name__)
+
+VIEWS = ("location", "position", "employee")
+PAGE_SIZE = landscape(letter)
+MARGIN = 0.5 * inch
+
+@dataclass(frozen=True)
+class RenderJob:
+    db_path: str
+    week_start: date
+    output_path: str
+    location_id: Optional[int] = None
+    views: Tuple[str, ...] = VIEWS
+
+    @property
+    def label(self) -> str:
+        location = f"location {self.location_id}" if self.location_id is not None else "all locations"
+        return f"{os.path.basename(self.db_path)} / {location} / week of {self.week_start}"
+
+@dataclass
+class RenderResult:
+    job: RenderJob
+    page_count: int = 0
+    shift_count: int = 0
+    elapsed_seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+# Shared resources, built on first use in each process
+
+@lru_cache(maxsize=None)
+def _fonts() -> Tuple[str, str]:
+    """Register the document fonts once; falls back to Helvetica without Vera"""
+    try:
+        pdfmetrics.registerFont(TTFont("Vera", "Vera.ttf"))
+        pdfmetrics.registerFont(TTFont("VeraBd", "VeraBd.ttf"))
+        return "Vera", "VeraBd"
+    except Exception as e:
+        logger.warning(f"Using Helvetica, Vera fonts unavailable: {e}")
+        return "Helvetica", "Helvetica-Bold"
+
+@lru_cache(maxsize=None)
+def _styles() -> Dict[str, ParagraphStyle]:
+    regular, bold = _fonts()
+    return {
+        "title": ParagraphStyle("title", fontName=bold, fontSize=16, leading=20, spaceAfter=4),
+        "subtitle": ParagraphStyle("subtitle", fontName=regular, fontSize=10, leading=13,
+                                   textColor=colors.HexColor("#555555"), spaceAfter=10),
+        "heading": ParagraphStyle("heading", fontName=bold, fontSize=12, leading=15, spaceBefore=6, spaceAfter=6),
+        "cell": ParagraphStyle("cell", fontName=regular, fontSize=7.5, leading=9),
+        "cell_bold": ParagraphStyle("cell_bold", fontName=bold, fontSize=7.5, leading=9),
+        "header": ParagraphStyle("header", fontName=bold, fontSize=8, leading=10, textColor=colors.white),
+    }
+
+@lru_cache(maxsize=None)
+def _table_style() -> TableStyle:
+    return TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1f6aa5")),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f2f5f8")]),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#b0b8c0")),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("LEFTPADDING", (0, 0), (-1, -1), 3),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 3),
+    ])
+
+def warm_resources():
+    """Build fonts and styles up front; used as the worker process initializer"""
+    _styles()
+    _table_style()
+
+def _draw_footer(canvas, doc):
+    regular, _ = _fonts()
+    canvas.saveState()
+    canvas.setFont(regular, 7)
+    canvas.setFillColor(colors.HexColor("#777777"))
+    canvas.drawString(MARGIN, MARGIN / 2, doc.footer_text)
+    canvas.drawRightString(PAGE_SIZE[0] - MARGIN, MARGIN / 2, f"Page {doc.page}")
+    canvas.restoreState()
+
+class _ScheduleDocTemplate(BaseDocTemplate):
+    def __init__(self, filename: str, footer_text: str, **kwargs):
+        super().__init__(filename, pagesize=PAGE_SIZE, leftMargin=MARGIN, rightMargin=MARGIN,
+                         topMargin=MARGIN, bottomMargin=MARGIN, **kwargs)
+        self.footer_text = footer_text
+        frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id="body")
+        self.addPageTemplates([PageTemplate(id="schedule", frames=[frame], onPage=_draw_footer)])
+
+# Rendering
+
+def _time_range(start, end) -> str:
+    return f"{start.strftime('%H:%M')}-{end.strftime('%H:%M')}"
+
+Cell = Union[str, List[str]]
+
+def _grid(header: List[str], rows: List[List[Cell]], widths: List[float], bold_first: bool = True) -> Table:
+    """Table with a repeating header; list cells render one line per entry"""
+    styles = _styles()
+    data = [[Paragraph(escape(text), styles["header"]) for text in header]]
+    for row in rows:
+        data.append([
+            Paragraph("<br/>".join(escape(line) for line in cell) if isinstance(cell, list) else escape(cell),
+                      styles["cell_bold"] if bold_first and i == 0 else styles["cell"])
+            for i, cell in enumerate(row)
+        ])
+    table = Table(data, colWidths=widths, repeatRows=1)
+    table.setStyle(_table_style())
+    return table
+
+def _shift_name(shift: Shift, templates: Dict[int, ShiftTemplate]) -> str:
+    template = templates.get(shift.template_id)
+    return template.name if template else "Shift"
+
+def _location_view(schedule: WeeklySchedule, names: Dict[int, str],
+                   templates: Dict[int, ShiftTemplate], width: float) -> Table:
+    rows = []
+    for day in schedule.week_dates:
+        for shift in sorted(schedule.get_shifts_for_date(day), key=lambda s: (s.start_time, s.location_id or 0)):
+            staff = [
+                f"{assignment.position.value}: {names.get(assignment.employee_id, assignment.employee_id)} "
+                f"({_time_range(assignment.start_time, assignment.end_time)})"
+                for assignment in sorted(shift.assignments, key=lambda a: (a.position.value, a.start_time))
+            ] or "Unstaffed"
+            rows.append([day.strftime("%a %b %d"), _shift_name(shift, templates),
+                         _time_range(shift.start_time, shift.end_time),
+                         str(shift.total_scheduled_employees), staff])
+    return _grid(["Day", "Shift", "Time", "Staff", "Assignments"], rows,
+                 [0.9 * inch, 1.3 * inch, 0.9 * inch, 0.5 * inch, width - 3.6 * inch])
+
+def _position_view(schedule: WeeklySchedule, names: Dict[int, str], width: float) -> Table:
+    cells: Dict[str, List[List[str]]] = {}
+    for index, day in enumerate(schedule.week_dates):
+        for shift in schedule.get_shifts_for_date(day):
+            for assignment in sorted(shift.assignments, key=lambda a: a.start_time):
+                days = cells.setdefault(assignment.position.value, [[] for _ in range(7)])
+                days[index].append(f"{names.get(assignment.employee_id, assignment.employee_id)} "
+                                   f"{_time_range(assignment.start_time, assignment.end_time)}")
+    rows = [[position] + days for position, days in sorted(cells.items())]
+    day_width = (width - 1.2 * inch) / 7
+    return _grid(["Position"] + [day.strftime("%a %d") for day in schedule.week_dates], rows,
+                 [1.2 * inch] + [day_width] * 7)
+
+def _employee_view(schedule: WeeklySchedule, names: Dict[int, str], width: float) -> Table:
+    employee_ids = {assignment.employee_id for shifts in schedule.shifts.values()
+                    for shift in shifts for assignment in shift.assignments}
+    rows = []
+    for employee_id in sorted(employee_ids, key=lambda e: names.get(e, str(e))):
+        days = [[] for _ in range(7)]
+        for shift, assignment in schedule.get_employee_assignments(employee_id):
+            days[(shift.date - schedule.week_start_date).days].append(
+                f"{_time_range(assignment.start_time, assignment.end_time)} {assignment.position.value}")
+        rows.append([names.get(employee_id, str(employee_id))] + days + [
+            f"{schedule.get_employee_total_hours(employee_id):.1f}",
+            f"{schedule.get_employee_overtime_hours(employee_id):.1f}",
+            f"${schedule.get_employee_labor_cost(employee_id):,.2f}",
+        ])
+    rows.append(["Total"] + [""] * 7 + [f"{schedule.total_labor_hours:.1f}", "",
+                                        f"${schedule.total_labor_cost:,.2f}"])
+    day_width = (width - 1.3 * inch - 1.6 * inch) / 7
+    return _grid(["Employee"] + [day.strftime("%a %d") for day in schedule.week_dates] + ["Hours", "OT", "Cost"],
+                 rows, [1.3 * inch] + [day_width] * 7 + [0.45 * inch, 0.4 * inch, 0.75 * inch])
+
+def render_schedule_pdf(schedule: WeeklySchedule, employees: Sequence[Employee], output_path: str,
+                        title: str = "Weekly Schedule", templates: Optional[Sequence[ShiftTemplate]] = None,
+                        views: Sequence[str] = VIEWS) -> int:
+    """Render a weekly schedule to output_path and return the page count
+
+    employees supplies names for assignments; templates supplies shift names.
+    views picks and orders the "location", "position" and "employee" sections.
+    """
+    styles = _styles()
+    names = {employee.id: employee.full_name for employee in employees}
+    templates_by_id = {template.id: template for template in templates or []}
+    week = (f"Week of {schedule.week_start_date.strftime('%B %d, %Y')} - "
+            f"{schedule.week_end_date.strftime('%B %d, %Y')}")
+
+    doc = _ScheduleDocTemplate(output_path, footer_text=f"{title} | {week} | "
+                                                        f"Generated {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+                               title=f"{title} - {week}")
+    story = [
+        Paragraph(escape(title), styles["title"]),
+        Paragraph(f"{week} | {schedule.total_labor_hours:.1f} scheduled hours | "
+                  f"${schedule.total_labor_cost:,.2f} labor cost", styles["subtitle"]),
+    ]
+    sections = {
+        "location": ("Shifts", lambda: _location_view(schedule, names, templates_by_id, doc.width)),
+        "position": ("By Position", lambda: _position_view(schedule, names, doc.width)),
+        "employee": ("By Employee", lambda: _employee_view(schedule, names, doc.width)),
+    }
+    for index, view in enumerate(views):
+        heading, build = sections[view]
+        if index:
+            story.append(PageBreak())
+        story += [Paragraph(heading, styles["heading"]), build(), Spacer(1, 6)]
+    doc.build(story)
+    return doc.page
+
+def load_schedule(db_manager: DatabaseManager, week_start: date, location_id: Optional[int] = None,
+                  employees: Optional[List[Employee]] = None,
+                  templates: Optional[List[ShiftTemplate]] = None) -> WeeklySchedule:
+    """Build a costed WeeklySchedule from the stored shifts of a week"""
+    schedule = WeeklySchedule(week_start_date=week_start, overtime_rules=db_manager.get_overtime_rules())
+    schedule.set_employees(employees if employees is not None else db_manager.get_all_employees())
+    if templates is None:
+        templates = db_manager.get_all_shift_templates()
+    schedule.set_templates({template.id: template for template in templates})
+    for shift in db_manager.get_shifts(week_start, schedule.week_end_date, location_id):
+        schedule.add_shift(shift)
+    return schedule
+
+@lru_cache(maxsize=None)
+def _database(db_path: str) -> DatabaseManager:
+    """One DatabaseManager per database and process, so jobs share its report cache"""
+    return DatabaseManager(db_path)
+
+def render_job(job: RenderJob) -> RenderResult:
+    """Render one stored schedule; runs inside a worker process"""
+    started = time.perf_counter()
+    try:
+        db_manager = _database(job.db_path)
+        # Roster and templates are read once per worker while unchanged, not once per document
+        employees = db_manager.report_cache.get_or_compute(
+            "pdf_employees", None, ("employees",), db_manager.get_all_employees)
+        templates = db_manager.report_cache.get_or_compute(
+            "pdf_templates", job.location_id, ("templates",),
+            lambda: db_manager.get_all_shift_templates(job.location_id))
+        schedule = load_schedule(db_manager, job.week_start, job.location_id, employees, templates)
+        title = db_manager.get_restaurant_setting("restaurant_name") or "Weekly Schedule"
+        if job.location_id is not None:
+            title = f"{title} - Location {job.location_id}"
+        pages = render_schedule_pdf(schedule, employees, job.output_path, title, templates, job.views)
+        return RenderResult(
+            job=job,
+            page_count=pages,
+            shift_count=sum(len(shifts) for shifts in schedule.shifts.values()),
+            elapsed_seconds=time.perf_counter() - started
+        )
+    except Exception as e:
+        return RenderResult(job=job, elapsed_seconds=time.perf_counter() - started, error=str(e))
+
+def build_jobs(db_path: str, week_starts: Sequence[date], output_dir: str,
+               location_ids: Optional[Sequence[Optional[int]]] = None,
+               views: Tuple[str, ...] = VIEWS) -> List[RenderJob]:
+    """Create one job per location and week, writing to output_dir"""
+    return [
+        RenderJob(db_path, week_start,
+                  os.path.join(output_dir, f"schedule_{week_start.isoformat()}"
+                                           f"{'' if location_id is None else f'_location_{location_id}'}.pdf"),
+                  location_id, views)
+        for location_id in location_ids or [None]
+        for week_start in week_starts
+    ]
+
+def render_schedules(jobs: Sequence[RenderJob], max_workers: Optional[int] = None,
+                     progress_callback: Optional[Callable[[int, int, RenderResult], None]] = None
+                     ) -> List[RenderResult]:
+    """Render all jobs across worker processes and report per-job progress
+
+    progress_callback receives (completed, total, result) as each job finishes.
+    Results are returned in the same order as the jobs.
+    """
+    total = len(jobs)
+    if total == 0:
+        return []
+
+    max_workers = min(max_workers or os.cpu_count() or 1, total)
+    started = time.perf_counter()
+    results: List[Optional[RenderResult]] = [None] * total
+
+    def record(index: int, result: RenderResult, completed: int):
+        results[index] = result
+        if result.succeeded:
+            logger.info(f"[{completed}/{total}] {result.job.label}: {result.page_count} pages "
+                        f"in {result.elapsed_seconds:.2f}s")
+        else:
+            logger.error(f"[{completed}/{total}] {result.job.label} failed: {result.error}")
+        if progress_callback:
+            progress_callback(completed, total, result)
+
+    if max_workers == 1:
+        for index, job in enumerate(jobs):
+            record(index, render_job(job), index + 1)
+    else:
+        # Spawned workers, so a render started from the UI never forks the Tk process
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=warm_resources) as executor:
+            futures = {executor.submit(render_job, job): index for index, job in enumerate(jobs)}
+            for completed, future in enumerate(as_completed(futures), start=1):
+                record(futures[future], future.result(), completed)
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"Rendered {total} schedules with {max_workers} workers in {elapsed:.2f}s")
+    return results
+
+def render_in_background(jobs: Sequence[RenderJob], max_workers: Optional[int] = None,
+                         on_progress: Optional[Callable[[int, int, RenderResult], None]] = None,
+                         on_done: Optional[Callable[[List[RenderResult]], None]] = None) -> threading.Thread:
+    """Run render_schedules on a daemon thread
+
+    Callbacks run on that thread, so UI code should hand them to its event
+    loop (for tkinter, widget.after).
+    """
+    def run():
+        results = render_schedules(jobs, max_workers, on_progress)
+        if on_done:
+            on_done(results)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+def main():
+    """Command line entry point for schedule PDF rendering"""
+    parser = argparse.ArgumentParser(description="Render stored weekly schedules to PDF in parallel")
+    parser.add_argument("--db", default="shifts.db", help="Database file")
+    parser.add_argument("--week", required=True, type=date.fromisoformat, help="First week start date (YYYY-MM-DD)")
+    parser.add_argument("--weeks", type=int, default=1, help="Number of consecutive weeks")
+    parser.add_argument("--locations", nargs="*", type=int, help="Location IDs (default: all in one document)")
+    parser.add_argument("--out", default="schedules", help="Output directory")
+    parser.add_argument("--views", nargs="*", choices=VIEWS, default=list(VIEWS), help="Sections to include")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    os.makedirs(args.out, exist_ok=True)
+    week_starts = [args.week + timedelta(weeks=i) for i in range(args.weeks)]
+    results = render_schedules(build_jobs(args.db, week_starts, args.out, args.locations, tuple(args.views)),
+                               args.workers)
+
+    failed = [result for result in results if not result.succeeded]
+    print(f"Rendered {len(results) - len(failed)}/{len(results)} schedules, "
+          f"{sum(result.page_count for result in results)} pages")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
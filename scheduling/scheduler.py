@@ -0,0 +1,245 @@
+"""
+Shift scheduler for Restaurant Shift Management System
+
+This module staffs a week of shifts for one location using shift templates,
+employee positions, availability and weekly hour limits, optionally within the
+weekly labor budget. Employees are shared between locations, so assignments
+already stored for other locations count against overlaps and hour limits.
+"""
+
+import logging
+from datetime import date, timedelta
+from typing import List, Optional, Dict, Tuple
+
+from database.db_manager import DatabaseManager
+from models.employee import Employee, EmploymentStatus, SkillLevel
+from models.shift import Shift, ShiftTemplate, ShiftAssignment, WeeklySchedule
+from scheduling.breaks import BreakPlanner
+from scheduling.budget import BudgetMode, LaborBudgetTracker
+from scheduling.conflicts import ConflictGraph, ScheduleValidator
+from scheduling.expansion import TemplateExpander
+from scheduling.fairness import FairnessScorer
+from scheduling.forecasting import DemandForecaster
+
+logger = logging.getLogger(__name__)
+
+SKILL_RANK = {
+    SkillLevel.BEGINNER: 0,
+    SkillLevel.INTERMEDIATE: 1,
+    SkillLevel.ADVANCED: 2,
+    SkillLevel.EXPERT: 3
+}
+
+class ShiftScheduler:
+    """Greedy scheduler that fills template position requirements for a week"""
+
+    def __init__(self, db_manager: DatabaseManager, forecaster: Optional[DemandForecaster] = None,
+                 budget_mode: Optional[BudgetMode] = None):
+        self.db_manager = db_manager
+        # When set, template minimums are right-sized to forecast demand
+        self.forecaster = forecaster
+        # When set, the labor_budget setting limits (HARD) or steers (SOFT) staffing
+        self.budget_mode = budget_mode
+
+    def schedule_week(self, week_start: date, location_id: Optional[int] = None,
+                      employees: Optional[List[Employee]] = None,
+                      templates: Optional[List[ShiftTemplate]] = None,
+                      hour_targets: Optional[Dict[int, float]] = None) -> WeeklySchedule:
+        """Build, staff and save the schedule for the week starting at week_start
+
+        hour_targets optionally maps employee id to the hours they should get this
+        week; employees furthest below their target are picked first.
+        """
+        if employees is None:
+            employees = self.db_manager.get_all_employees(EmploymentStatus.ACTIVE)
+        if templates is None:
+            templates = self.db_manager.get_all_shift_templates(location_id)
+        templates_by_id = {template.id: template for template in templates}
+
+        schedule = WeeklySchedule(week_start_date=week_start,
+                                  overtime_rules=self.db_manager.get_overtime_rules())
+        schedule.set_employees(employees)
+        schedule.set_templates(templates_by_id)
+
+        # Staff shifts that already exist for the week, otherwise create them from templates.
+        # Other locations' shifts are loaded too: their assignments constrain this location's staffing
+        week_shifts = self.db_manager.get_shifts(week_start, schedule.week_end_date)
+        existing_shifts: List[Shift] = []
+        outside_shifts: List[Shift] = []
+        for shift in week_shifts:
+            if location_id is None or shift.location_id == location_id:
+                existing_shifts.append(shift)
+            else:
+                outside_shifts.append(shift)
+        new_shifts = [] if existing_shifts else self.build_week_shifts(week_start, templates, location_id)
+
+        for shift in existing_shifts + new_shifts:
+            schedule.add_shift(shift)
+
+        budget = None
+        if self.budget_mode:
+            budget = LaborBudgetTracker.from_settings(self.db_manager)
+            budget.watch(schedule, location_id)
+
+        self.staff_schedule(schedule, employees, templates_by_id, hour_targets, budget, outside_shifts)
+        if budget:
+            schedule.remove_listener(budget.on_change)
+        BreakPlanner.from_settings(self.db_manager).plan_schedule(schedule, templates_by_id)
+
+        # Persist results
+        if new_shifts:
+            self.db_manager.add_shifts(new_shifts)
+        if existing_shifts:
+            self.db_manager.update_shifts_assignments(existing_shifts)
+
+        logger.info(
+            f"Scheduled week of {week_start} (location {location_id}): "
+            f"{schedule.total_labor_hours:.1f} hours, ${schedule.total_labor_cost:.2f}"
+        )
+        return schedule
+
+    def build_week_shifts(self, week_start: date, templates: List[ShiftTemplate],
+                          location_id: Optional[int] = None) -> List[Shift]:
+        """Create unstaffed shifts for every template applicable in the week"""
+        expander = TemplateExpander.from_settings(self.db_manager)
+        location_ids = [location_id] if location_id is not None else None
+        return expander.expand_shifts(templates, week_start, week_start + timedelta(days=6), location_ids)
+
+    def estimate_added_cost(self, schedule: WeeklySchedule, employee_id: int, shift: Shift,
+                            daily_threshold_hours: Optional[float], outside_day_hours: float = 0.0,
+                            outside_week_hours: float = 0.0) -> float:
+        """Cost of giving an employee the whole shift, including the overtime it causes
+
+        outside_day_hours and outside_week_hours are hours the employee already
+        works that day and week at other locations. A daily_threshold_hours of
+        None uses the rules' default, as WeeklySchedule.split_overtime does.
+        """
+        rules = schedule.overtime_rules
+        if daily_threshold_hours is None:
+            daily_threshold_hours = rules.daily_threshold_hours
+        wage = schedule.get_hourly_wage(employee_id)
+        duration = shift.duration_hours
+        day_hours = outside_day_hours + sum(assignment.duration_hours
+                                            for other, assignment in schedule.get_employee_assignments(employee_id)
+                                            if other.date == shift.date)
+        week_hours = outside_week_hours + schedule.get_employee_total_hours(employee_id)
+
+        # Same split as OvertimeRules: daily overtime first, then weekly on the regular part
+        daily_overtime = (max(0.0, day_hours + duration - daily_threshold_hours) -
+                          max(0.0, day_hours - daily_threshold_hours))
+        regular = duration - daily_overtime
+        weekly_limit = rules.weekly_threshold_hours
+        weekly_overtime = max(0.0, week_hours + regular - weekly_limit) - max(0.0, week_hours - weekly_limit)
+        overtime = daily_overtime + weekly_overtime
+        return wage * (duration - overtime) + wage * overtime * rules.overtime_multiplier
+
+    def staff_schedule(self, schedule: WeeklySchedule, employees: List[Employee],
+                       templates_by_id: Dict[int, ShiftTemplate],
+                       hour_targets: Optional[Dict[int, float]] = None,
+                       budget: Optional[LaborBudgetTracker] = None,
+                       outside_shifts: Optional[List[Shift]] = None):
+        """Assign employees to open positions, least-scheduled employees first
+
+        With a budget tracker watching the schedule, picks that would go over
+        budget are skipped in HARD mode and tried last in SOFT mode.
+        outside_shifts are stored shifts of the same week that are not part of
+        the schedule (other locations); their assignments block overlapping
+        picks and count towards hour limits, loads and overtime.
+        """
+        hour_targets = hour_targets or {}
+        wages = {emp.id: emp.hourly_wage for emp in employees}
+        # Stored pairs plus any unsaved cannot_work_with edits on the employees
+        conflict_graph = ConflictGraph.from_database(self.db_manager)
+        conflict_graph.add_employees(employees)
+        validator = ScheduleValidator(employees, conflict_graph=conflict_graph)
+        validator.preload(outside_shifts or [])
+        validator.validate(schedule)
+
+        outside_hours: Dict[int, float] = {}
+        outside_day_hours: Dict[Tuple[int, date], float] = {}
+        for other in outside_shifts or []:
+            for assignment in other.assignments:
+                employee_id = assignment.employee_id
+                outside_hours[employee_id] = outside_hours.get(employee_id, 0.0) + assignment.duration_hours
+                day_key = (employee_id, other.date)
+                outside_day_hours[day_key] = outside_day_hours.get(day_key, 0.0) + assignment.duration_hours
+
+        def added_cost(employee_id: int, shift: Shift, daily_threshold_hours: Optional[float]) -> float:
+            return self.estimate_added_cost(schedule, employee_id, shift, daily_threshold_hours,
+                                            outside_day_hours.get((employee_id, shift.date), 0.0),
+                                            outside_hours.get(employee_id, 0.0))
+
+        fairness = FairnessScorer(employees).load(schedule)
+
+        for shift_date in sorted(schedule.shifts):
+            for shift in sorted(schedule.shifts[shift_date], key=lambda s: s.start_time):
+                template = templates_by_id.get(shift.template_id)
+                if not template:
+                    continue
+
+                requirements = template.position_requirements
+                if self.forecaster and self.forecaster.is_fitted:
+                    requirements = self.forecaster.recommend_requirements(template, shift.date)
+
+                filled = shift.positions_filled
+                crew_mask = conflict_graph.crew_mask(a.employee_id for a in shift.assignments)
+                for requirement in requirements:
+                    needed = requirement.minimum_required - filled.get(requirement.position, 0)
+                    if needed <= 0:
+                        continue
+
+                    candidates = [
+                        emp for emp in employees
+                        if emp.can_work_position(requirement.position)
+                        and emp.is_available(shift.date.weekday(), shift.start_time, shift.end_time)
+                    ]
+                    # Among equally loaded employees prefer the fairest, best-matched pick
+                    probe = ShiftAssignment(0, requirement.position, shift.start_time, shift.end_time)
+                    fairness_gain = dict(zip(
+                        (emp.id for emp in candidates),
+                        fairness.evaluate_add(shift, probe, [emp.id for emp in candidates])
+                    ))
+                    over_budget: Dict[int, bool] = {}
+                    if budget and candidates:
+                        for emp in candidates:
+                            cost = added_cost(emp.id, shift, template.overtime_threshold_hours)
+                            over_budget[emp.id] = budget.would_exceed(shift.location_id, shift.date, cost)
+                    candidates.sort(key=lambda emp: (
+                        over_budget.get(emp.id, False),
+                        emp.primary_position != requirement.position,
+                        schedule.get_employee_total_hours(emp.id) + outside_hours.get(emp.id, 0.0)
+                        - hour_targets.get(emp.id, 0.0),
+                        -fairness_gain[emp.id],
+                        -SKILL_RANK[emp.get_skill_level(requirement.position)]
+                    ))
+
+                    for employee in candidates:
+                        if needed <= 0:
+                            break
+                        if conflict_graph.conflicts_with_crew(employee.id, crew_mask):
+                            continue
+                        # Earlier picks may have used up the budget since candidates were sorted
+                        if budget and self.budget_mode == BudgetMode.HARD and budget.would_exceed(
+                                shift.location_id, shift.date,
+                                added_cost(employee.id, shift, template.overtime_threshold_hours)):
+                            continue
+                        assignment = ShiftAssignment(
+                            employee_id=employee.id,
+                            position=requirement.position,
+                            start_time=shift.start_time,
+                            end_time=shift.end_time
+                        )
+                        if validator.check_assignment(shift, assignment):
+                            continue
+                        assignment = schedule.add_assignment(shift, employee.id, requirement.position)
+                        validator.add_assignment(shift, assignment)
+                        fairness.add(shift, assignment)
+                        crew_mask |= conflict_graph.crew_mask([employee.id])
+                        needed -= 1
+
+                shift.scheduled_labor_cost = sum(
+                    Shift.calculate_assignment_cost(assignment, wages[assignment.employee_id],
+                                                    template.overtime_threshold_hours,
+                                                    schedule.overtime_rules.overtime_multiplier)
+                    for assignment in shift.assignments if assignment.employee_id in wages
+                )
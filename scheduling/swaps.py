@@ -0,0 +1,240 @@
+"""
+Shift swap matching for Restaurant Shift Management System
+
+Employees post swap requests for shifts they want to get rid of. The engine
+finds direct swaps (two employees trade), chain swaps (A takes B's shift, B
+takes C's, C takes A's) and pickups (a colleague takes the shift outright).
+Candidates come from position and weekday indexes, cheap checks run first, and
+every match is confirmed against a ScheduleValidator so position eligibility,
+availability, rest time, weekly hour limits and cannot_work_with all hold.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional, Dict, Set, Tuple
+
+from models.employee import Employee, Position
+from models.shift import Shift, ShiftAssignment, WeeklySchedule
+from scheduling.conflicts import ConflictGraph, ScheduleValidator, DEFAULT_MIN_REST_HOURS
+
+logger = logging.getLogger(__name__)
+
+class SwapKind(Enum):
+    PICKUP = "Pickup"
+    DIRECT = "Direct Swap"
+    CHAIN = "Chain Swap"
+
+@dataclass
+class SwapRequest:
+    employee_id: int
+    shift: Shift
+    accept_trade: bool = True  # willing to take another requester's shift in return
+    accept_pickup: bool = True  # willing to simply hand the shift to someone
+    request_id: Optional[int] = None
+
+    def get_assignment(self) -> Optional[ShiftAssignment]:
+        """Get the requester's assignment on the shift"""
+        for assignment in self.shift.assignments:
+            if assignment.employee_id == self.employee_id:
+                return assignment
+        return None
+
+@dataclass
+class SwapMove:
+    shift: Shift
+    from_employee_id: int
+    to_employee_id: int
+    position: Position
+
+@dataclass
+class SwapMatch:
+    kind: SwapKind
+    requests: List[SwapRequest]
+    moves: List[SwapMove] = field(default_factory=list)
+
+class SwapEngine:
+    """Matches swap requests against one weekly schedule"""
+
+    def __init__(self, schedule: WeeklySchedule, employees: List[Employee],
+                 conflict_graph: Optional[ConflictGraph] = None,
+                 min_rest_hours: float = DEFAULT_MIN_REST_HOURS):
+        self.schedule = schedule
+        self.employees = {emp.id: emp for emp in employees}
+        self.validator = ScheduleValidator(employees, min_rest_hours, conflict_graph)
+        self.validator.validate(schedule)
+
+        # Candidate indexes: who can work each position, who is available each weekday
+        self.by_position: Dict[Position, Set[int]] = {}
+        self.by_weekday: Dict[int, Set[int]] = {}
+        for emp in employees:
+            for position in Position:
+                if emp.can_work_position(position):
+                    self.by_position.setdefault(position, set()).add(emp.id)
+            for availability in emp.availability:
+                self.by_weekday.setdefault(availability.day_of_week, set()).add(emp.id)
+
+    def _can_cover(self, employee_id: int, shift: Shift, assignment: ShiftAssignment) -> bool:
+        """Cheap eligibility and availability check"""
+        employee = self.employees.get(employee_id)
+        return (employee is not None
+                and employee_id in self.by_position.get(assignment.position, ())
+                and employee.is_available(shift.date.weekday(), assignment.start_time, assignment.end_time))
+
+    def _moved(self, assignment: ShiftAssignment, employee_id: int) -> ShiftAssignment:
+        """Copy of an assignment handed to another employee"""
+        return ShiftAssignment(employee_id, assignment.position, assignment.start_time, assignment.end_time)
+
+    def _try_moves(self, moves: List[Tuple[Shift, ShiftAssignment, int]]) -> bool:
+        """Apply (shift, assignment, new employee) moves to the validator if all are valid
+
+        On failure the validator is restored and False is returned.
+        """
+        for shift, assignment, _ in moves:
+            self.validator.remove_assignment(shift, assignment.employee_id)
+
+        added: List[Tuple[Shift, ShiftAssignment]] = []
+        valid = True
+        for shift, assignment, employee_id in moves:
+            moved = self._moved(assignment, employee_id)
+            if self.validator.check_assignment(shift, moved):
+                valid = False
+                break
+            self.validator.add_assignment(shift, moved)
+            added.append((shift, moved))
+
+        if not valid:
+            for shift, moved in added:
+                self.validator.remove_assignment(shift, moved.employee_id)
+            for shift, assignment, _ in moves:
+                self.validator.add_assignment(shift, assignment)
+        return valid
+
+    def _trade_edges(self, requests: List[SwapRequest],
+                     assignments: List[ShiftAssignment]) -> List[Set[int]]:
+        """edges[i] holds every request j whose shift request i's employee could take
+
+        Each requester is assumed to give up their own shift; chains are still
+        validated in full before they are accepted.
+        """
+        for request, assignment in zip(requests, assignments):
+            self.validator.remove_assignment(request.shift, assignment.employee_id)
+
+        by_day: Dict[int, List[int]] = {}
+        for index, request in enumerate(requests):
+            by_day.setdefault(request.shift.date.weekday(), []).append(index)
+
+        edges: List[Set[int]] = [set() for _ in requests]
+        try:
+            for index, request in enumerate(requests):
+                if not request.accept_trade:
+                    continue
+                employee_id = request.employee_id
+                for weekday, targets in by_day.items():
+                    if employee_id not in self.by_weekday.get(weekday, ()):
+                        continue
+                    for target in targets:
+                        other = requests[target]
+                        if (target == index or not other.accept_trade or other.employee_id == employee_id
+                                or other.shift is request.shift
+                                or not self._can_cover(employee_id, other.shift, assignments[target])):
+                            continue
+                        if not self.validator.check_assignment(
+                                other.shift, self._moved(assignments[target], employee_id)):
+                            edges[index].add(target)
+        finally:
+            for request, assignment in zip(requests, assignments):
+                self.validator.add_assignment(request.shift, assignment)
+        return edges
+
+    def find_matches(self, requests: List[SwapRequest], max_chain: int = 3) -> List[SwapMatch]:
+        """Resolve requests into direct swaps, chains up to max_chain long, then pickups
+
+        Accepted matches are applied to the engine's validator so later matches
+        see them; call apply() to write them into the schedule.
+        """
+        pending = [(request, request.get_assignment()) for request in requests]
+        pending = [(request, assignment) for request, assignment in pending if assignment]
+        requests = [request for request, _ in pending]
+        assignments = [assignment for _, assignment in pending]
+
+        edges = self._trade_edges(requests, assignments)
+        matched: Set[int] = set()
+        matches: List[SwapMatch] = []
+        # Hours gained (or given up) through accepted moves, not yet in the schedule
+        hours_delta: Dict[int, float] = {}
+
+        def record(moves: List[Tuple[Shift, ShiftAssignment, int]]):
+            for _, assignment, employee_id in moves:
+                hours = assignment.duration_hours
+                hours_delta[employee_id] = hours_delta.get(employee_id, 0.0) + hours
+                hours_delta[assignment.employee_id] = hours_delta.get(assignment.employee_id, 0.0) - hours
+
+        def accept(cycle: List[int], kind: SwapKind) -> bool:
+            # Employee of cycle[k] takes the shift of cycle[k + 1]
+            moves = [(requests[cycle[(k + 1) % len(cycle)]].shift, assignments[cycle[(k + 1) % len(cycle)]],
+                      requests[cycle[k]].employee_id) for k in range(len(cycle))]
+            if not self._try_moves(moves):
+                return False
+            record(moves)
+            matched.update(cycle)
+            matches.append(SwapMatch(kind, [requests[index] for index in cycle], [
+                SwapMove(shift, assignment.employee_id, employee_id, assignment.position)
+                for shift, assignment, employee_id in moves
+            ]))
+            return True
+
+        # Direct swaps first, then three-way chains
+        for first in range(len(requests)):
+            for second in sorted(edges[first]):
+                if first in matched:
+                    break
+                if second > first and second not in matched and first in edges[second]:
+                    accept([first, second], SwapKind.DIRECT)
+        if max_chain >= 3:
+            incoming: List[Set[int]] = [set() for _ in requests]
+            for source, targets in enumerate(edges):
+                for target in targets:
+                    incoming[target].add(source)
+            for first in range(len(requests)):
+                for second in sorted(edges[first]):
+                    if first in matched:
+                        break
+                    if second in matched:
+                        continue
+                    for third in sorted(edges[second] & incoming[first]):
+                        if third not in matched and third != first and accept([first, second, third], SwapKind.CHAIN):
+                            break
+
+        # Anything left can go to a colleague with the fewest hours
+        for index, request in enumerate(requests):
+            if index in matched or not request.accept_pickup:
+                continue
+            assignment = assignments[index]
+            candidates = (self.by_position.get(assignment.position, set()) &
+                          self.by_weekday.get(request.shift.date.weekday(), set()))
+            candidates.discard(request.employee_id)
+            for employee_id in sorted(candidates, key=lambda emp_id: (
+                    self.schedule.get_employee_total_hours(emp_id) + hours_delta.get(emp_id, 0.0), emp_id)):
+                if not self._can_cover(employee_id, request.shift, assignment):
+                    continue
+                move = [(request.shift, assignment, employee_id)]
+                if self._try_moves(move):
+                    record(move)
+                    matched.add(index)
+                    matches.append(SwapMatch(SwapKind.PICKUP, [request], [
+                        SwapMove(request.shift, request.employee_id, employee_id, assignment.position)
+                    ]))
+                    break
+
+        logger.info(f"Matched {len(matched)}/{len(requests)} swap requests in {len(matches)} matches")
+        return matches
+
+    def apply(self, matches: List[SwapMatch]):
+        """Write matched moves into the schedule"""
+        for match in matches:
+            for move in match.moves:
+                original = next(a for a in move.shift.assignments if a.employee_id == move.from_employee_id)
+                self.schedule.remove_assignment(move.shift, move.from_employee_id)
+                self.schedule.add_assignment(move.shift, move.to_employee_id, move.position,
+                                             original.start_time, original.end_time)
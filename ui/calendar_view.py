@@ -2,10 +2,47 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk
 from datetime import datetime, date, timedelta
+from typing import List, Sequence, Tuple
 import calendar
 
 from database.db_manager import DatabaseManager
 
+# Month grid geometry: weekday header row, then six week rows
+HEADER_HEIGHT = 30
+MONTH_ROWS = 6
+
+# Week view: width of the hour gutter and the hours shown when no shifts fall outside them
+HOUR_GUTTER = 50
+DEFAULT_HOURS = (6, 24)
+
+def assign_lanes(intervals: Sequence[Tuple[int, int]]) -> Tuple[List[int], int]:
+    """Place overlapping (start, end) intervals side by side
+    
+    Returns the lane of each interval, in input order, and the number of lanes
+    used. Each interval takes the lowest lane free at its start.
+    """
+    lanes = [0] * len(intervals)
+    lane_ends: List[int] = []
+    for index in sorted(range(len(intervals)), key=lambda i: intervals[i]):
+        start, end = intervals[index]
+        for lane, lane_end in enumerate(lane_ends):
+            if lane_end <= start:
+                break
+        else:
+            lane = len(lane_ends)
+            lane_ends.append(end)
+        lane_ends[lane] = end
+        lanes[index] = lane
+    return lanes, len(lane_ends)
+
+def shift_minutes(shift) -> Tuple[int, int]:
+    """Start and end of a shift in minutes from midnight of its date; overnight ends pass 1440"""
+    start = shift.start_time.hour * 60 + shift.start_time.minute
+    end = shift.end_time.hour * 60 + shift.end_time.minute
+    if end <= start:
+        end += 24 * 60
+    return start, end
+
 class CalendarViewFrame(ctk.CTkFrame):
     def __init__(self, parent, db_manager: DatabaseManager, main_app):
         super().__init__(parent)
@@ -16,6 +53,8 @@ class CalendarViewFrame(ctk.CTkFrame):
         
         # Current date for calendar navigation
         self.current_date = date.today()
+        self.selected_date = None
+        self.view_mode = "Month"
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -87,9 +126,26 @@ class CalendarViewFrame(ctk.CTkFrame):
             height=30
         )
         self.today_btn.grid(row=0, column=3, padx=(0, 20), pady=20)
+        
+        # Month / week switch
+        self.view_switch = ctk.CTkSegmentedButton(
+            header_frame,
+            values=["Month", "Week"],
+            command=self.set_view_mode,
+            font=ctk.CTkFont(size=12, weight="bold"),
+            selected_color=self.colors['secondary']
+        )
+        self.view_switch.set(self.view_mode)
+        self.view_switch.grid(row=0, column=4, padx=(0, 20), pady=20)
     
     def create_calendar(self):
-        """Create calendar grid"""
+        """Create calendar grid
+        
+        The grid is one canvas whose items are created once: 7 weekday headers
+        and 42 day cells for the month view, plus pooled hour lines and shift
+        blocks for the week view. Navigating only changes item text, colors and
+        coordinates, so no widgets are created or destroyed.
+        """
         # Main content frame
         content_frame = ctk.CTkFrame(self)
         content_frame.grid(row=1, column=0, sticky="nsew", padx=20, pady=20)
@@ -100,12 +156,48 @@ class CalendarViewFrame(ctk.CTkFrame):
         # Calendar frame
         self.calendar_frame = ctk.CTkFrame(content_frame)
         self.calendar_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 10), pady=0)
-        
-        # Configure calendar grid
-        for i in range(7):  # 7 columns for days of week
-            self.calendar_frame.grid_columnconfigure(i, weight=1, minsize=120)
-        for i in range(7):  # 7 rows (header + 6 weeks)
-            self.calendar_frame.grid_rowconfigure(i, weight=1, minsize=80)
+        self.calendar_frame.grid_columnconfigure(0, weight=1)
+        self.calendar_frame.grid_rowconfigure(0, weight=1)
+        
+        self.canvas = tk.Canvas(
+            self.calendar_frame,
+            bg=self.colors['dark_bg'],
+            highlightthickness=0,
+            width=7 * 120,
+            height=HEADER_HEIGHT + MONTH_ROWS * 80
+        )
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        
+        self.header_font = ctk.CTkFont(size=14, weight="bold")
+        self.day_font = ctk.CTkFont(size=16, weight="bold")
+        self.info_font = ctk.CTkFont(size=10)
+        
+        # Weekday headers, shared by both views
+        self.header_items = []
+        for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']:
+            rect = self.canvas.create_rectangle(0, 0, 0, 0, fill=self.colors['light_bg'],
+                                                outline=self.colors['dark_bg'])
+            text = self.canvas.create_text(0, 0, text=day, font=self.header_font,
+                                           fill=self.colors['text_light'])
+            self.header_items.append((rect, text))
+        
+        # Month cells: background, day number and shift indicator
+        self.cell_items = []
+        for _ in range(7 * MONTH_ROWS):
+            rect = self.canvas.create_rectangle(0, 0, 0, 0, tags=("month",))
+            day_text = self.canvas.create_text(0, 0, font=self.day_font, anchor="n", tags=("month",))
+            info_text = self.canvas.create_text(0, 0, font=self.info_font, anchor="n", tags=("month",))
+            self.cell_items.append((rect, day_text, info_text))
+        self.cell_dates = [None] * len(self.cell_items)
+        
+        # Week view pools, grown on demand and hidden when unused
+        self.hour_items = []
+        self.week_blocks = []
+        self.week_shifts = []
+        self.week_range = DEFAULT_HOURS
+        
+        self.canvas.bind("<Configure>", lambda e: self.layout_calendar())
+        self.canvas.bind("<Button-1>", self.on_canvas_click)
         
         self.draw_calendar()
     
@@ -226,125 +318,278 @@ class CalendarViewFrame(ctk.CTkFrame):
         export_btn.pack(pady=(5, 15), padx=15, fill="x")
     
     def draw_calendar(self):
-        """Draw the calendar grid"""
-        # Clear existing calendar
-        for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
-        
-        # Day of week headers
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        for i, day in enumerate(days):
-            header = ctk.CTkLabel(
-                self.calendar_frame,
-                text=day,
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color=self.colors['text_primary'],
-                fg_color=self.colors['sidebar']
-            )
-            header.grid(row=0, column=i, sticky="nsew", padx=1, pady=1)
-        
-        # Get calendar data
-        cal = calendar.monthcalendar(self.current_date.year, self.current_date.month)
+        """Update the calendar canvas for the current month or week"""
+        if self.view_mode == "Week":
+            self.draw_week()
+        else:
+            self.draw_month()
+        self.layout_calendar()
+        self.update_selection()
+    
+    def draw_month(self):
+        """Fill the 42 month cells with dates and real shift counts"""
+        self.canvas.itemconfigure("week", state="hidden")
+        self.canvas.itemconfigure("month", state="normal")
+        for (rect, text), day in zip(self.header_items,
+                                     ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']):
+            self.canvas.itemconfigure(text, text=day)
+        
+        first_day = self.current_date.replace(day=1)
+        grid_start = first_day - timedelta(days=first_day.weekday())
+        grid_end = grid_start + timedelta(days=len(self.cell_items) - 1)
+        
+        # One grouped query per month; reused until shifts change
+        counts = self.db_manager.report_cache.get_or_compute(
+            "calendar_day_counts", (grid_start, grid_end), ("shifts",),
+            lambda: {row['date']: dict(row) for row in self.db_manager.get_daily_shift_counts(grid_start, grid_end)})
         
-        # Draw calendar days
         today = date.today()
-        
-        for week_num, week in enumerate(cal, 1):
-            for day_num, day in enumerate(week):
-                if day == 0:
-                    # Empty cell for days not in current month
-                    cell = ctk.CTkFrame(self.calendar_frame, fg_color="transparent")
+        for index, (rect, day_text, info_text) in enumerate(self.cell_items):
+            cell_date = grid_start + timedelta(days=index)
+            if cell_date.month != first_day.month:
+                # Empty cell for days not in current month
+                self.cell_dates[index] = None
+                for item in (rect, day_text, info_text):
+                    self.canvas.itemconfigure(item, state="hidden")
+                continue
+            self.cell_dates[index] = cell_date
+            
+            # Determine cell color
+            if cell_date == today:
+                fill = self.colors['primary']
+                text_color = self.colors['text_dark']
+            elif cell_date.weekday() >= 5:  # Weekend
+                fill = self.colors['light_bg']
+                text_color = self.colors['text_light']
+            else:
+                fill = self.colors['medium_bg']
+                text_color = self.colors['text_light']
+            
+            # Shift indicator
+            day_counts = counts.get(cell_date.isoformat())
+            if not day_counts:
+                info, info_color = "", text_color
+            elif day_counts['unstaffed_count']:
+                info, info_color = f"⚠️ {day_counts['unstaffed_count']} unstaffed", self.colors['error']
+            else:
+                shifts = day_counts['shift_count']
+                info, info_color = f"🍟 {shifts} shift{'s' if shifts != 1 else ''}", self.colors['success']
+            if cell_date == today:
+                info_color = text_color
+            
+            self.canvas.itemconfigure(rect, fill=fill)
+            self.canvas.itemconfigure(day_text, text=str(cell_date.day), fill=text_color)
+            self.canvas.itemconfigure(info_text, text=info, fill=info_color)
+    
+    def draw_week(self):
+        """Build shift blocks for the displayed week"""
+        self.canvas.itemconfigure("month", state="hidden")
+        week_start = self.get_week_start()
+        for index, (rect, text) in enumerate(self.header_items):
+            self.canvas.itemconfigure(text, text=(week_start + timedelta(days=index)).strftime("%a %d"))
+        
+        cache = self.db_manager.report_cache
+        shifts = cache.get_or_compute(
+            "calendar_week_shifts", week_start, ("shifts",),
+            lambda: self.db_manager.get_shifts(week_start, week_start + timedelta(days=6)))
+        templates = cache.get_or_compute(
+            "calendar_templates", None, ("templates",),
+            lambda: {template.id: template for template in self.db_manager.get_all_shift_templates()})
+        
+        # Hours shown: the default day, widened to fit every shift
+        first_hour, last_hour = DEFAULT_HOURS
+        for shift in shifts:
+            start, end = shift_minutes(shift)
+            first_hour = min(first_hour, start // 60)
+            last_hour = max(last_hour, -(-end // 60))
+        self.week_range = (first_hour, last_hour)
+        
+        # Lanes per day, so overlapping shifts sit side by side
+        self.week_shifts = []
+        for day in range(7):
+            day_shifts = [shift for shift in shifts if (shift.date - week_start).days == day]
+            intervals = [shift_minutes(shift) for shift in day_shifts]
+            lanes, lane_count = assign_lanes(intervals)
+            for shift, (start, end), lane in zip(day_shifts, intervals, lanes):
+                template = templates.get(shift.template_id)
+                if not shift.assignments:
+                    fill, text_color = self.colors['error'], self.colors['text_light']
+                elif template and shift.get_understaffed_positions(template):
+                    fill, text_color = self.colors['warning'], self.colors['text_dark']
                 else:
-                    # Create date for this cell
-                    cell_date = date(self.current_date.year, self.current_date.month, day)
-                    
-                    # Determine cell color
-                    if cell_date == today:
-                        fg_color = self.colors['primary']
-                        text_color = "white"
-                    elif cell_date.weekday() >= 5:  # Weekend
-                        fg_color = self.colors['sidebar']
-                        text_color = self.colors['text_secondary']
-                    else:
-                        fg_color = self.colors['background']
-                        text_color = self.colors['text_primary']
-                    
-                    # Create cell frame
-                    cell = ctk.CTkFrame(
-                        self.calendar_frame,
-                        fg_color=fg_color,
-                        border_width=1,
-                        border_color=self.colors['text_secondary']
-                    )
-                    
-                    # Day number
-                    day_label = ctk.CTkLabel(
-                        cell,
-                        text=str(day),
-                        font=ctk.CTkFont(size=16, weight="bold"),
-                        text_color=text_color
-                    )
-                    day_label.pack(pady=(5, 0))
-                    
-                    # Sample shift indicators
-                    if day % 3 == 0:  # Show shifts on every 3rd day
-                        shift_indicator = ctk.CTkLabel(
-                            cell,
-                            text="🍟 3 shifts",
-                            font=ctk.CTkFont(size=10),
-                            text_color=self.colors['success'] if cell_date != today else "white"
-                        )
-                        shift_indicator.pack()
-                    elif day % 5 == 0:  # Show different indicator on every 5th day
-                        shift_indicator = ctk.CTkLabel(
-                            cell,
-                            text="⚠️ Understaffed",
-                            font=ctk.CTkFont(size=10),
-                            text_color=self.colors['danger'] if cell_date != today else "white"
-                        )
-                        shift_indicator.pack()
-                    
-                    # Bind click event
-                    cell.bind("<Button-1>", lambda e, d=cell_date: self.on_date_click(d))
-                    day_label.bind("<Button-1>", lambda e, d=cell_date: self.on_date_click(d))
-                
-                cell.grid(row=week_num, column=day_num, sticky="nsew", padx=1, pady=1)
+                    fill, text_color = self.colors['primary'], self.colors['text_dark']
+                label = (f"{template.name if template else 'Shift'}\n"
+                         f"{shift.start_time.strftime('%H:%M')}-{shift.end_time.strftime('%H:%M')}\n"
+                         f"👥 {len(shift.assignments)}")
+                self.week_shifts.append((day, start, end, lane, lane_count, fill, text_color, label))
+        
+        # Grow the pools to fit; items beyond what this week needs stay hidden
+        while len(self.hour_items) <= last_hour - first_hour:
+            self.hour_items.append((
+                self.canvas.create_line(0, 0, 0, 0, fill=self.colors['light_bg'], tags=("week",)),
+                self.canvas.create_text(0, 0, anchor="e", font=self.info_font,
+                                        fill=self.colors['text_light'], tags=("week",))
+            ))
+        while len(self.week_blocks) < len(self.week_shifts):
+            self.week_blocks.append((
+                self.canvas.create_rectangle(0, 0, 0, 0, outline=self.colors['dark_bg'], tags=("week",)),
+                self.canvas.create_text(0, 0, anchor="nw", font=self.info_font, tags=("week",))
+            ))
+        
+        for index, (line, text) in enumerate(self.hour_items):
+            state = "normal" if index <= last_hour - first_hour else "hidden"
+            self.canvas.itemconfigure(line, state=state)
+            self.canvas.itemconfigure(text, state=state, text=f"{(first_hour + index) % 24:02d}:00")
+        for index, (rect, text) in enumerate(self.week_blocks):
+            if index < len(self.week_shifts):
+                day, start, end, lane, lane_count, fill, text_color, label = self.week_shifts[index]
+                self.canvas.itemconfigure(rect, state="normal", fill=fill)
+                self.canvas.itemconfigure(text, state="normal", text=label, fill=text_color)
+            else:
+                self.canvas.itemconfigure(rect, state="hidden")
+                self.canvas.itemconfigure(text, state="hidden")
+    
+    def canvas_size(self):
+        """Canvas width and height, falling back to the requested size before it is mapped"""
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            width, height = int(self.canvas.cget("width")), int(self.canvas.cget("height"))
+        return width, height
+    
+    def layout_calendar(self):
+        """Position canvas items for the current size; called on resize and after drawing"""
+        width, height = self.canvas_size()
+        left = HOUR_GUTTER if self.view_mode == "Week" else 0
+        column_width = (width - left) / 7
+        for index, (rect, text) in enumerate(self.header_items):
+            x = left + index * column_width
+            self.canvas.coords(rect, x, 0, x + column_width, HEADER_HEIGHT)
+            self.canvas.coords(text, x + column_width / 2, HEADER_HEIGHT / 2)
+        
+        if self.view_mode == "Week":
+            self.layout_week(width, height, column_width)
+        else:
+            self.layout_month(height, column_width)
+    
+    def layout_month(self, height, column_width):
+        """Size the month cells to fill the canvas"""
+        row_height = (height - HEADER_HEIGHT) / MONTH_ROWS
+        for index, (rect, day_text, info_text) in enumerate(self.cell_items):
+            row, column = divmod(index, 7)
+            x = column * column_width
+            y = HEADER_HEIGHT + row * row_height
+            self.canvas.coords(rect, x + 1, y + 1, x + column_width - 1, y + row_height - 1)
+            self.canvas.coords(day_text, x + column_width / 2, y + 5)
+            self.canvas.coords(info_text, x + column_width / 2, y + 30)
+            self.canvas.itemconfigure(info_text, width=max(column_width - 8, 1))
+    
+    def layout_week(self, width, height, column_width):
+        """Place hour lines and shift blocks on the week timeline"""
+        first_hour, last_hour = self.week_range
+        hour_height = (height - HEADER_HEIGHT) / (last_hour - first_hour)
+        for index, (line, text) in enumerate(self.hour_items[:last_hour - first_hour + 1]):
+            y = HEADER_HEIGHT + index * hour_height
+            self.canvas.coords(line, HOUR_GUTTER, y, width, y)
+            self.canvas.coords(text, HOUR_GUTTER - 4, max(y, HEADER_HEIGHT + 6))
+        
+        for (rect, text), (day, start, end, lane, lane_count, *_) in zip(self.week_blocks, self.week_shifts):
+            lane_width = column_width / lane_count
+            x0 = HOUR_GUTTER + day * column_width + lane * lane_width + 1
+            x1 = x0 + lane_width - 2
+            y0 = HEADER_HEIGHT + (start / 60 - first_hour) * hour_height
+            y1 = HEADER_HEIGHT + (end / 60 - first_hour) * hour_height
+            self.canvas.coords(rect, x0, y0, x1, y1)
+            self.canvas.coords(text, x0 + 3, y0 + 2)
+            # Labels only where they fit; narrow blocks keep just their color
+            fits = x1 - x0 >= 30 and y1 - y0 >= 16
+            self.canvas.itemconfigure(text, state="normal" if fits else "hidden", width=max(x1 - x0 - 6, 1))
+    
+    def update_selection(self):
+        """Outline the selected date in either view"""
+        week_start = self.get_week_start()
+        for index, (rect, text) in enumerate(self.header_items):
+            selected = self.view_mode == "Week" and week_start + timedelta(days=index) == self.selected_date
+            self.canvas.itemconfigure(rect, fill=self.colors['secondary'] if selected else self.colors['light_bg'])
+        for (rect, day_text, info_text), cell_date in zip(self.cell_items, self.cell_dates):
+            selected = cell_date is not None and cell_date == self.selected_date
+            self.canvas.itemconfigure(rect, outline=self.colors['secondary'] if selected else self.colors['dark_bg'],
+                                      width=3 if selected else 1)
+    
+    def on_canvas_click(self, event):
+        """Map a click on the canvas to the date under it"""
+        width, height = self.canvas_size()
+        if self.view_mode == "Week":
+            column = int((event.x - HOUR_GUTTER) // ((width - HOUR_GUTTER) / 7))
+            if 0 <= column < 7 and event.x >= HOUR_GUTTER:
+                self.on_date_click(self.get_week_start() + timedelta(days=column))
+            return
+        
+        if event.y < HEADER_HEIGHT:
+            return
+        column = int(event.x // (width / 7))
+        row = int((event.y - HEADER_HEIGHT) // ((height - HEADER_HEIGHT) / MONTH_ROWS))
+        if 0 <= column < 7 and 0 <= row < MONTH_ROWS and self.cell_dates[row * 7 + column]:
+            self.on_date_click(self.cell_dates[row * 7 + column])
     
     def get_month_year_text(self):
         """Get formatted month and year text"""
         return self.current_date.strftime("%B %Y")
     
+    def get_period_text(self):
+        """Header text for the displayed month or week"""
+        if self.view_mode == "Week":
+            return f"Week of {self.get_week_start().strftime('%B %d, %Y')}"
+        return self.get_month_year_text()
+    
+    def get_week_start(self):
+        """Monday of the week containing the current date"""
+        return self.current_date - timedelta(days=self.current_date.weekday())
+    
+    def set_view_mode(self, mode):
+        """Switch between the month grid and the week timeline"""
+        self.view_mode = mode
+        self.view_switch.set(mode)
+        self.month_label.configure(text=self.get_period_text())
+        self.draw_calendar()
+        self.main_app.update_status(f"Viewing {self.get_period_text()}")
+    
     def previous_month(self):
-        """Navigate to previous month"""
-        if self.current_date.month == 1:
-            self.current_date = self.current_date.replace(year=self.current_date.year - 1, month=12)
+        """Navigate to previous month, or previous week in week view"""
+        if self.view_mode == "Week":
+            self.current_date -= timedelta(weeks=1)
+        elif self.current_date.month == 1:
+            self.current_date = self.current_date.replace(year=self.current_date.year - 1, month=12, day=1)
         else:
-            self.current_date = self.current_date.replace(month=self.current_date.month - 1)
+            self.current_date = self.current_date.replace(month=self.current_date.month - 1, day=1)
         
-        self.month_label.configure(text=self.get_month_year_text())
+        self.month_label.configure(text=self.get_period_text())
         self.draw_calendar()
-        self.main_app.update_status(f"Viewing {self.get_month_year_text()}")
+        self.main_app.update_status(f"Viewing {self.get_period_text()}")
     
     def next_month(self):
-        """Navigate to next month"""
-        if self.current_date.month == 12:
-            self.current_date = self.current_date.replace(year=self.current_date.year + 1, month=1)
+        """Navigate to next month, or next week in week view"""
+        if self.view_mode == "Week":
+            self.current_date += timedelta(weeks=1)
+        elif self.current_date.month == 12:
+            self.current_date = self.current_date.replace(year=self.current_date.year + 1, month=1, day=1)
         else:
-            self.current_date = self.current_date.replace(month=self.current_date.month + 1)
+            self.current_date = self.current_date.replace(month=self.current_date.month + 1, day=1)
         
-        self.month_label.configure(text=self.get_month_year_text())
+        self.month_label.configure(text=self.get_period_text())
         self.draw_calendar()
-        self.main_app.update_status(f"Viewing {self.get_month_year_text()}")
+        self.main_app.update_status(f"Viewing {self.get_period_text()}")
     
     def go_to_today(self):
         """Navigate to current month"""
         self.current_date = date.today()
-        self.month_label.configure(text=self.get_month_year_text())
+        self.month_label.configure(text=self.get_period_text())
         self.draw_calendar()
-        self.main_app.update_status("Viewing current month")
+        self.main_app.update_status(f"Viewing current {self.view_mode.lower()}")
     
     def on_date_click(self, selected_date):
         """Handle date click"""
+        self.selected_date = selected_date
+        self.update_selection()
         self.selected_date_label.configure(
             text=selected_date.strftime("%A, %B %d, %Y")
         )
@@ -395,19 +640,59 @@ class CalendarViewFrame(ctk.CTkFrame):
         )
     
     def view_schedule(self):
-        """View detailed schedule (placeholder)"""
-        from tkinter import messagebox
-        messagebox.showinfo(
-            "View Schedule",
-            "This feature will show a detailed\nschedule view for the selected date.\n\n"
-            "Coming soon in the next update!"
-        )
+        """Show the week of the selected date as a timeline"""
+        if self.selected_date:
+            self.current_date = self.selected_date
+        self.set_view_mode("Week")
     
     def export_month(self):
-        """Export month schedule (placeholder)"""
-        from tkinter import messagebox
-        messagebox.showinfo(
-            "Export Month",
-            "This feature will export the entire\nmonth's schedule to PDF or Excel.\n\n"
-            "Coming soon in the next update!"
-        ) 
\ No newline at end of file
+        """Export every week of the displayed month to PDF, one file per location and week"""
+        from tkinter import messagebox, filedialog
+        try:
+            from scheduling.schedule_pdf import build_jobs, render_in_background
+        except ImportError:
+            messagebox.showerror(
+                "Missing Dependency",
+                "PDF export requires reportlab.\n\nPlease install it with:\npip install reportlab"
+            )
+            return
+        
+        directory = filedialog.askdirectory(title="Export Month Schedules To")
+        if not directory:
+            return
+        
+        # Weeks (Monday start) overlapping the displayed month
+        first_day = self.current_date.replace(day=1)
+        last_day = first_day.replace(day=calendar.monthrange(first_day.year, first_day.month)[1])
+        week_start = first_day - timedelta(days=first_day.weekday())
+        week_starts = []
+        while week_start <= last_day:
+            week_starts.append(week_start)
+            week_start += timedelta(weeks=1)
+        
+        location_ids = sorted({template.location_id for template in self.db_manager.get_all_shift_templates()
+                               if template.location_id is not None}) or [None]
+        jobs = build_jobs(self.db_manager.db_path, week_starts, directory, location_ids)
+        month_text = self.get_month_year_text()
+        
+        def on_progress(completed, total, result):
+            self.after(0, lambda: self.main_app.update_status(f"Rendering schedules: {completed}/{total}"))
+        
+        def on_done(results):
+            failed = [result for result in results if not result.succeeded]
+            def finish():
+                self.main_app.update_status(f"Exported {len(results) - len(failed)} schedule PDFs to {directory}")
+                if failed:
+                    messagebox.showerror(
+                        "Export Error",
+                        f"{len(failed)} of {len(results)} schedules failed:\n{failed[0].error}"
+                    )
+                else:
+                    messagebox.showinfo(
+                        "Export Successful",
+                        f"{len(results)} schedules for {month_text} exported to:\n{directory}"
+                    )
+            self.after(0, finish)
+        
+        render_in_background(jobs, on_progress=on_progress, on_done=on_done)
+        self.main_app.update_status(f"Rendering {len(jobs)} schedules...") 
\ No newline at end of file
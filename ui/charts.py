@@ -0,0 +1,165 @@
+"""
+Dashboard charts for Restaurant Shift Management System
+
+Charts are drawn with matplotlib's Agg backend on a background thread (the
+object-oriented Figure API, never pyplot, so no GUI backend is involved) and
+kept as PNG bytes in the database report cache, keyed by chart, parameters and
+pixel size and invalidated by the data versions of the scopes they read. The
+Tk thread only decodes the PNG into a CTkImage, so showing a chart whose data
+has not changed costs no drawing at all.
+"""
+
+import io
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import customtkinter as ctk
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+
+from database.db_manager import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# Dark theme to match the application's CustomTkinter appearance
+BACKGROUND = "#2b2b2b"
+FOREGROUND = "#dce4ee"
+GRID = "#4a4a4a"
+
+# Sizes are rounded to this many pixels so small resizes reuse cached charts
+SIZE_STEP = 50
+
+DrawFunction = Callable[[Figure], None]
+
+def _style_axes(axes, title: str, grid_axis: str = "y"):
+    axes.set_facecolor(BACKGROUND)
+    axes.set_title(title, color=FOREGROUND, fontsize=11, loc="left")
+    axes.tick_params(colors=FOREGROUND, labelsize=8)
+    axes.grid(axis=grid_axis, color=GRID, linewidth=0.5)
+    axes.set_axisbelow(True)
+    for spine in axes.spines.values():
+        spine.set_color(GRID)
+
+def draw_position_distribution(figure: Figure, positions: List[Dict[str, Any]], color: str):
+    """Horizontal bars of employees per primary position"""
+    axes = figure.add_subplot()
+    rows = sorted(positions, key=lambda row: row['employee_count'])
+    axes.barh([row['primary_position'] for row in rows], [row['employee_count'] for row in rows], color=color)
+    for index, row in enumerate(rows):
+        axes.text(row['employee_count'], index, f" {row['employee_count']}", va="center",
+                  color=FOREGROUND, fontsize=8)
+    _style_axes(axes, "Employees", grid_axis="x")
+
+def draw_labor_costs(figure: Figure, daily_rows: List[Dict[str, Any]], positions: List[Dict[str, Any]],
+                     period: str, color: str, overtime_color: str):
+    """Scheduled cost per day of the period next to estimated weekly cost per position"""
+    daily_axes, position_axes = figure.subplots(1, 2, gridspec_kw={"width_ratios": [3, 2]})
+
+    days = sorted({row['period'] for row in daily_rows})
+    regular = {day: 0.0 for day in days}
+    overtime = {day: 0.0 for day in days}
+    for row in daily_rows:
+        # Split cost by the hours' overtime share
+        share = row['overtime_hours'] / row['hours'] if row['hours'] else 0.0
+        overtime[row['period']] += row['labor_cost'] * share
+        regular[row['period']] += row['labor_cost'] * (1 - share)
+    labels = [day[5:] for day in days]
+    daily_axes.bar(labels, [regular[day] for day in days], color=color, label="Regular")
+    daily_axes.bar(labels, [overtime[day] for day in days], bottom=[regular[day] for day in days],
+                   color=overtime_color, label="Overtime")
+    if days:
+        daily_axes.legend(fontsize=8, facecolor=BACKGROUND, labelcolor=FOREGROUND, edgecolor=GRID)
+        step = max(1, len(days) // 12)
+        daily_axes.set_xticks(range(0, len(days), step), labels[::step], rotation=45, ha="right")
+    else:
+        daily_axes.text(0.5, 0.5, "No shifts scheduled", transform=daily_axes.transAxes,
+                        ha="center", color=FOREGROUND)
+    daily_axes.set_ylabel("$", color=FOREGROUND)
+    _style_axes(daily_axes, f"Scheduled labor cost - {period}")
+
+    rows = sorted(positions, key=lambda row: row['weekly_labor_cost'])
+    position_axes.barh([row['primary_position'] for row in rows], [row['weekly_labor_cost'] for row in rows],
+                       color=color)
+    _style_axes(position_axes, "Estimated weekly cost by position", grid_axis="x")
+
+def draw_performance(figure: Figure, records: List[Dict[str, Any]], color: str, secondary_color: str):
+    """Distributions of attendance and punctuality, and of customer ratings"""
+    rates_axes, rating_axes = figure.subplots(1, 2)
+    bins = list(range(50, 101, 5))
+    rates_axes.hist([min(max(record['attendance_rate'], 50), 100) for record in records], bins=bins,
+                    color=color, alpha=0.8, label="Attendance")
+    rates_axes.hist([min(max(record['punctuality_score'], 50), 100) for record in records], bins=bins,
+                    color=secondary_color, alpha=0.6, label="Punctuality")
+    rates_axes.legend(fontsize=8, facecolor=BACKGROUND, labelcolor=FOREGROUND, edgecolor=GRID)
+    rates_axes.set_xlabel("%", color=FOREGROUND)
+    _style_axes(rates_axes, "Attendance and punctuality")
+
+    rating_axes.hist([record['customer_rating'] for record in records], bins=[x / 2 for x in range(0, 11)],
+                     color=color)
+    rating_axes.set_xlabel("Rating", color=FOREGROUND)
+    _style_axes(rating_axes, "Customer ratings")
+
+class ChartRenderer:
+    """Renders charts to cached PNGs on a background thread
+
+    One worker thread draws every chart: matplotlib figures are independent,
+    but its font and text caches are not meant for concurrent drawing.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, dpi: int = 100):
+        self.db_manager = db_manager
+        self.dpi = dpi
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="charts")
+
+    def render(self, chart: str, params: Hashable, scopes: Sequence[str], draw: DrawFunction,
+               size: Tuple[int, int]) -> bytes:
+        """PNG of a chart, drawn only when its data or size changed since the last render"""
+        size = tuple(max(SIZE_STEP, round(value / SIZE_STEP) * SIZE_STEP) for value in size)
+        return self.db_manager.report_cache.get_or_compute(
+            f"chart:{chart}", (params, size, self.dpi), scopes, lambda: self._draw_png(draw, size))
+
+    def render_async(self, chart: str, params: Hashable, scopes: Sequence[str], draw: DrawFunction,
+                     size: Tuple[int, int], callback: Callable[[bytes], None]) -> Future:
+        """render on the chart thread, then call callback with the PNG (on that thread)"""
+        def run():
+            try:
+                callback(self.render(chart, params, scopes, draw, size))
+            except Exception as e:
+                logger.error(f"Chart {chart} failed: {e}")
+        return self._executor.submit(run)
+
+    def _draw_png(self, draw: DrawFunction, size: Tuple[int, int]) -> bytes:
+        figure = Figure(figsize=(size[0] / self.dpi, size[1] / self.dpi), dpi=self.dpi,
+                        facecolor=BACKGROUND, layout="tight")
+        FigureCanvasAgg(figure)
+        draw(figure)
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format="png", facecolor=BACKGROUND)
+        return buffer.getvalue()
+
+    def close(self):
+        """Drop pending renders and stop the chart thread"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+class ChartView(ctk.CTkLabel):
+    """Label that shows a rendered chart and swaps in new PNGs as they arrive"""
+
+    def __init__(self, parent, size: Tuple[int, int], **kwargs):
+        super().__init__(parent, text="Rendering chart...", **kwargs)
+        self.default_size = size
+        self._png: Optional[bytes] = None
+
+    def render_size(self) -> Tuple[int, int]:
+        """Pixel size to render at: the parent's width once laid out, else the default"""
+        width = self.master.winfo_width()
+        return (width - 20 if width > 200 else self.default_size[0]), self.default_size[1]
+
+    def show_png(self, png: bytes):
+        """Display PNG bytes; call on the Tk thread"""
+        if png is self._png or not self.winfo_exists():
+            return
+        self._png = png
+        image = Image.open(io.BytesIO(png))
+        self.configure(image=ctk.CTkImage(light_image=image, dark_image=image, size=image.size), text="")
@@ -561,116 +561,79 @@ class EmployeeManagerFrame(ctk.CTkFrame):
                 messagebox.showerror("Error", f"Failed to remove employee:\n{str(e)}")
     
     def export_to_excel(self):
-        """Export employee data to Excel file"""
+        """Export employee data to Excel file on a background worker"""
         try:
-            import pandas as pd
-            from tkinter import filedialog
-            from datetime import datetime
-            
-            if not self.employees:
-                messagebox.showwarning("No Data", "No employees to export. Please load employee data first.")
-                return
-            
-            # Ask user for save location
-            filename = filedialog.asksaveasfilename(
-                title="Export Employees",
-                defaultextension=".xlsx",
-                filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
-                initialname=f"Restaurant_Employees_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-            )
-            
-            if not filename:
-                return
-            
-            # Prepare data for export
-            export_data = []
-            for employee in self.employees:
-                row = {
-                    'Employee Number': employee.employee_number,
-                    'First Name': employee.first_name,
-                    'Last Name': employee.last_name,
-                    'Email': employee.email,
-                    'Phone': employee.phone,
-                    'Address': employee.address,
-                    'Hire Date': employee.hire_date.strftime('%Y-%m-%d'),
-                    'Status': employee.status.value,
-                    'Hourly Wage': f"${employee.hourly_wage:.2f}",
-                    'Primary Position': employee.primary_position.value,
-                    'Secondary Positions': ', '.join([pos.value for pos in employee.secondary_positions]),
-                    'Min Hours/Week': employee.min_hours_per_week,
-                    'Max Hours/Week': employee.max_hours_per_week,
-                    'Attendance Rate': f"{employee.attendance_rate:.1f}%",
-                    'Punctuality Score': f"{employee.punctuality_score:.1f}%",
-                    'Customer Rating': f"{employee.customer_rating:.1f}/5.0",
-                    'Training Completed': ', '.join(employee.training_completed),
-                    'Special Requirements': employee.special_requirements,
-                    'Notes': employee.notes,
-                    'Weekly Labor Cost': f"${employee.weekly_labor_cost:.2f}"
-                }
-                export_data.append(row)
-            
-            # Create DataFrame and export
-            df = pd.DataFrame(export_data)
-            
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                # Main employee data
-                df.to_excel(writer, sheet_name='Employee Data', index=False)
-                
-                # Summary statistics
-                summary_data = {
-                    'Metric': [
-                        'Total Employees',
-                        'Active Employees', 
-                        'Inactive/On Leave',
-                        'Average Wage',
-                        'Total Weekly Labor Cost',
-                        'Average Attendance Rate',
-                        'Average Customer Rating'
-                    ],
-                    'Value': [
-                        len(self.employees),
-                        len([emp for emp in self.employees if emp.status == EmploymentStatus.ACTIVE]),
-                        len([emp for emp in self.employees if emp.status != EmploymentStatus.ACTIVE]),
-                        f"${sum(emp.hourly_wage for emp in self.employees) / len(self.employees):.2f}",
-                        f"${sum(emp.weekly_labor_cost for emp in self.employees):.2f}",
-                        f"{sum(emp.attendance_rate for emp in self.employees) / len(self.employees):.1f}%",
-                        f"{sum(emp.customer_rating for emp in self.employees) / len(self.employees):.1f}/5.0"
-                    ]
-                }
-                summary_df = pd.DataFrame(summary_data)
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
-                
-                # Position breakdown
-                position_counts = {}
-                for emp in self.employees:
-                    pos = emp.primary_position.value
-                    position_counts[pos] = position_counts.get(pos, 0) + 1
-                
-                position_data = {
-                    'Position': list(position_counts.keys()),
-                    'Count': list(position_counts.values())
-                }
-                position_df = pd.DataFrame(position_data)
-                position_df.to_excel(writer, sheet_name='Position Breakdown', index=False)
-            
-            self.main_app.update_status(f"Employee data exported to {filename}")
-            messagebox.showinfo(
-                "Export Successful", 
-                f"Employee data has been exported to:\n{filename}\n\n"
-                f"The file contains {len(self.employees)} employees across 3 sheets:\n"
-                "• Employee Data (detailed information)\n"
-                "• Summary (key statistics)\n"
-                "• Position Breakdown (staffing by role)"
-            )
-            
+            import openpyxl  # noqa: F401
         except ImportError:
             messagebox.showerror(
-                "Missing Dependency", 
-                "Excel export requires pandas and openpyxl.\n\n"
-                "Please install them with:\npip install pandas openpyxl"
+                "Missing Dependency",
+                "Excel export requires openpyxl.\n\n"
+                "Please install it with:\npip install openpyxl"
             )
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export data:\n{str(e)}")
+            return
+        
+        from tkinter import filedialog
+        from datetime import datetime
+        from database.excel_export import (StreamingExcelExporter, ExportSheet,
+                                           employee_data_sheet, position_breakdown_sheet)
+        
+        everyone = self.db_manager.get_employee_summary(None)
+        if not everyone['employee_count']:
+            messagebox.showwarning("No Data", "No employees to export. Please load employee data first.")
+            return
+        
+        # Ask user for save location
+        filename = filedialog.asksaveasfilename(
+            title="Export Employees",
+            defaultextension=".xlsx",
+            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
+            initialname=f"Restaurant_Employees_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        )
+        
+        if not filename:
+            return
+        
+        # Summary statistics come from aggregate queries; detail rows stream from the cursor
+        active_count = int(self.db_manager.get_employee_summary(EmploymentStatus.ACTIVE)['employee_count'])
+        employee_count = int(everyone['employee_count'])
+        summary_sheet = ExportSheet(
+            title="Summary",
+            headers=['Metric', 'Value'],
+            rows=[
+                ['Total Employees', employee_count],
+                ['Active Employees', active_count],
+                ['Inactive/On Leave', employee_count - active_count],
+                ['Average Wage', f"${everyone['average_wage']:.2f}"],
+                ['Total Weekly Labor Cost', f"${everyone['weekly_labor_cost']:.2f}"],
+                ['Average Attendance Rate', f"{everyone['average_attendance']:.1f}%"],
+                ['Average Customer Rating', f"{everyone['average_rating']:.1f}/5.0"]
+            ]
+        )
+        
+        def on_progress(sheet_title, written, total):
+            self.after(0, lambda: self.main_app.update_status(
+                f"Exporting employees: {written:,}/{total:,} rows ({sheet_title})"))
+        
+        def on_done(written):
+            def finish():
+                self.main_app.update_status(f"Employee data exported to {filename}")
+                messagebox.showinfo(
+                    "Export Successful",
+                    f"Employee data has been exported to:\n{filename}\n\n"
+                    f"The file contains {employee_count} employees across 3 sheets:\n"
+                    "• Employee Data (detailed information)\n"
+                    "• Summary (key statistics)\n"
+                    "• Position Breakdown (staffing by role)"
+                )
+            self.after(0, finish)
+        
+        def on_error(error):
+            self.after(0, lambda: messagebox.showerror("Export Error", f"Failed to export data:\n{str(error)}"))
+        
+        StreamingExcelExporter(self.db_manager).export_in_background(
+            filename, [employee_data_sheet(employee_count), summary_sheet, position_breakdown_sheet()],
+            on_progress, on_done, on_error)
+        self.main_app.update_status("Exporting employees...")
 
 class EmployeeDialog:
     def __init__(self, parent, db_manager: DatabaseManager, main_app, title: str, employee: Optional[Employee] = None):
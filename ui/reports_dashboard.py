@@ -3,10 +3,15 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, date, timedelta
 import threading
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
 
+from database.analytics import (AnalyticsFrames, employee_summary, labor_by_position, performance_records,
+                                position_breakdown, with_status)
+from database.dashboard_metrics import DashboardMetrics, MetricsSnapshot
 from database.db_manager import DatabaseManager
-from models.employee import Employee, EmploymentStatus, Position
+from models.employee import EmploymentStatus
+from ui.charts import (ChartRenderer, ChartView, DrawFunction, draw_position_distribution,
+                       draw_labor_costs, draw_performance)
 
 class ReportsDashboardFrame(ctk.CTkFrame):
     def __init__(self, parent, db_manager: DatabaseManager, main_app):
@@ -15,15 +20,38 @@ class ReportsDashboardFrame(ctk.CTkFrame):
         self.db_manager = db_manager
         self.main_app = main_app
         self.colors = main_app.colors
-        self.employees: List[Employee] = []
+        # Reports are vectorized over the shared analytics frames; no Employee objects are built
+        self.frames = AnalyticsFrames(db_manager)
+        self.summary: Optional[Dict[str, float]] = None
+        self.position_summary: List[Dict[str, Any]] = []
+        self.performance_records: List[Dict[str, Any]] = []
+        self.charts = ChartRenderer(db_manager)
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
         
         self.create_ui()
+        
+        # Overview cards follow running aggregates instead of recomputing
+        self.metrics = DashboardMetrics(db_manager)
+        self.metrics.subscribe(lambda snapshot: self.after(0, lambda: self.update_metric_cards(snapshot)))
+        self.update_metric_cards(self.metrics.snapshot())
+        self.bind("<Destroy>", self.on_destroy, add="+")
+        
         self.load_employee_data()
     
+    def on_destroy(self, event):
+        """Stop following database changes when the dashboard is closed"""
+        if event.widget is self:
+            self.metrics.close()
+            self.charts.close()
+    
+    def show_chart(self, view: ChartView, chart: str, params: Any, scopes: Sequence[str], draw: DrawFunction):
+        """Show a chart in view, drawing it off the Tk thread unless its PNG is cached"""
+        self.charts.render_async(chart, params, scopes, draw, view.render_size(),
+                                 lambda png: self.after(0, lambda: view.show_png(png)))
+    
     def create_ui(self):
         """Create reports dashboard interface"""
         # Create main container with tabs
@@ -57,10 +85,11 @@ class ReportsDashboardFrame(ctk.CTkFrame):
         metrics_frame.grid_columnconfigure(3, weight=1)
         
         # Key metric cards
-        self.create_metric_card(metrics_frame, "Total Employees", "0", "👥", 0)
-        self.create_metric_card(metrics_frame, "Active Staff", "0", "✅", 1)
-        self.create_metric_card(metrics_frame, "Weekly Hours", "0", "⏰", 2)
-        self.create_metric_card(metrics_frame, "Labor Cost", "$0", "💰", 3)
+        self.metric_labels = {}
+        _, self.metric_labels['employees'] = self.create_metric_card(metrics_frame, "Total Employees", "0", "👥", 0)
+        _, self.metric_labels['active'] = self.create_metric_card(metrics_frame, "Active Staff", "0", "✅", 1)
+        _, self.metric_labels['hours'] = self.create_metric_card(metrics_frame, "Weekly Hours", "0", "⏰", 2)
+        _, self.metric_labels['cost'] = self.create_metric_card(metrics_frame, "Labor Cost", "$0", "💰", 3)
         
         # Charts area
         charts_frame = ctk.CTkFrame(self.overview_tab)
@@ -314,44 +343,58 @@ class ReportsDashboardFrame(ctk.CTkFrame):
         self.update_attendance_report()
     
     def load_employee_data(self):
-        """Load employee data for reports"""
+        """Load report aggregates for active employees
+        
+        Every report is computed from the shared employee frame, which is only
+        re-read after employee data has changed.
+        """
         def load_data():
             try:
-                employees = self.db_manager.get_all_employees(EmploymentStatus.ACTIVE)
-                self.after(0, lambda: self.update_reports_with_data(employees))
+                employees = with_status(self.frames.employees(), EmploymentStatus.ACTIVE)
+                summary = employee_summary(employees)
+                positions = position_breakdown(employees)
+                performance = performance_records(employees)
+                self.after(0, lambda: self.update_reports_with_data(summary, positions, performance))
             except Exception as e:
                 self.after(0, lambda: self.main_app.update_status(f"Error loading employee data: {str(e)}"))
         
         threading.Thread(target=load_data, daemon=True).start()
     
-    def update_reports_with_data(self, employees: List[Employee]):
-        """Update all reports with employee data"""
-        self.employees = employees
+    def update_reports_with_data(self, summary: Dict[str, float], positions: List[Dict[str, Any]],
+                                 performance: List[Dict[str, Any]]):
+        """Update all reports with aggregated employee data"""
+        self.summary = summary if summary['employee_count'] else None
+        self.position_summary = positions
+        self.performance_records = performance
         
         # Update overview metrics
         self.update_overview_metrics()
         self.update_position_distribution()
+        self.update_labor_analysis()
         self.update_performance_metrics()
         self.update_attendance_report()
         
-        self.main_app.update_status(f"Reports updated with {len(employees)} employees")
+        self.main_app.update_status(f"Reports updated with {summary['employee_count']} employees")
+    
+    def update_metric_cards(self, snapshot: MetricsSnapshot):
+        """Show running aggregates on the overview cards"""
+        if not self.winfo_exists():
+            return
+        self.metric_labels['employees'].configure(text=f"{snapshot.employee_count}")
+        self.metric_labels['active'].configure(text=f"{snapshot.active_count}")
+        self.metric_labels['hours'].configure(text=f"{snapshot.scheduled_hours:.0f}")
+        self.metric_labels['cost'].configure(text=f"${snapshot.scheduled_cost:,.0f}")
     
     def update_overview_metrics(self):
         """Update overview key metrics"""
-        if not self.employees:
-            return
-        
-        total_employees = len(self.employees)
-        active_employees = len([emp for emp in self.employees if emp.status == EmploymentStatus.ACTIVE])
-        total_hours = sum(emp.max_hours_per_week for emp in self.employees)
-        total_cost = sum(emp.weekly_labor_cost for emp in self.employees)
-        
-        # Find and update metric cards (this is a simplified approach)
-        # In a real implementation, we'd store references to the value labels
-        # For now, we'll recreate the metrics frame
+        snapshot = self.metrics.snapshot()
+        self.update_metric_cards(snapshot)
         
         # Update status
-        self.main_app.update_status(f"Overview: {total_employees} employees, ${total_cost:.0f} weekly cost")
+        self.main_app.update_status(
+            f"Overview: {snapshot.active_count} active employees, "
+            f"${snapshot.estimated_cost_sum:.0f} estimated weekly cost"
+        )
     
     def update_position_distribution(self):
         """Update position distribution chart"""
@@ -359,7 +402,7 @@ class ReportsDashboardFrame(ctk.CTkFrame):
         for widget in self.position_chart_frame.winfo_children():
             widget.destroy()
         
-        if not self.employees:
+        if not self.position_summary:
             no_data_label = ctk.CTkLabel(
                 self.position_chart_frame,
                 text="No employee data available",
@@ -369,52 +412,12 @@ class ReportsDashboardFrame(ctk.CTkFrame):
             no_data_label.pack(pady=50)
             return
         
-        # Count employees by position
-        position_counts = {}
-        for emp in self.employees:
-            pos = emp.primary_position.value
-            position_counts[pos] = position_counts.get(pos, 0) + 1
-        
-        # Create visual bars
-        max_count = max(position_counts.values()) if position_counts else 1
-        
-        for position, count in position_counts.items():
-            # Position row
-            pos_frame = ctk.CTkFrame(self.position_chart_frame, corner_radius=8)
-            pos_frame.pack(fill="x", pady=5, padx=10)
-            
-            # Position info
-            info_frame = ctk.CTkFrame(pos_frame, fg_color="transparent")
-            info_frame.pack(fill="x", padx=15, pady=10)
-            info_frame.grid_columnconfigure(1, weight=1)
-            
-            # Position name
-            pos_label = ctk.CTkLabel(
-                info_frame,
-                text=position,
-                font=ctk.CTkFont(size=12, weight="bold"),
-                text_color=self.colors['text_primary']
-            )
-            pos_label.grid(row=0, column=0, sticky="w")
-            
-            # Count
-            count_label = ctk.CTkLabel(
-                info_frame,
-                text=f"{count} employees",
-                font=ctk.CTkFont(size=12),
-                text_color=self.colors['text_secondary']
-            )
-            count_label.grid(row=0, column=2, sticky="e")
-            
-            # Visual bar
-            bar_width = int((count / max_count) * 200)
-            bar_frame = ctk.CTkFrame(
-                info_frame,
-                width=bar_width,
-                height=8,
-                fg_color=self.colors['primary']
-            )
-            bar_frame.grid(row=1, column=0, columnspan=3, sticky="w", pady=(5, 0))
+        # Bar chart, redrawn only when employee data changes
+        positions = self.position_summary
+        chart = ChartView(self.position_chart_frame, (480, 300))
+        chart.pack(fill="both", expand=True)
+        self.show_chart(chart, "position_distribution", EmploymentStatus.ACTIVE.value, ("employees",),
+                        lambda figure: draw_position_distribution(figure, positions, self.colors['primary']))
     
     def update_labor_analysis(self, *args):
         """Update labor cost analysis"""
@@ -422,7 +425,7 @@ class ReportsDashboardFrame(ctk.CTkFrame):
         for widget in self.labor_results_frame.winfo_children():
             widget.destroy()
         
-        if not self.employees:
+        if not self.summary:
             no_data_label = ctk.CTkLabel(
                 self.labor_results_frame,
                 text="No employee data available for analysis",
@@ -447,15 +450,15 @@ class ReportsDashboardFrame(ctk.CTkFrame):
         title_label.pack(pady=(15, 10))
         
         # Calculate totals
-        total_cost = sum(emp.weekly_labor_cost for emp in self.employees)
-        avg_wage = sum(emp.hourly_wage for emp in self.employees) / len(self.employees)
-        total_hours = sum(emp.max_hours_per_week for emp in self.employees)
+        total_cost = self.summary['weekly_labor_cost']
+        avg_wage = self.summary['average_wage']
+        total_hours = self.summary['total_max_hours']
         
         # Cost breakdown
         breakdown_text = f"""
 Total Weekly Labor Cost: ${total_cost:.2f}
 Average Hourly Wage: ${avg_wage:.2f}
-Total Scheduled Hours: {total_hours} hrs
+Total Scheduled Hours: {total_hours:.0f} hrs
 Cost per Hour: ${total_cost / total_hours:.2f}
 
 Estimated Monthly Cost: ${total_cost * 4.33:.2f}
@@ -471,6 +474,19 @@ Estimated Annual Cost: ${total_cost * 52:.2f}
         )
         breakdown_label.pack(pady=(0, 15), padx=20)
         
+        # Scheduled cost per day from the labor rollups, beside estimated cost per position
+        start_date, end_date = self.get_period_range(period)
+        positions = self.position_summary
+        
+        def draw_labor(figure):
+            daily_rows = [dict(row) for row in self.db_manager.get_labor_rollup(start_date, end_date, "day")]
+            draw_labor_costs(figure, daily_rows, positions, period, self.colors['primary'], self.colors['secondary'])
+        
+        labor_chart = ChartView(self.labor_results_frame, (900, 320))
+        labor_chart.pack(fill="x", pady=10, padx=10)
+        self.show_chart(labor_chart, "labor_costs", (period, start_date, end_date), ("employees", "shifts"),
+                        draw_labor)
+        
         # Cost by position
         position_costs_frame = ctk.CTkFrame(self.labor_results_frame)
         position_costs_frame.pack(fill="x", pady=10, padx=10)
@@ -483,16 +499,13 @@ Estimated Annual Cost: ${total_cost * 52:.2f}
         )
         pos_title_label.pack(pady=(15, 10))
         
-        # Calculate cost by position
-        position_costs = {}
-        for emp in self.employees:
-            pos = emp.primary_position.value
-            if pos not in position_costs:
-                position_costs[pos] = {'count': 0, 'cost': 0}
-            position_costs[pos]['count'] += 1
-            position_costs[pos]['cost'] += emp.weekly_labor_cost
+        position_costs = {
+            row['primary_position']: {'count': row['employee_count'], 'cost': row['weekly_labor_cost']}
+            for row in self.position_summary
+        }
         
-        # Create cost table
+        # Create cost table; scheduled hours for the period fill in once loaded
+        scheduled_labels = {}
         for position, data in position_costs.items():
             pos_row_frame = ctk.CTkFrame(position_costs_frame, fg_color="transparent")
             pos_row_frame.pack(fill="x", padx=20, pady=2)
@@ -512,15 +525,39 @@ Estimated Annual Cost: ${total_cost * 52:.2f}
                 text_color=self.colors['text_secondary']
             ).grid(row=0, column=1, sticky="e")
             
+            scheduled_labels[position] = ctk.CTkLabel(
+                pos_row_frame,
+                text="...",
+                font=ctk.CTkFont(size=11),
+                text_color=self.colors['text_secondary']
+            )
+            scheduled_labels[position].grid(row=0, column=2, sticky="e", padx=(10, 0))
+            
             ctk.CTkLabel(
                 pos_row_frame,
                 text=f"${data['cost']:.2f}/week",
                 font=ctk.CTkFont(size=11, weight="bold"),
                 text_color=self.colors['success']
-            ).grid(row=0, column=2, sticky="e", padx=(10, 0))
+            ).grid(row=0, column=3, sticky="e", padx=(10, 0))
         
         # Add some padding
         ctk.CTkLabel(position_costs_frame, text="").pack(pady=10)
+        
+        def load_scheduled():
+            try:
+                scheduled = labor_by_position(self.frames.assignments(start_date, end_date))
+            except Exception as e:
+                self.after(0, lambda: self.main_app.update_status(f"Error loading scheduled labor: {str(e)}"))
+                return
+            
+            def show_scheduled():
+                for position, label in scheduled_labels.items():
+                    if label.winfo_exists():
+                        hours = scheduled.get(position, {}).get('hours', 0.0)
+                        label.configure(text=f"{hours:.0f} hrs scheduled")
+            self.after(0, show_scheduled)
+        
+        threading.Thread(target=load_scheduled, daemon=True).start()
     
     def update_performance_metrics(self):
         """Update performance metrics table"""
@@ -528,7 +565,7 @@ Estimated Annual Cost: ${total_cost * 52:.2f}
         for widget in self.performance_frame.winfo_children():
             widget.destroy()
         
-        if not self.employees:
+        if not self.performance_records:
             no_data_label = ctk.CTkLabel(
                 self.performance_frame,
                 text="No employee data available",
@@ -538,6 +575,14 @@ Estimated Annual Cost: ${total_cost * 52:.2f}
             no_data_label.pack(pady=50)
             return
         
+        # Score distributions
+        records = self.performance_records
+        performance_chart = ChartView(self.performance_frame, (900, 280))
+        performance_chart.pack(fill="x", pady=(0, 10), padx=10)
+        self.show_chart(performance_chart, "performance", EmploymentStatus.ACTIVE.value, ("employees",),
+                        lambda figure: draw_performance(figure, records, self.colors['primary'],
+                                                        self.colors['secondary']))
+        
         # Create performance table
         # Header
         header_frame = ctk.CTkFrame(self.performance_frame, fg_color=self.colors['primary'])
@@ -558,7 +603,7 @@ Estimated Annual Cost: ${total_cost * 52:.2f}
             ).grid(row=0, column=i, padx=10, pady=10)
         
         # Employee rows
-        for emp in self.employees:
+        for emp in self.performance_records:
             row_frame = ctk.CTkFrame(self.performance_frame, corner_radius=5)
             row_frame.pack(fill="x", pady=2, padx=10)
             row_frame.grid_columnconfigure(0, weight=2)
@@ -570,7 +615,7 @@ Estimated Annual Cost: ${total_cost * 52:.2f}
             # Employee name
             ctk.CTkLabel(
                 row_frame,
-                text=emp.full_name,
+                text=emp['full_name'],
                 font=ctk.CTkFont(size=11),
                 text_color=self.colors['text_primary']
             ).grid(row=0, column=0, sticky="w", padx=10, pady=8)
@@ -578,34 +623,34 @@ Estimated Annual Cost: ${total_cost * 52:.2f}
             # Position
             ctk.CTkLabel(
                 row_frame,
-                text=emp.primary_position.value,
+                text=emp['primary_position'],
                 font=ctk.CTkFont(size=11),
                 text_color=self.colors['text_secondary']
             ).grid(row=0, column=1, padx=10, pady=8)
             
             # Attendance
-            attendance_color = self.colors['success'] if emp.attendance_rate >= 95 else self.colors['warning'] if emp.attendance_rate >= 85 else self.colors['danger']
+            attendance_color = self.colors['success'] if emp['attendance_rate'] >= 95 else self.colors['warning'] if emp['attendance_rate'] >= 85 else self.colors['danger']
             ctk.CTkLabel(
                 row_frame,
-                text=f"{emp.attendance_rate:.1f}%",
+                text=f"{emp['attendance_rate']:.1f}%",
                 font=ctk.CTkFont(size=11, weight="bold"),
                 text_color=attendance_color
             ).grid(row=0, column=2, padx=10, pady=8)
             
             # Punctuality
-            punctuality_color = self.colors['success'] if emp.punctuality_score >= 95 else self.colors['warning'] if emp.punctuality_score >= 85 else self.colors['danger']
+            punctuality_color = self.colors['success'] if emp['punctuality_score'] >= 95 else self.colors['warning'] if emp['punctuality_score'] >= 85 else self.colors['danger']
             ctk.CTkLabel(
                 row_frame,
-                text=f"{emp.punctuality_score:.1f}%",
+                text=f"{emp['punctuality_score']:.1f}%",
                 font=ctk.CTkFont(size=11, weight="bold"),
                 text_color=punctuality_color
             ).grid(row=0, column=3, padx=10, pady=8)
             
             # Rating
-            rating_color = self.colors['success'] if emp.customer_rating >= 4.5 else self.colors['warning'] if emp.customer_rating >= 3.5 else self.colors['danger']
+            rating_color = self.colors['success'] if emp['customer_rating'] >= 4.5 else self.colors['warning'] if emp['customer_rating'] >= 3.5 else self.colors['danger']
             ctk.CTkLabel(
                 row_frame,
-                text=f"{emp.customer_rating:.1f}/5.0",
+                text=f"{emp['customer_rating']:.1f}/5.0",
                 font=ctk.CTkFont(size=11, weight="bold"),
                 text_color=rating_color
             ).grid(row=0, column=4, padx=10, pady=8)
@@ -616,7 +661,7 @@ Estimated Annual Cost: ${total_cost * 52:.2f}
         for widget in self.attendance_frame.winfo_children():
             widget.destroy()
         
-        if not self.employees:
+        if not self.summary:
             no_data_label = ctk.CTkLabel(
                 self.attendance_frame,
                 text="No employee data available",
@@ -639,10 +684,10 @@ Estimated Annual Cost: ${total_cost * 52:.2f}
         title_label.pack(pady=(15, 10))
         
         # Calculate attendance stats
-        avg_attendance = sum(emp.attendance_rate for emp in self.employees) / len(self.employees)
-        avg_punctuality = sum(emp.punctuality_score for emp in self.employees) / len(self.employees)
-        excellent_attendance = len([emp for emp in self.employees if emp.attendance_rate >= 95])
-        poor_attendance = len([emp for emp in self.employees if emp.attendance_rate < 85])
+        avg_attendance = self.summary['average_attendance']
+        avg_punctuality = self.summary['average_punctuality']
+        excellent_attendance = int(self.summary['excellent_attendance_count'])
+        poor_attendance = int(self.summary['poor_attendance_count'])
         
         summary_text = f"""
 Average Attendance Rate: {avg_attendance:.1f}%
@@ -651,7 +696,7 @@ Average Punctuality Score: {avg_punctuality:.1f}%
 Excellent Attendance (≥95%): {excellent_attendance} employees
 Needs Improvement (<85%): {poor_attendance} employees
 
-Total Employees Tracked: {len(self.employees)}
+Total Employees Tracked: {int(self.summary['employee_count'])}
         """.strip()
         
         summary_label = ctk.CTkLabel(
@@ -677,48 +722,65 @@ Total Employees Tracked: {len(self.employees)}
             alert_label.pack(pady=15)
     
     def export_labor_report(self):
-        """Export labor cost report"""
+        """Export labor cost report, with the selected period's assignments, on a background worker"""
         try:
-            import pandas as pd
-            from tkinter import filedialog
-            
-            if not self.employees:
-                messagebox.showwarning("No Data", "No employee data available for export.")
-                return
-            
-            filename = filedialog.asksaveasfilename(
-                title="Export Labor Report",
-                defaultextension=".xlsx",
-                filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
-                initialname=f"Restaurant_Labor_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-            )
-            
-            if not filename:
-                return
-            
-            # Prepare labor data
-            labor_data = []
-            for emp in self.employees:
-                labor_data.append({
-                    'Employee Name': emp.full_name,
-                    'Position': emp.primary_position.value,
-                    'Hourly Wage': emp.hourly_wage,
-                    'Weekly Hours': emp.max_hours_per_week,
-                    'Weekly Labor Cost': emp.weekly_labor_cost,
-                    'Status': emp.status.value
-                })
-            
-            # Create DataFrame and export
-            df = pd.DataFrame(labor_data)
-            df.to_excel(filename, index=False, sheet_name='Labor Costs')
-            
-            messagebox.showinfo("Export Successful", f"Labor report exported to:\n{filename}")
-            self.main_app.update_status(f"Labor report exported to {filename}")
-            
+            import openpyxl  # noqa: F401
         except ImportError:
             messagebox.showerror(
                 "Missing Dependency",
-                "Excel export requires pandas and openpyxl.\n\nPlease install them with:\npip install pandas openpyxl"
+                "Excel export requires openpyxl.\n\nPlease install it with:\npip install openpyxl"
             )
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export report:\n{str(e)}") 
\ No newline at end of file
+            return
+        
+        from tkinter import filedialog
+        from database.excel_export import StreamingExcelExporter, labor_cost_sheet, assignments_sheet
+        
+        if not self.summary:
+            messagebox.showwarning("No Data", "No employee data available for export.")
+            return
+        
+        filename = filedialog.asksaveasfilename(
+            title="Export Labor Report",
+            defaultextension=".xlsx",
+            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
+            initialname=f"Restaurant_Labor_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        )
+        
+        if not filename:
+            return
+        
+        start_date, end_date = self.get_period_range(self.period_menu.get())
+        sheets = [labor_cost_sheet(EmploymentStatus.ACTIVE.value, int(self.summary['employee_count'])),
+                  assignments_sheet(start_date, end_date)]
+        
+        def on_progress(sheet_title, written, total):
+            self.after(0, lambda: self.main_app.update_status(
+                f"Exporting labor report: {written:,}/{total:,} rows ({sheet_title})"))
+        
+        def on_done(written):
+            def finish():
+                messagebox.showinfo("Export Successful", f"Labor report exported to:\n{filename}")
+                self.main_app.update_status(f"Labor report exported to {filename}")
+            self.after(0, finish)
+        
+        def on_error(error):
+            self.after(0, lambda: messagebox.showerror("Export Error", f"Failed to export report:\n{str(error)}"))
+        
+        StreamingExcelExporter(self.db_manager).export_in_background(filename, sheets, on_progress, on_done, on_error)
+        self.main_app.update_status("Exporting labor report...")
+    
+    def get_period_range(self, period: str):
+        """First and last date of a labor period menu choice"""
+        today = date.today()
+        week_start = today - timedelta(days=today.weekday())
+        month_start = today.replace(day=1)
+        last_month_end = month_start - timedelta(days=1)
+        if period == "Last Week":
+            return week_start - timedelta(weeks=1), week_start - timedelta(days=1)
+        if period == "This Month":
+            return month_start, today
+        if period == "Last Month":
+            return last_month_end.replace(day=1), last_month_end
+        if period == "Last 3 Months":
+            return today - timedelta(days=91), today
+        return week_start, week_start + timedelta(days=6)
@@ -290,6 +290,14 @@ class SettingsManagerFrame(ctk.CTkFrame):
         self.overtime_multiplier_entry.grid(row=row, column=1, sticky="w", pady=10)
         row += 1
         
+        # Weekly overtime threshold
+        ctk.CTkLabel(scroll_frame, text="Weekly Overtime After (hours):", font=ctk.CTkFont(size=12, weight="bold")).grid(
+            row=row, column=0, sticky="w", padx=(0, 10), pady=10)
+        self.weekly_overtime_entry = ctk.CTkEntry(scroll_frame, width=100)
+        self.weekly_overtime_entry.insert(0, "40")
+        self.weekly_overtime_entry.grid(row=row, column=1, sticky="w", pady=10)
+        row += 1
+        
         # Save button
         save_operations_btn = ctk.CTkButton(
             scroll_frame,
@@ -569,6 +577,7 @@ class SettingsManagerFrame(ctk.CTkFrame):
             self.db_manager.set_restaurant_setting("dinner_rush", f"{self.dinner_start_menu.get()}-{self.dinner_end_menu.get()}")
             self.db_manager.set_restaurant_setting("labor_budget", self.labor_budget_entry.get())
             self.db_manager.set_restaurant_setting("overtime_multiplier", self.overtime_multiplier_entry.get())
+            self.db_manager.set_restaurant_setting("weekly_overtime_threshold", self.weekly_overtime_entry.get())
             
             messagebox.showinfo("Settings Saved", "Operations settings have been saved successfully.")
             self.main_app.update_status("Operations settings saved")
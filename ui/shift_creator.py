@@ -466,9 +466,7 @@ class ShiftCreatorFrame(ctk.CTkFrame):
         """Load shift templates from database"""
         def load_data():
             try:
-                # Since we don't have get_all_shift_templates yet, we'll start with empty list
-                # templates = self.db_manager.get_all_shift_templates()
-                templates = []
+                templates = self.db_manager.get_all_shift_templates()
                 
                 # Update UI in main thread
                 self.after(0, lambda: self.update_template_list(templates))